@@ -0,0 +1,185 @@
+# **************************************************
+# Copyright (c) 2017 Cisco Systems, Inc.
+# All rights reserved.
+# **************************************************
+
+"""
+Immutable per step test contexts.
+
+AclBaseAp._get_tcs_data, _get_bun_data, _get_loc_int and traffic_verifier
+write their results (test_case, aclname, addr_family, dir, link, intf,
+member, hw_loc, stream_stats, ...) onto the ApData class, so two
+verifications can never run at once. contextualize() wraps these helpers:
+each call runs the original helper against a StepData, which reads through
+to ApData but keeps every write to itself, and returns the writes as a read
+only TestContext.
+
+Existing calls are unchanged, the results are still published on ApData:
+
+    AclBaseAp._get_tcs_data(ApData)
+    AclBaseAp._get_loc_int(ApData, ApData.intf)
+
+Code running steps concurrently passes the context along and publishes
+nothing:
+
+    ctx = AclBaseAp._get_tcs_data(ApData, test_case=ApData.acl_model.apply_intf['tc63'], publish=False)
+    ctx = AclBaseAp._get_loc_int(ApData, ctx.intf, context=ctx, publish=False)
+    ctx = AclBaseAp.traffic_verifier(ApData, stream_name=streams, context=ctx, publish=False)
+    ctx.hw_loc, ctx.stream_stats['peer1_In_TCP_Phy']['Tx Frames']
+"""
+
+import copy
+import functools
+import inspect
+
+from acl_ap_model import FrozenDict, FrozenList, freeze
+
+CONTEXT_HELPERS = ('_get_tcs_data', '_get_bun_data', '_get_loc_int', 'traffic_verifier')
+
+
+def _thaw(node):
+    """
+    Plain, mutable copy of the containers of a frozen value; legacy code fills ApData.stream_stats in place.
+    """
+    if isinstance(node, FrozenDict):
+        return dict((key, _thaw(value)) for key, value in node.items())
+    if isinstance(node, FrozenList):
+        return [_thaw(value) for value in node]
+    return node
+
+
+def _copy_containers(node):
+    """
+    Copy of the dicts, lists and sets of a value, the objects they hold stay shared; frozen values are returned as is.
+    """
+    if isinstance(node, (FrozenDict, FrozenList)):
+        return node
+    if isinstance(node, dict):
+        copied = copy.copy(node)
+        for key, value in node.items():
+            copied[key] = _copy_containers(value)
+        return copied
+    if isinstance(node, list):
+        return [_copy_containers(value) for value in node]
+    if isinstance(node, set):
+        return set(node)
+    return node
+
+
+class TestContext:
+    """
+    Read only result of the helpers for one verification step.
+    """
+
+    __slots__ = ('_values',)
+
+    # not a test class, even though pytest collects Test* names
+    __test__ = False
+
+    def __init__(self, values=None):
+        object.__setattr__(self, '_values', FrozenDict((name, freeze(value))
+                                                       for name, value in (values or {}).items()))
+
+    def __getattr__(self, name):
+        try:
+            return self._values[name]
+        except KeyError:
+            raise AttributeError("Test context has no %s" % name)
+
+    def __setattr__(self, name, value):
+        raise TypeError("Test context is read only, use evolve()")
+
+    def __contains__(self, name):
+        return name in self._values
+
+    def evolve(self, **changes):
+        """
+        :return: new context with the given values replaced
+        """
+        values = dict(self._values)
+        values.update(changes)
+        return TestContext(values)
+
+    def items(self):
+        return self._values.items()
+
+    def publish(self, data):
+        """
+        Compatibility shim: copy the context onto ApData for code reading ApData.aclname & co.
+        """
+        for name, value in self._values.items():
+            setattr(data, name, _thaw(value))
+
+    def __repr__(self):
+        return "TestContext(%s)" % ', '.join('%s=%r' % (name, self._values[name])
+                                             for name in ('aclname', 'dir', 'intf', 'hw_loc') if name in self)
+
+
+class StepData:
+    """
+    Stand in for ApData during one helper call: reads fall back to ApData,
+    writes stay on the StepData. A dict, list or set read from ApData is
+    copied onto the StepData first, so filling it in place (stream_stats)
+    does not touch ApData either and ends up in written() once it differs.
+    """
+
+    def __init__(self, data, context=None):
+        self.__dict__['_data'] = data
+        self.__dict__['_copied'] = {}
+        if context is not None:
+            self.__dict__.update(context.items())
+
+    def __getattr__(self, name):
+        value = getattr(self.__dict__['_data'], name)
+        if isinstance(value, (dict, list, set)) and not isinstance(value, (FrozenDict, FrozenList)):
+            self.__dict__['_copied'][name] = value
+            value = self.__dict__[name] = _copy_containers(value)
+        return value
+
+    def __setattr__(self, name, value):
+        self.__dict__['_copied'].pop(name, None)
+        self.__dict__[name] = value
+
+    def written(self):
+        copied = self.__dict__['_copied']
+        return dict((name, value) for name, value in self.__dict__.items()
+                    if name not in ('_data', '_copied') and not (name in copied and copied[name] == value))
+
+
+def _contextual(func):
+
+    @functools.wraps(func)
+    def wrapper(data, *args, context=None, publish=True, test_case=None, **kwargs):
+        step = StepData(data, context)
+        if test_case is not None:
+            step.test_case = test_case
+        func(step, *args, **kwargs)
+        result = TestContext(step.written())
+        if publish:
+            result.publish(data)
+        return result
+    wrapper.__contextual__ = True
+    return wrapper
+
+
+def contextualize(base):
+    """
+    Make the helpers of the base class return TestContext objects.
+
+    :param base: AclBaseAp
+    :return: number of wrapped helpers
+    """
+    count = 0
+    for name in CONTEXT_HELPERS:
+        try:
+            raw = inspect.getattr_static(base, name)
+        except AttributeError:
+            continue
+        if isinstance(raw, classmethod):
+            continue
+        func = raw.__func__ if isinstance(raw, staticmethod) else raw
+        if not callable(func) or getattr(func, '__contextual__', False):
+            continue
+        setattr(base, name, staticmethod(_contextual(func)))
+        count += 1
+    return count
@@ -0,0 +1,186 @@
+# **************************************************
+# Copyright (c) 2017 Cisco Systems, Inc.
+# All rights reserved.
+# **************************************************
+
+"""
+Desired state engine for the R1 ACL config shared by neighbouring classes.
+
+Consecutive test classes often detach an ACL and remove an object group
+entry in teardown_class only for the next setup_class to put back the same
+or a similar config. ConfigDelta takes the place of the Acl calls in such
+classes and keeps the bindings, object group entries and ACE sets it pushed:
+
+- an unconfig is not pushed, it is only remembered as a pending release;
+- a config already present is skipped, cancelling its pending release;
+- any other config is pushed together with every pending release in one
+  commit.
+
+flush() pushes what is still pending, it runs before every class which does
+not use the engine and in teardown_module.
+"""
+
+import json
+
+from logger.cafylog import CafyLog
+
+log = CafyLog(name="AclDelta")
+
+
+def _entry(method, params):
+    return method, tuple(sorted((key, json.dumps(value, sort_keys=True)) for key, value in params.items()))
+
+
+class ConfigDelta:
+    """
+    Usage, inside a class with ``config_delta_aware = True``::
+
+        ApData.config_delta.set_port_object_group_acl(obj_group_name='obj_port', port_condition='lt',
+                                                      port_number=1025, mode="config")
+        ApData.config_delta.edit_add_aclace(edit_ace, aclname)
+        ApData.config_delta.set_acl_to_interface(access_list_name=..., address_family=..., direction=...,
+                                                 interface=..., mode="unconfig")
+    """
+
+    def __init__(self, get_acl, zap, topo, device):
+        """
+        :param get_acl: callable returning the current Acl object of the device,
+                        which is rebuilt after RPFO/reload
+        :param zap: Zap, for edit_add_aclace
+        :param topo: topology providing config(device, thread=True)
+        :param device: router the engine owns the config of
+        """
+        self.get_acl = get_acl
+        self.zap = zap
+        self.topo = topo
+        self.device = device
+        self.bindings = {}
+        self.entries = {}
+        self.aces = {}
+        self.pending = []
+        self.pushed = 0
+        self.skipped = 0
+
+    @property
+    def acl_obj(self):
+        return self.get_acl()
+
+    def _push(self, operations, what):
+        """
+        Push the pending releases and operations in a single commit.
+        """
+        releases = [release for _, release in self.pending]
+        self.pending = []
+        with self.topo.config(self.device, thread=True):
+            for operation in releases + list(operations):
+                operation()
+        self.pushed += 1
+        log.info("%s pushed with %d pending releases in one commit" % (what, len(releases)))
+
+    def _release(self, key, operation, forget):
+        for pending_key, _ in self.pending:
+            if pending_key == key:
+                return
+        self.pending.append((key, lambda: (operation(), forget())))
+
+    def _cancel(self, key):
+        for index, (pending_key, _) in enumerate(self.pending):
+            if pending_key == key:
+                del self.pending[index]
+                return True
+        return False
+
+    def set_acl_to_interface(self, access_list_name, address_family, direction, interface, mode="config", **kwargs):
+        """
+        Same arguments as Acl.set_acl_to_interface.
+        """
+        slot = ('binding', address_family, direction, str(interface))
+        binding = (access_list_name, kwargs.get('compress_level'))
+        call = lambda call_mode: self.acl_obj.set_acl_to_interface(access_list_name=access_list_name,
+                                                                   address_family=address_family,
+                                                                   direction=direction, interface=interface,
+                                                                   mode=call_mode, **kwargs)
+        if mode == "unconfig":
+            if self.bindings.get(slot) == binding:
+                self._release(slot, lambda: call("unconfig"), lambda: self.bindings.pop(slot, None))
+            else:
+                self._push([lambda: call("unconfig")], "unbind %s from %s" % (access_list_name, interface))
+                self.bindings.pop(slot, None)
+            return None
+        if self.bindings.get(slot) == binding:
+            self._cancel(slot)
+            self.skipped += 1
+            log.info("%s already on %s %s, nothing to push" % (access_list_name, interface, direction))
+            return None
+        self._push([lambda: call("config")], "bind %s to %s" % (access_list_name, interface))
+        self.bindings[slot] = binding
+        return None
+
+    def forget_binding(self, address_family, direction, interface):
+        """
+        Drop what the engine knows about a binding somebody else is about to change.
+        """
+        slot = ('binding', address_family, direction, str(interface))
+        self._cancel(slot)
+        self.bindings.pop(slot, None)
+
+    def _object_group(self, method, mode, params):
+        entry = _entry(method, params)
+        call = lambda call_mode: getattr(self.acl_obj, method)(mode=call_mode, **params)
+        if mode == "unconfig":
+            if entry in self.entries:
+                self._release(entry, lambda: call("unconfig"), lambda: self.entries.pop(entry, None))
+            else:
+                self._push([lambda: call("unconfig")], "remove %s" % params.get('obj_group_name'))
+            return None
+        if entry in self.entries:
+            self._cancel(entry)
+            self.skipped += 1
+            log.info("object group entry of %s already configured" % params.get('obj_group_name'))
+            return None
+        self._push([lambda: call("config")], "object group %s" % params.get('obj_group_name'))
+        self.entries[entry] = True
+        return None
+
+    def set_port_object_group_acl(self, mode="config", **params):
+        """
+        Same arguments as Acl.set_port_object_group_acl.
+        """
+        return self._object_group('set_port_object_group_acl', mode, params)
+
+    def set_network_object_group_acl(self, mode="config", **params):
+        """
+        Same arguments as Acl.set_network_object_group_acl.
+        """
+        return self._object_group('set_network_object_group_acl', mode, params)
+
+    def edit_add_aclace(self, aces, aclname):
+        """
+        Zap.edit_add_aclace, skipped when the ACL already has exactly these ACEs from the engine.
+        """
+        fingerprint = json.dumps(aces, sort_keys=True)
+        if self.aces.get(aclname) == fingerprint:
+            self.skipped += 1
+            log.info("%s already has the requested ACEs" % aclname)
+            return None
+        self._push([lambda: self.zap.edit_add_aclace(aces, self.acl_obj, aclname)], "ACEs of %s" % aclname)
+        self.aces[aclname] = fingerprint
+        return None
+
+    def flush(self, forget=False):
+        """
+        Push every pending release.
+
+        :param forget: also drop what is known about ACE sets, before code
+                       which may edit the ACLs without the engine runs
+        :return: number of releases pushed
+        """
+        count = len(self.pending)
+        if count:
+            self._push([], "flush")
+        if forget:
+            self.aces = {}
+        return count
+
+    def report(self):
+        log.info("Config delta: %d commits pushed, %d redundant configs skipped" % (self.pushed, self.skipped))
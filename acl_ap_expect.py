@@ -0,0 +1,164 @@
+# **************************************************
+# Copyright (c) 2017 Cisco Systems, Inc.
+# All rights reserved.
+# **************************************************
+
+"""
+Vectorized tolerance and expectation evaluation.
+
+AclBaseAp.tolerance_value builds the CyDiff.Range bounds of one ACE per
+call. evaluate() takes whole columns of expected and actual counters,
+computes every tolerance window in one pass and returns an ExpectationTable
+with one pass/fail row per ACE. NumPy is used when it is installed, plain
+array.array columns otherwise; both give the same results.
+"""
+
+from array import array
+from collections import namedtuple
+
+from logger.cafylog import CafyLog
+from utils.cafyexception import CafyException
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+log = CafyLog(name="AclExpect")
+
+ExpectationRow = namedtuple('ExpectationRow', ['name', 'expected', 'low', 'high', 'actual', 'passed'])
+
+
+def _column(values):
+    """
+    :param values: iterable of counters, '' and None count as 0
+    :return: int64 numpy array, or array('q') without numpy
+    """
+    values = [int(value) if value not in (None, '') else 0 for value in values]
+    if np is not None:
+        return np.asarray(values, dtype=np.int64)
+    return array('q', values)
+
+
+def tolerance_windows(expected, tolerance=5, floor=0):
+    """
+    Tolerance window of every expected counter.
+
+    :param expected: iterable of expected counters (Tx Frames)
+    :param tolerance: allowed difference in percent
+    :param floor: absolute slack added on both sides, for low rate streams
+    :return: (low, high) columns
+    """
+    expected = _column(expected)
+    if np is not None:
+        delta = (expected * tolerance) // 100 + floor
+        return np.maximum(expected - delta, 0), expected + delta
+    low = array('q')
+    high = array('q')
+    for count in expected:
+        delta = (count * tolerance) // 100 + floor
+        low.append(max(count - delta, 0))
+        high.append(count + delta)
+    return low, high
+
+
+class ExpectationTable:
+    """
+    Structured pass/fail result of evaluate().
+    """
+
+    def __init__(self, names, expected, low, high, actual, passed):
+        self.names = list(names)
+        self.expected = expected
+        self.low = low
+        self.high = high
+        self.actual = actual
+        self.passed = passed
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self):
+        for index, name in enumerate(self.names):
+            yield self.row(index)
+
+    def row(self, index):
+        return ExpectationRow(self.names[index], int(self.expected[index]), int(self.low[index]),
+                              int(self.high[index]), int(self.actual[index]), bool(self.passed[index]))
+
+    @property
+    def failures(self):
+        # rows are only built for the failing entries, a large passing table stays columnar
+        return [self.row(index) for index, flag in enumerate(self.passed) if not flag]
+
+    @property
+    def ok(self):
+        return all(bool(flag) for flag in self.passed)
+
+    def report(self, max_rows=20):
+        """
+        Log a summary and the first failing rows.
+
+        :param max_rows: failing rows to log
+        :return: number of failing rows
+        """
+        failures = self.failures
+        log.info("%d of %d expectations passed" % (len(self) - len(failures), len(self)))
+        for row in failures[:max_rows]:
+            log.error("%s: %d, expected %d [%d, %d]" % (row.name, row.actual, row.expected, row.low, row.high))
+        if len(failures) > max_rows:
+            log.error("... %d more failing expectations" % (len(failures) - max_rows))
+        return len(failures)
+
+    def verify(self, msg='Expectation mismatch'):
+        """
+        :param msg: prefix of the VerificationError
+        :return: True, raise VerificationError if any row failed
+        """
+        if self.report():
+            raise CafyException.VerificationError("%s for %s" % (msg, ', '.join(str(row.name) for row in
+                                                                               self.failures[:20])))
+        return True
+
+
+def evaluate(names, expected, actual, tolerance=5, floor=0, low=None, high=None):
+    """
+    Compare actual counters against expected counters within tolerance.
+
+    :param names: row labels (sequence numbers, stream names, ...)
+    :param expected: expected counters, e.g. Tx Frames per ACE
+    :param actual: actual counters, e.g. hardware matches per ACE
+    :param tolerance: allowed difference in percent
+    :param floor: absolute slack added on both sides
+    :param low: explicit lower bounds, overriding the tolerance window
+    :param high: explicit upper bounds, overriding the tolerance window
+    :return: ExpectationTable
+    """
+    names = list(names)
+    expected = _column(expected)
+    actual = _column(actual)
+    if not len(names) == len(expected) == len(actual):
+        raise ValueError("names, expected and actual differ in length: %d/%d/%d" %
+                         (len(names), len(expected), len(actual)))
+    win_low, win_high = tolerance_windows(expected, tolerance, floor)
+    if low is not None:
+        win_low = _column(low)
+    if high is not None:
+        win_high = _column(high)
+    if np is not None:
+        passed = (actual >= win_low) & (actual <= win_high)
+    else:
+        passed = array('b', [lo <= value <= hi for value, lo, hi in zip(actual, win_low, win_high)])
+    return ExpectationTable(names, expected, win_low, win_high, actual, passed)
+
+
+def evaluate_streams(stream_stats, tolerance=5, floor=0):
+    """
+    Rx against Tx of every stream of a traffic window.
+
+    :param stream_stats: stream name -> stats dict, as in ApData.stream_stats
+    :return: ExpectationTable keyed by stream name
+    """
+    names = list(stream_stats)
+    return evaluate(names, [stream_stats[name]['Tx Frames'] for name in names],
+                    [stream_stats[name]['Rx Frames'] for name in names], tolerance, floor)
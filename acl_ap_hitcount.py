@@ -0,0 +1,186 @@
+# **************************************************
+# Copyright (c) 2017 Cisco Systems, Inc.
+# All rights reserved.
+# **************************************************
+
+"""
+Bulk ACL hardware hit count snapshot.
+
+Acl.get_acl_hit_count reads the hardware matches of one ACL on the given
+locations for every verification step. HitCountSnapshot reads the hardware
+entries of each (acl, direction, location) exactly once, with one worker per
+line card running the reads of its card back to back and the line cards
+concurrently, and keeps the matches in a table keyed by (acl, seq, direction,
+location). Any number of expectations are then checked against that one
+snapshot.
+
+The router has no hardware read of every ACL of a line card at once, the
+hardware show command takes the ACL name, so a line card with several bound
+(acl, direction) pairs is still read once per pair.
+"""
+
+from collections import namedtuple, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from logger.cafylog import CafyLog
+from acl_ap_expect import evaluate, tolerance_windows
+
+log = CafyLog(name="AclHitCount")
+
+HitKey = namedtuple('HitKey', ['acl', 'seq', 'direction', 'location'])
+
+HitTarget = namedtuple('HitTarget', ['address_family', 'acl', 'direction', 'location'])
+
+HitExpectation = namedtuple('HitExpectation', ['acl', 'seq', 'low', 'high', 'direction', 'location'])
+HitExpectation.__new__.__defaults__ = (None, None)
+
+
+def expect(acl, seq, count, direction=None, location=None, tolerance=5):
+    """
+    Expectation of count matches within tolerance percent.
+
+    :param acl: access list name
+    :param seq: sequence number
+    :param count: expected matches, usually the Tx Frames of the stream
+    :param direction: 'ingress'/'egress', None for any direction
+    :param location: location or list of locations summed up, None for every location
+    :param tolerance: allowed difference in percent
+    :return: HitExpectation
+    """
+    return expect_many(acl, [seq], [count], direction, location, tolerance)[0]
+
+
+def expect_many(acl, seqs, counts, direction=None, location=None, tolerance=5):
+    """
+    Expectations of a whole ACL, the tolerance windows computed in one pass.
+
+    :param seqs: sequence numbers
+    :param counts: expected matches per sequence number
+    :return: list of HitExpectation
+    """
+    low, high = tolerance_windows(counts, tolerance)
+    return [HitExpectation(acl, int(seq), int(lo), int(hi), direction, location)
+            for seq, lo, hi in zip(seqs, low, high)]
+
+
+def _entry_seq(entry):
+    for attr in ('sequence_number', 'sequence', 'seq'):
+        value = getattr(entry, attr, None)
+        if value not in (None, ''):
+            return int(value)
+    return None
+
+
+def _entry_matches(entry):
+    matches = getattr(entry, 'matches', '')
+    return int(matches) if matches not in (None, '') else 0
+
+
+class HitCountSnapshot:
+    """
+    Hardware matches of many ACLs and locations taken at one point in time.
+
+    Usage::
+
+        snapshot = HitCountSnapshot.collect(ApData.acl_uut,
+                                            [HitTarget('ipv4', acl, 'egress', loc) for loc in bundle_locs] +
+                                            [HitTarget('ipv4', acl, 'ingress', phy_loc)])
+        snapshot.verify([expect(acl, 10, tcp_tx, 'egress', bundle_locs),
+                         expect(acl, 50, tcp_tx_phy, 'ingress', phy_loc)])
+    """
+
+    def __init__(self):
+        self.table = OrderedDict()
+
+    def add(self, acl, seq, direction, location, matches):
+        key = HitKey(acl, int(seq), direction, location)
+        self.table[key] = self.table.get(key, 0) + int(matches)
+
+    def get(self, acl, seq, direction, location):
+        return self.table.get(HitKey(acl, int(seq), direction, location), 0)
+
+    def __len__(self):
+        return len(self.table)
+
+    def total(self, acl, seq, direction=None, location=None):
+        """
+        Matches of one ACE summed over locations, e.g. the members of a bundle.
+
+        :param direction: None sums both directions
+        :param location: location, list of locations or None for all of them
+        :return: int
+        """
+        if location is not None and not isinstance(location, (list, tuple, set)):
+            location = [location]
+        seq = int(seq)
+        return sum(matches for key, matches in self.table.items()
+                   if key.acl == acl and key.seq == seq and
+                   (direction is None or key.direction == direction) and
+                   (location is None or key.location in location))
+
+    def evaluate(self, expectations):
+        """
+        :param expectations: iterable of HitExpectation
+        :return: ExpectationTable, one row per expectation
+        """
+        expectations = list(expectations)
+        return evaluate(['%s/%s' % (exp.acl, exp.seq) for exp in expectations],
+                        [(exp.low + exp.high) // 2 for exp in expectations],
+                        [self.total(exp.acl, exp.seq, exp.direction, exp.location) for exp in expectations],
+                        low=[exp.low for exp in expectations],
+                        high=[exp.high for exp in expectations])
+
+    def verify(self, expectations, raise_on_fail=True):
+        """
+        Check every expectation against the snapshot.
+
+        :param expectations: iterable of HitExpectation
+        :param raise_on_fail: raise VerificationError listing every failing ACE
+        :return: True if every expectation holds
+        """
+        table = self.evaluate(expectations)
+        if raise_on_fail:
+            return table.verify(msg="ACL hardware hit count mismatch")
+        return table.report() == 0
+
+    @classmethod
+    def collect(cls, acl_obj, targets, max_workers=None):
+        """
+        Read the hardware entries of every target, one worker per line card.
+
+        :param acl_obj: Acl object of the device
+        :param targets: iterable of HitTarget (address_family, acl, direction, location)
+        :param max_workers: thread pool size, defaults to one thread per location
+        :return: HitCountSnapshot
+        """
+        by_location = OrderedDict()
+        for target in targets:
+            target = HitTarget(*target)
+            lane = by_location.setdefault(target.location, [])
+            if target not in lane:
+                lane.append(target)
+
+        def read_location(lane):
+            rows = []
+            for target in lane:
+                entries = acl_obj.get_acl_access_lists_ipv4_hardware(address_family=target.address_family,
+                                                                     access_list_name=target.acl,
+                                                                     direction=target.direction,
+                                                                     interface=None,
+                                                                     location=target.location)
+                for entry in entries or []:
+                    seq = _entry_seq(entry)
+                    if seq is not None:
+                        rows.append((target.acl, seq, target.direction, target.location, _entry_matches(entry)))
+            return rows
+
+        snapshot = cls()
+        if not by_location:
+            return snapshot
+        with ThreadPoolExecutor(max_workers=max_workers or len(by_location)) as pool:
+            results = list(pool.map(read_location, by_location.values()))
+        for rows in results:
+            for row in rows:
+                snapshot.add(*row)
+        log.info("Hit count snapshot of %d ACEs over %d locations" % (len(snapshot), len(by_location)))
+        return snapshot
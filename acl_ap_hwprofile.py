@@ -0,0 +1,204 @@
+# **************************************************
+# Copyright (c) 2017 Cisco Systems, Inc.
+# All rights reserved.
+# **************************************************
+
+"""
+Reload coalescing for the hw-module profiles of R1.
+
+A hw-module profile only takes effect after a reload, which costs minutes.
+ProfilePlanner collects every profile the run needs (the setup_module ones
+plus the ones of the selected classes, as profiled by acl_ap_order), reads
+the running config once, configures the missing profiles and reloads a
+single time, or not at all when the router already has them:
+
+    ApData.hw_profiles.require('stats_acl_permit', 'ttl_match_ipv4')
+    ApData.hw_profiles.require_classes(planned_hw_profiles(module.__name__))
+    ApData.hw_profiles.apply()
+
+A class needing a profile calls ensure(), which reloads only when the
+profile is not there yet, and release(), which keeps a profile the plan
+configured for the whole run.
+"""
+
+import re
+from collections import OrderedDict
+
+from logger.cafylog import CafyLog
+
+log = CafyLog(name="AclHwProfile")
+
+RUNNING_CONFIG_CMD = "show running-config | include hw-module"
+
+
+class HwProfile:
+    """
+    One hw-module profile.
+    """
+
+    def __init__(self, name, library, method, pattern, **kwargs):
+        """
+        :param name: profile name used by the tests
+        :param library: 'acl' or 'qos', the library object providing method
+        :param method: setter of the profile, called with enable=False to remove it
+        :param pattern: regex matching the profile line of the running config
+        :param kwargs: extra setter arguments
+        """
+        self.name = name
+        self.library = library
+        self.method = method
+        self.pattern = re.compile(pattern, re.MULTILINE)
+        self.kwargs = kwargs
+
+
+PROFILES = OrderedDict((profile.name, profile) for profile in (
+    HwProfile('stats_acl_permit', 'acl', 'set_hw_module_profile_stats_acl_permit',
+              r'^\s*hw-module profile stats .*acl-permit'),
+    HwProfile('ttl_match_ipv4', 'acl', 'set_hw_module_profile_ttl_match',
+              r'^\s*hw-module profile .*ipv4.*ttl-match'),
+    HwProfile('ttl_match_ipv6', 'acl', 'set_hw_module_profile_ttl_match',
+              r'^\s*hw-module profile .*ipv6.*ttl-match', address_family='ipv6'),
+    HwProfile('qos_ingress_peering', 'qos', 'set_ingress_model_peering',
+              r'^\s*hw-module profile qos ingress-model peering'),
+    HwProfile('common_acl', 'acl', 'set_hardware_profile_common_acl',
+              r'^\s*hw-module profile .*common'),
+))
+
+
+def profile_name(name):
+    """
+    :param name: profile name or setter method name, as found by acl_ap_order
+    :return: profile name, None when the setter is not a known profile
+    """
+    if name in PROFILES:
+        return name
+    for profile in PROFILES.values():
+        if profile.method == name:
+            return profile.name
+    return None
+
+
+class ProfilePlanner:
+    """
+    Applies the hw-module profiles of a run with at most one reload.
+    """
+
+    def __init__(self, libraries, reload, read_running=None):
+        """
+        :param libraries: dict library name -> callable returning the library
+                          object ('acl' -> the current Acl of R1, 'qos' -> QosHwXrCli)
+        :param reload: callable reloading R1 and rebuilding the objects bound to it
+        :param read_running: callable returning the hw-module lines of the running
+                             config; None or a failing read means every profile is applied
+        """
+        self.libraries = libraries
+        self.reload = reload
+        self.read_running = read_running
+        self.required = OrderedDict()
+        self.planned = set()
+        self.active = None
+        self.reloads = 0
+        self.skipped = 0
+
+    def require(self, *names):
+        for name in names:
+            if name not in PROFILES:
+                raise ValueError("Unknown hw-module profile %s" % name)
+            self.required[name] = True
+
+    def require_classes(self, names):
+        """
+        :param names: profile or setter names of the selected classes, None when unknown
+        """
+        for name in names or ():
+            profile = profile_name(name)
+            if profile is None:
+                log.warning("hw-module profile setter %s is not known to the planner" % name)
+            else:
+                self.required[profile] = True
+
+    def running(self):
+        """
+        :return: set of the profiles in the running config, None when it cannot be read
+        """
+        if self.read_running is None:
+            return None
+        try:
+            output = self.read_running()
+        except Exception as err:
+            log.warning("Could not read the hw-module profiles: %s" % err)
+            return None
+        if not isinstance(output, str):
+            return None
+        return set(name for name, profile in PROFILES.items() if profile.pattern.search(output))
+
+    def _set(self, name, enable=True):
+        profile = PROFILES[name]
+        library = self.libraries[profile.library]()
+        kwargs = dict(profile.kwargs)
+        if not enable:
+            kwargs['enable'] = False
+        getattr(library, profile.method)(**kwargs)
+
+    def _reload(self, names):
+        log.info("Reloading R1 for hw-module profiles %s" % ', '.join(names))
+        self.reload()
+        self.reloads += 1
+
+    def apply(self):
+        """
+        Configure the required profiles missing on the router and reload once.
+
+        :return: list of the profiles configured
+        """
+        running = self.running()
+        self.active = set(running or ())
+        missing = [name for name in self.required if running is None or name not in running]
+        self.planned = set(self.required)
+        if not missing:
+            self.skipped += len(self.required)
+            log.info("hw-module profiles %s already configured, no reload" % (', '.join(self.required) or 'none'))
+            return []
+        for name in missing:
+            self._set(name)
+        self._reload(missing)
+        self.active.update(missing)
+        self.skipped += len(self.required) - len(missing)
+        return missing
+
+    def ensure(self, name):
+        """
+        Make sure a profile is in effect, reloading only when it is not.
+
+        :return: True when a reload was needed
+        """
+        if name not in PROFILES:
+            raise ValueError("Unknown hw-module profile %s" % name)
+        if self.active is None:
+            running = self.running()
+            self.active = set(running or ())
+        if name in self.active:
+            self.skipped += 1
+            log.info("hw-module profile %s already in effect, no reload" % name)
+            return False
+        self._set(name)
+        self._reload([name])
+        self.active.add(name)
+        return True
+
+    def release(self, name):
+        """
+        Remove a profile a class configured for itself; profiles of the run plan stay.
+
+        :return: True when the profile was removed
+        """
+        if name in self.planned:
+            log.info("hw-module profile %s is part of the run plan, kept" % name)
+            return False
+        self._set(name, enable=False)
+        if self.active is not None:
+            self.active.discard(name)
+        return True
+
+    def report(self):
+        log.info("hw-module profiles: %d reloads, %d profiles already in effect" % (self.reloads, self.skipped))
@@ -0,0 +1,118 @@
+# **************************************************
+# Copyright (c) 2017 Cisco Systems, Inc.
+# All rights reserved.
+# **************************************************
+
+"""
+Columnar hardware ACL table for the scale tests.
+
+The TestSCALE* classes used to index every 10th or 50th element of the
+get_acl_access_lists_ipv4_hardware output. HardwareTable streams the whole
+output once into three integer columns (sequence number, matches, TCAM
+entries) without keeping the per ACE objects, and verifies every ACE of a
+range against its expected window with the expectation engine.
+"""
+
+from array import array
+
+from logger.cafylog import CafyLog
+from utils.cafyexception import CafyException
+from acl_ap_expect import evaluate
+
+log = CafyLog(name="AclHwTable")
+
+UNKNOWN = -1
+
+
+def _int_attr(entry, names, default):
+    for name in names:
+        value = getattr(entry, name, None)
+        if value not in (None, ''):
+            return int(value)
+    return default
+
+
+class HardwareTable:
+    """
+    Hardware entries of one ACL on one location as parallel integer columns.
+
+    Usage::
+
+        hw_table = HardwareTable.from_entries(ApData.acl_uut.get_acl_access_lists_ipv4_hardware(...))
+        hw_table.verify_hits(start=3, stop=1990, high=tx_frames)
+    """
+
+    def __init__(self):
+        self.seq = array('q')
+        self.matches = array('q')
+        self.tcam = array('q')
+
+    def __len__(self):
+        return len(self.seq)
+
+    def append(self, seq, matches, tcam=UNKNOWN):
+        self.seq.append(seq)
+        self.matches.append(matches)
+        self.tcam.append(tcam)
+
+    @classmethod
+    def from_entries(cls, entries):
+        """
+        :param entries: iterable of hardware entries of the Acl library, an entry
+                        with an empty match counter counts as 0 matches
+        :return: HardwareTable, one row per entry in the order of the output
+        :raises ValueError: for an entry without a sequence number, its hits
+                            could not be told apart from another ACE's
+        """
+        table = cls()
+        for index, entry in enumerate(entries or []):
+            seq = _int_attr(entry, ('sequence_number', 'sequence', 'seq'), None)
+            if seq is None:
+                raise ValueError("Hardware entry %d has no sequence number: %r" % (index, entry))
+            table.append(seq,
+                         _int_attr(entry, ('matches',), 0),
+                         _int_attr(entry, ('tcam_entries', 'tcam_entry', 'hw_entries'), UNKNOWN))
+        return table
+
+    def hits(self, start=0, stop=None):
+        """
+        :return: number of ACEs in [start, stop) with at least one match
+        """
+        return sum(1 for matches in self.matches[start:stop] if matches > 0)
+
+    def verify_hits(self, start=0, stop=None, low=1, high=None, msg='Failed Traffic verification'):
+        """
+        Verify every ACE in the index range [start, stop) of the output.
+
+        :param start: first index checked, the leading entries the stream never hits are skipped
+        :param stop: index after the last one checked, None for the end of the table
+        :param low: minimum matches of every ACE
+        :param high: maximum matches of every ACE, e.g. the Tx Frames of the stream; None for no bound
+        :param msg: prefix of the VerificationError
+        :return: ExpectationTable
+        :raises VerificationError: also when the range is empty or runs past the end of the table,
+                                   i.e. the hardware did not program every ACE of the range
+        """
+        end = len(self) if stop is None else stop
+        if start >= end or end > len(self):
+            raise CafyException.VerificationError("%s: hardware table has %d entries, expected entries [%d, %d)"
+                                                  % (msg, len(self), start, end))
+        seq = self.seq[start:stop]
+        actual = self.matches[start:stop]
+        if high is None:
+            high = max(max(actual) if actual else 0, low)
+        count = len(seq)
+        result = evaluate(seq, array('q', [low]) * count, actual, low=array('q', [low]) * count,
+                          high=array('q', [int(high)]) * count)
+        log.info("%d of %d hardware entries hit" % (self.hits(start, stop), count))
+        result.verify(msg=msg)
+        return result
+
+
+def tx_frames(stream_stats, streams):
+    """
+    :param stream_stats: ApData.stream_stats
+    :param streams: stream names of the traffic window
+    :return: Tx Frames summed over the streams
+    """
+    return sum(int(stream_stats[stream]['Tx Frames']) for stream in streams)
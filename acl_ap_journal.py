@@ -0,0 +1,238 @@
+# **************************************************
+# Copyright (c) 2017 Cisco Systems, Inc.
+# All rights reserved.
+# **************************************************
+
+"""
+Journal of the R1 config changes, undone in a single commit.
+
+teardown_class and teardown_module undo by hand what the classes configured,
+one unconfig or delete_ace at a time, and zap.remove_acl_scale removes every
+scale profile whatever the class loaded. ConfigJournal takes the place of the
+Acl calls, applies each forward change as it comes (inside the caller's
+topo.config block, as before) and records its inverse in the innermost open
+scope: the module, a class or a test.
+
+undo(scope) merges the inverses of that scope and every scope inside it and
+pushes them in one commit:
+
+- a change undone through the journal before the end of the scope is dropped;
+- the ACEs of an ACL the journal deletes as a whole are not deleted one by one;
+- bindings are removed first, then ACEs, ACLs and at last object groups.
+
+    ApData.journal.set_acl_to_interface(access_list_name=..., address_family=..., direction=...,
+                                        interface=..., mode="config")
+    ApData.journal.undo('class')
+
+The journal undoes what was added, it does not put back what a change
+replaced. The autouse
+config_journal_scope fixture opens a scope per class and undoes whatever is
+left in it after teardown_class.
+"""
+
+import contextlib
+import json
+import time
+from collections import OrderedDict, namedtuple
+
+from logger.cafylog import CafyLog
+
+log = CafyLog(name="AclJournal")
+
+BINDING, ACE, ACL, OBJECT_GROUP = range(4)
+
+Entry = namedtuple('Entry', ['key', 'phase', 'undo', 'covers', 'what'])
+
+
+def _params_key(method, params):
+    return method, tuple(sorted((key, json.dumps(value, sort_keys=True)) for key, value in params.items()))
+
+
+class ConfigJournal:
+    """
+    Records forward config changes and pushes their merged inverse, see the module docstring.
+    """
+
+    def __init__(self, get_acl, zap, topo, device):
+        """
+        :param get_acl: callable returning the current Acl object of the device,
+                        which is rebuilt after RPFO/reload
+        :param zap: Zap, for set_aclace, edit_add_aclace and remove_acl
+        :param topo: topology providing config(device, thread=True)
+        :param device: router the journal records the config of
+        """
+        self.get_acl = get_acl
+        self.zap = zap
+        self.topo = topo
+        self.device = device
+        self.frames = [('module', OrderedDict())]
+        self.commits = 0
+        self.undone = 0
+        self.cancelled = 0
+        self.seconds = 0.0
+
+    @property
+    def acl_obj(self):
+        return self.get_acl()
+
+    def open(self, scope):
+        """
+        Start recording into a new scope, 'class' or 'test'.
+        """
+        self.frames.append((scope, OrderedDict()))
+
+    def close(self, scope):
+        """
+        Undo what is left in the scope and stop recording into it.
+        """
+        self.undo(scope)
+        del self.frames[self._index(scope):]
+
+    @contextlib.contextmanager
+    def scope(self, scope):
+        self.open(scope)
+        try:
+            yield self
+        finally:
+            self.close(scope)
+
+    def _index(self, scope):
+        for index in range(len(self.frames) - 1, -1, -1):
+            if self.frames[index][0] == scope:
+                return index
+        raise KeyError("No open journal scope %s" % scope)
+
+    def _record(self, entry):
+        if any(entry.key in entries for _, entries in self.frames):
+            # the first forward change owns the inverse
+            return
+        self.frames[-1][1][entry.key] = entry
+
+    def _cancel(self, key):
+        for _, entries in self.frames:
+            if entries.pop(key, None) is not None:
+                self.cancelled += 1
+                return True
+        return False
+
+    def set_acl_to_interface(self, access_list_name, address_family, direction, interface, mode="config", **kwargs):
+        """
+        Same arguments as Acl.set_acl_to_interface.
+        """
+        result = self.acl_obj.set_acl_to_interface(access_list_name=access_list_name, address_family=address_family,
+                                                   direction=direction, interface=interface, mode=mode, **kwargs)
+        key = ('binding', address_family, direction, str(interface))
+        if mode == "unconfig":
+            self._cancel(key)
+        else:
+            self._record(Entry(key, BINDING, lambda: self.acl_obj.set_acl_to_interface(
+                access_list_name=access_list_name, address_family=address_family, direction=direction,
+                interface=interface, mode="unconfig", **kwargs), (), "unbind %s from %s" % (access_list_name, interface)))
+        return result
+
+    def _object_group(self, method, mode, params):
+        result = getattr(self.acl_obj, method)(mode=mode, **params)
+        key = _params_key(method, params)
+        if mode == "unconfig":
+            self._cancel(key)
+        else:
+            self._record(Entry(key, OBJECT_GROUP, lambda: getattr(self.acl_obj, method)(mode="unconfig", **params),
+                               (), "remove %s" % params.get('obj_group_name')))
+        return result
+
+    def set_network_object_group_acl(self, mode="config", **params):
+        """
+        Same arguments as Acl.set_network_object_group_acl.
+        """
+        return self._object_group('set_network_object_group_acl', mode, params)
+
+    def set_port_object_group_acl(self, mode="config", **params):
+        """
+        Same arguments as Acl.set_port_object_group_acl.
+        """
+        return self._object_group('set_port_object_group_acl', mode, params)
+
+    def _ace(self, aclname, sequence_number):
+        return Entry(('ace', aclname, str(sequence_number)), ACE,
+                     lambda: self.acl_obj.delete_ace(access_list_name=aclname, sequence_number=str(sequence_number)),
+                     (), "delete %s %s" % (aclname, sequence_number))
+
+    def edit_add_aclace(self, aces, aclname):
+        """
+        Zap.edit_add_aclace, each ACE recorded for deletion.
+        """
+        result = self.zap.edit_add_aclace(aces, self.acl_obj, aclname)
+        for ace in aces:
+            self._record(self._ace(aclname, ace['sequence_number']))
+        return result
+
+    def delete_ace(self, access_list_name, sequence_number, **kwargs):
+        """
+        Same arguments as Acl.delete_ace.
+        """
+        result = self.acl_obj.delete_ace(access_list_name=access_list_name, sequence_number=sequence_number, **kwargs)
+        self._cancel(('ace', access_list_name, str(sequence_number)))
+        return result
+
+    def set_aclace(self, acl_data):
+        """
+        Zap.set_aclace, undone by Zap.remove_acl.
+        """
+        result = self.zap.set_aclace(acl_data, self.acl_obj)
+        names = tuple(acl_data['aclnames'])
+        self._record(Entry(('aclset',) + names, ACL, lambda: self.zap.remove_acl(acl_data, self.acl_obj),
+                           frozenset(names), "remove %d ACLs" % len(names)))
+        return result
+
+    def created_acl(self, aclname):
+        """
+        Record an ACL configured outside the journal (scale loads) for deletion as a whole.
+        """
+        self._record(Entry(('acl', aclname), ACL, lambda: self.acl_obj.delete_acl(access_list_name=aclname,
+                                                                                  unit_test_mode=False),
+                           frozenset([aclname]), "delete %s" % aclname))
+
+    def deleted_acl(self, aclname):
+        """
+        Forget an ACL recorded with created_acl() and deleted outside the journal.
+        """
+        self._cancel(('acl', aclname))
+
+    def inverse(self, scope):
+        """
+        :return: merged inverse of the scope and the scopes inside it, in push order
+        """
+        entries = [entry for _, frame in self.frames[self._index(scope):] for entry in frame.values()]
+        deleted = set(name for entry in entries for name in entry.covers)
+        entries = [entry for entry in entries if not (entry.phase == ACE and entry.key[1] in deleted)]
+        # last in first out inside a phase
+        return sorted(reversed(entries), key=lambda entry: entry.phase)
+
+    def undo(self, scope='class'):
+        """
+        Push the merged inverse of the scope in one commit and forget it.
+
+        :return: number of inverse operations pushed
+        """
+        entries = self.inverse(scope)
+        recorded = sum(len(frame) for _, frame in self.frames[self._index(scope):])
+        for _, frame in self.frames[self._index(scope):]:
+            frame.clear()
+        if not entries:
+            return 0
+        start = time.monotonic()
+        with self.topo.config(self.device, thread=True):
+            for entry in entries:
+                log.debug("journal: %s" % entry.what)
+                entry.undo()
+        elapsed = time.monotonic() - start
+        self.commits += 1
+        self.undone += len(entries)
+        self.seconds += elapsed
+        log.info("Journal %s: %d inverse changes of %d recorded in one commit, %.1fs"
+                 % (scope, len(entries), recorded, elapsed))
+        return len(entries)
+
+    def report(self):
+        log.info("Config journal: %d changes undone in %d commits (%.1fs), %d undone by the tests themselves"
+                 % (self.undone, self.commits, self.seconds, self.cancelled))
@@ -0,0 +1,83 @@
+# **************************************************
+# Copyright (c) 2017 Cisco Systems, Inc.
+# All rights reserved.
+# **************************************************
+
+"""
+Lazy class attributes for ApData.
+
+Every attribute declared with LazyAttr is built the first time a test reads
+it and is then stored on the class as a plain attribute, so later reads are
+ordinary attribute lookups. Collecting tests (--collect-only, -k, class
+selection) never touches the routers, the topology or the input json.
+"""
+
+import threading
+
+
+class LazyAttr:
+    """
+    Class level descriptor which builds its value on first access.
+
+    The factory gets the owner class as the only argument, so a factory can
+    depend on other lazy attributes (``lambda cls: Acl(device=cls.UUT1, ...)``).
+    Assigning the attribute (``ApData.acl_uut = Acl(...)``) simply replaces
+    the cached value, exactly like the old class attributes.
+    """
+
+    _lock = threading.RLock()
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.name = None
+        self.__doc__ = getattr(factory, '__doc__', None)
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        with LazyAttr._lock:
+            cached = owner.__dict__.get(self.name, self)
+            if cached is not self:
+                # Another thread built it while we were waiting on the lock.
+                return cached
+            value = self.factory(owner)
+            setattr(owner, self.name, value)
+            return value
+
+
+def lazy(factory):
+    """
+    Decorator form of LazyAttr, for factories which need more than one line.
+
+    :param factory: callable taking the owner class
+    :return: LazyAttr
+    """
+    return LazyAttr(factory)
+
+
+def reset_lazy(owner, name, factory):
+    """
+    Drop a cached value and re-arm the attribute with a factory.
+
+    Used after reloads/RPFO when the cached device library objects must be
+    rebuilt on next use instead of being rebuilt eagerly.
+
+    :param owner: class holding the attribute (ApData)
+    :param name: attribute name
+    :param factory: callable taking the owner class
+    :return: None
+    """
+    attr = LazyAttr(factory)
+    attr.__set_name__(owner, name)
+    with LazyAttr._lock:
+        setattr(owner, name, attr)
+
+
+def is_built(owner, name):
+    """
+    :param owner: class holding the attribute
+    :param name: attribute name
+    :return: True if the attribute was already built (or assigned)
+    """
+    return not isinstance(owner.__dict__.get(name), LazyAttr)
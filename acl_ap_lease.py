@@ -0,0 +1,287 @@
+# **************************************************
+# Copyright (c) 2017 Cisco Systems, Inc.
+# All rights reserved.
+# **************************************************
+
+"""
+Interface leases for tests running side by side.
+
+Every apply_intf entry binds its ACLs to one interface of R1 in one
+direction and address family. The interface is the link of intf_list, the
+'<link>.<subint>' subinterface when the entry has a subint, or the named
+interface (BVI, tunnel) when it has an interface_name. A test holds:
+
+- one slot (interface, direction, address family) per entry it uses, an
+  interface carrying a single ACL per direction and family;
+- its ACL names, hardware counters being per ACL and line card;
+- the traffic generator, when it runs traffic. All tests share the one
+  TGEN, and every traffic window (traffic_verifier, BatchTrafficVerifier,
+  OutageMonitor) clears the stats of all streams first, so two traffic
+  windows can never overlap.
+
+LeaseManager hands out leases whose slots and ACLs do not overlap; classes
+reloading the router, loading scale ACLs or running triggers get an
+exclusive lease. parallelism() reports how many classes of the current
+input and topology can run at once: max_parallel with the TGEN leased for
+the whole class, max_config_parallel when only the traffic windows are
+serialized through traffic().
+
+    leases = LeaseManager.from_model(ApData.acl_model)
+    with leases.acquire('TestIPv4PortIngressAclLesserThan', ['PortObjectGroupIngressAclPhy']):
+        ...
+        with leases.traffic('TestIPv4PortIngressAclLesserThan'):
+            AclBaseAp.traffic_verifier(...)
+
+    python acl_ap_lease.py            # parallelism report of acl_ap_main.py
+"""
+
+import argparse
+import ast
+import os
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from logger.cafylog import CafyLog
+from acl_ap_model import compile_model
+from acl_ap_order import scan_node, test_class_nodes
+
+log = CafyLog(name="AclLease")
+
+Slot = namedtuple('Slot', ['interface', 'direction', 'address_family'])
+
+# calls opening a traffic window on the shared TGEN
+TRAFFIC_CALLS = frozenset(('traffic_verifier', 'start_traffic', 'MultiInterfaceVerifier', 'BatchTrafficVerifier',
+                           'OutageMonitor', 'TriggerMatrix'))
+
+
+def entry_interface(entry):
+    """
+    :param entry: apply_intf entry
+    :return: interface the entry binds to, as a topology level name
+    """
+    if entry.get('interface_name'):
+        return entry['interface_name']
+    if entry.get('subint'):
+        return '%s.%s' % (entry['intf_list'], entry['subint'])
+    return entry['intf_list']
+
+
+def entry_resources(entry):
+    """
+    :return: (slots, ACL names) of one apply_intf entry
+    """
+    slots = set(Slot(interface, entry['direction'], entry['address_family'])
+                for interface in entry_interface(entry).split())
+    acls = set(name for name in str(entry['aclname']).split() if name != 'common')
+    return slots, acls
+
+
+class Lease:
+    """
+    Resources held by one owner; a context manager releasing them on exit.
+    """
+
+    def __init__(self, manager, owner, slots, acls, exclusive, tgen=False):
+        self.manager = manager
+        self.owner = owner
+        self.slots = frozenset(slots)
+        self.acls = frozenset(acls)
+        self.exclusive = exclusive
+        self.tgen = tgen
+
+    def conflicts(self, other):
+        return (self.exclusive or other.exclusive or (self.tgen and other.tgen) or bool(self.slots & other.slots) or
+                bool(self.acls & other.acls))
+
+    def release(self):
+        self.manager.release(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+        return False
+
+    def __repr__(self):
+        return "Lease(%s, %d slots, %d acls%s%s)" % (self.owner, len(self.slots), len(self.acls),
+                                                     ', tgen' if self.tgen else '',
+                                                     ', exclusive' if self.exclusive else '')
+
+
+class LeaseManager:
+    """
+    Hands out non conflicting leases on the R1 interface slots, ACLs and the TGEN.
+    """
+
+    def __init__(self, apply_intf):
+        """
+        :param apply_intf: apply_intf entries of the input
+        """
+        self.cases = OrderedDict((name, entry_resources(entry)) for name, entry in apply_intf.items())
+        self.condition = threading.Condition()
+        self.held = []
+
+    @classmethod
+    def from_model(cls, model):
+        return cls(model.apply_intf)
+
+    def lease_for(self, owner, cases, exclusive=False, tgen=False):
+        """
+        :param owner: test or class name
+        :param cases: apply_intf entry names the owner uses
+        :param exclusive: the owner needs the whole router
+        :param tgen: the owner runs traffic
+        :return: Lease, not acquired yet
+        """
+        slots, acls = set(), set()
+        for case in cases:
+            if case not in self.cases:
+                raise KeyError("%s uses unknown apply_intf entry %s" % (owner, case))
+            case_slots, case_acls = self.cases[case]
+            slots |= case_slots
+            acls |= case_acls
+        return Lease(self, owner, slots, acls, exclusive, tgen)
+
+    def try_acquire(self, lease):
+        """
+        :return: True when the lease was granted
+        """
+        with self.condition:
+            if any(lease.conflicts(held) for held in self.held):
+                return False
+            self.held.append(lease)
+            return True
+
+    def acquire(self, owner, cases, exclusive=False, timeout=None, tgen=False):
+        """
+        Wait until the resources of the owner are free and lease them.
+
+        :param timeout: seconds to wait, None waits forever
+        :param tgen: lease the TGEN for the whole lease, see traffic() for single windows
+        :return: Lease
+        """
+        return self._wait(self.lease_for(owner, cases, exclusive, tgen), timeout)
+
+    def traffic(self, owner, timeout=None):
+        """
+        Lease the TGEN alone, around one traffic window of an owner.
+
+        :return: Lease
+        """
+        return self._wait(Lease(self, owner, (), (), False, tgen=True), timeout)
+
+    def _wait(self, lease, timeout):
+        owner = lease.owner
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.condition:
+            while any(lease.conflicts(held) for held in self.held):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    busy = [held.owner for held in self.held if lease.conflicts(held)]
+                    raise TimeoutError("%s still waiting on %s" % (owner, ', '.join(busy)))
+                self.condition.wait(remaining)
+            self.held.append(lease)
+        log.debug("%r granted" % lease)
+        return lease
+
+    def release(self, lease):
+        with self.condition:
+            if lease in self.held:
+                self.held.remove(lease)
+                self.condition.notify_all()
+
+    def waves(self, demands):
+        """
+        Greedy schedule of owners into waves of non conflicting leases, the
+        most constrained owners placed first.
+
+        :param demands: OrderedDict owner -> (cases, exclusive, tgen)
+        :return: list of waves, each a list of owner names
+        """
+        leases = [self.lease_for(owner, cases, exclusive, tgen) for owner, (cases, exclusive, tgen) in demands.items()]
+        degree = dict((lease.owner, sum(lease.conflicts(other) for other in leases if other is not lease))
+                      for lease in leases)
+        waves = []
+        for lease in sorted(leases, key=lambda item: -degree[item.owner]):
+            for wave in waves:
+                if not any(lease.conflicts(other) for other in wave):
+                    wave.append(lease)
+                    break
+            else:
+                waves.append([lease])
+        return [[lease.owner for lease in wave] for wave in waves]
+
+    def parallelism(self, demands):
+        """
+        :param demands: OrderedDict owner -> (cases, exclusive, tgen)
+        :return: dict with max_parallel (widest wave of the greedy schedule, the
+                 TGEN leased per owner), max_config_parallel (the same with only
+                 the traffic windows serialized), waves, exclusive and traffic
+                 owners, interfaces and slots in use
+        """
+        waves = self.waves(demands)
+        config_waves = self.waves(OrderedDict((owner, (cases, exclusive, False))
+                                              for owner, (cases, exclusive, _) in demands.items()))
+        slots = set()
+        for cases, _, _ in demands.values():
+            for case in cases:
+                slots |= self.cases[case][0]
+        return {'owners': len(demands),
+                'exclusive': sorted(owner for owner, (_, exclusive, _) in demands.items() if exclusive),
+                'traffic': sorted(owner for owner, (_, _, tgen) in demands.items() if tgen),
+                'interfaces': len(set(slot.interface for slot in slots)),
+                'slots': len(slots),
+                'waves': len(waves),
+                'max_parallel': max(len(wave) for wave in waves) if waves else 0,
+                'max_config_parallel': max(len(wave) for wave in config_waves) if config_waves else 0}
+
+
+def class_demands(module_file, known_cases):
+    """
+    Static demand of every test class: the apply_intf entries its source uses,
+    whether it needs the whole router and whether it runs traffic.
+
+    :return: OrderedDict class name -> (cases, exclusive, tgen)
+    """
+    demands = OrderedDict()
+    for name, node in test_class_nodes(module_file).items():
+        facts = scan_node(node)
+        exclusive = bool(facts['hw_profiles'] or facts['reload'] or facts['scale'] or facts['disruptive'])
+        # entries passed by name, e.g. MultiInterfaceVerifier.add('Phy', 'PortObjectGroupIngressAclPhy', ...)
+        named = set(child.value for child in ast.walk(node)
+                    if isinstance(child, ast.Constant) and isinstance(child.value, str) and child.value in known_cases)
+        cases = sorted(case for case in facts['cases'] | named if case in known_cases)
+        calls = set(getattr(child.func, 'attr', getattr(child.func, 'id', None)) for child in ast.walk(node)
+                    if isinstance(child, ast.Call))
+        # classes binding ACLs without an apply_intf entry cannot be placed safely
+        demands[name] = (cases, exclusive or not cases, bool(calls & TRAFFIC_CALLS))
+    return demands
+
+
+def main():
+    prefix = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="Interface lease report of the ACL suite")
+    parser.add_argument('--input', default=os.path.join(prefix, 'acl_ap_input.json'))
+    parser.add_argument('--module', default=os.path.join(prefix, 'acl_ap_main.py'))
+    parser.add_argument('--waves', action='store_true', help="print the classes of every wave")
+    args = parser.parse_args()
+
+    manager = LeaseManager.from_model(compile_model(args.input))
+    demands = class_demands(args.module, manager.cases)
+    report = manager.parallelism(demands)
+    print("%(owners)d classes on %(interfaces)d interfaces / %(slots)d slots, %(waves)d waves, "
+          "at most %(max_parallel)d classes at once" % report)
+    print("%d exclusive classes, %d classes running traffic on the shared TGEN" % (len(report['exclusive']),
+                                                                                  len(report['traffic'])))
+    print("at most %(max_config_parallel)d classes configuring at once with their traffic windows "
+          "serialized through LeaseManager.traffic()" % report)
+    if args.waves:
+        for index, wave in enumerate(manager.waves(demands)):
+            print("wave %d: %s" % (index + 1, ' '.join(wave)))
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
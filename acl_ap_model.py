@@ -0,0 +1,338 @@
+# **************************************************
+# Copyright (c) 2017 Cisco Systems, Inc.
+# All rights reserved.
+# **************************************************
+
+"""
+Precompiled ACL model of the test input json.
+
+compile_model() validates the acl feature configuration once, resolves the
+${id=[...]} templates of the interface configuration and freezes everything
+into read only dicts and lists indexed by name. load_model() keeps the
+compiled model as json in a per user cache keyed by the hash of the input
+file, so later runs skip validation and template resolution.
+
+    ApData.acl_model.test_case('V4PhysicalBundleBundle')
+    ApData.acl_model.aclnames['ipv4_ing_egr_permit_tcp_any_any']
+    ApData.acl_model.sequences('ipv4_ing_egr_permit_tcp_any_any')
+"""
+
+import copy
+import hashlib
+import json
+import os
+import re
+import stat
+import tempfile
+
+from logger.cafylog import CafyLog
+
+log = CafyLog(name="AclModel")
+
+MODEL_VERSION = 2
+
+DIRECTIONS = ('ingress', 'egress')
+ADDRESS_FAMILIES = ('ipv4', 'ipv6', 'ethernet-services')
+
+_TEMPLATE_KEY = re.compile(r'^\$\{(\w+)=\[([^\]]*)\]\}$')
+
+
+class FrozenDict(dict):
+    """
+    Read only dict whose keys are also reachable as attributes.
+    """
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("ACL model is read only, copy.deepcopy() it to modify")
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+    def __deepcopy__(self, memo):
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+
+
+class FrozenList(list):
+    """
+    Read only list, still a list for the libraries checking isinstance(value, list).
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("ACL model is read only, copy.deepcopy() it to modify")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _readonly
+    append = extend = insert = pop = remove = reverse = sort = clear = _readonly
+
+    def __reduce__(self):
+        return FrozenList, (list(self),)
+
+    def __deepcopy__(self, memo):
+        return [copy.deepcopy(value, memo) for value in self]
+
+
+def freeze(node):
+    """
+    :return: node with every dict/list converted to FrozenDict/FrozenList
+    """
+    if isinstance(node, dict):
+        return FrozenDict((key, freeze(value)) for key, value in node.items())
+    if isinstance(node, list):
+        return FrozenList(freeze(value) for value in node)
+    return node
+
+
+def _template_ids(spec):
+    """
+    :param spec: '3', '1,50,51' or '10-12'
+    :return: list of ids as strings
+    """
+    ids = []
+    for part in spec.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '-' in part:
+            first, last = part.split('-', 1)
+            ids.extend(str(index) for index in range(int(first), int(last) + 1))
+        else:
+            ids.append(part)
+    return ids
+
+
+def _substitute(node, name, value):
+    if isinstance(node, dict):
+        return {_substitute(key, name, value): _substitute(item, name, value) for key, item in node.items()}
+    if isinstance(node, list):
+        return [_substitute(item, name, value) for item in node]
+    if isinstance(node, str):
+        return node.replace('${%s}' % name, value)
+    return node
+
+
+def resolve_templates(node):
+    """
+    Expand every "${name=[ids]}" key into one key per id, with "${name}"
+    replaced by the id in the subtree below it.
+
+    :param node: json subtree
+    :return: resolved copy of node
+    """
+    if isinstance(node, list):
+        return [resolve_templates(item) for item in node]
+    if not isinstance(node, dict):
+        return node
+    resolved = {}
+    for key, value in node.items():
+        template = _TEMPLATE_KEY.match(key) if isinstance(key, str) else None
+        if template is None:
+            resolved[key] = resolve_templates(value)
+            continue
+        name, spec = template.groups()
+        for index in _template_ids(spec):
+            resolved[index] = resolve_templates(_substitute(value, name, index))
+    return resolved
+
+
+def _known_acl_names(acl):
+    names = set(acl['aclnames'])
+    names.update(ace['aclname'] for profile in acl.get('aclname_scale', {}).values() for ace in profile)
+    for section in ('add_ace', 'edit_ace', 'modify_addace', 'del_ace', 'ipv6_range'):
+        names.update(acl['test_args'].get(section, {}))
+    return names
+
+
+def validate(acl):
+    """
+    Validate the acl feature configuration.
+
+    Structural errors raise ValueError; apply_intf entries referring to an
+    ACL defined nowhere in the file (chained/common ACLs created by the tests
+    themselves) are only logged.
+
+    :param acl: acl feature configuration dict
+    :return: list of warnings
+    """
+    errors = []
+    warnings = []
+    for section in ('aclnames', 'aclname_scale', 'test_args'):
+        if section not in acl:
+            errors.append("missing section '%s'" % section)
+    if errors:
+        raise ValueError("Invalid acl input: %s" % '; '.join(errors))
+
+    for aclname, aces in acl['aclnames'].items():
+        for ace in aces:
+            if not str(ace.get('sequence_number', '')).isdigit():
+                errors.append("aclnames/%s: bad sequence_number %r" % (aclname, ace.get('sequence_number')))
+            if ace.get('address_family') not in ADDRESS_FAMILIES:
+                errors.append("aclnames/%s: bad address_family %r" % (aclname, ace.get('address_family')))
+
+    known = _known_acl_names(acl)
+    for name, entry in acl['test_args'].get('apply_intf', {}).items():
+        for key in ('aclname', 'address_family', 'direction', 'intf_list'):
+            if key not in entry:
+                errors.append("apply_intf/%s: missing '%s'" % (name, key))
+        if entry.get('direction') not in DIRECTIONS:
+            errors.append("apply_intf/%s: bad direction %r" % (name, entry.get('direction')))
+        if entry.get('address_family') not in ADDRESS_FAMILIES:
+            errors.append("apply_intf/%s: bad address_family %r" % (name, entry.get('address_family')))
+        unknown = [aclname for aclname in str(entry.get('aclname', '')).split()
+                   if aclname not in known and aclname != 'common']
+        if unknown:
+            warnings.append("apply_intf/%s: acl %s not defined in the input" % (name, ' '.join(unknown)))
+
+    if errors:
+        raise ValueError("Invalid acl input:\n  %s" % '\n  '.join(errors))
+    return warnings
+
+
+class AclModel:
+    """
+    Compiled, read only view of the acl feature configuration.
+    """
+
+    def __init__(self, source_hash, acl, interfaces, warnings):
+        self.source_hash = source_hash
+        self.acl = acl
+        self.aclnames = acl['aclnames']
+        self.aclname_scale = acl['aclname_scale']
+        self.test_args = acl['test_args']
+        self.apply_intf = acl['test_args'].get('apply_intf', FrozenDict())
+        self.add_ace = acl['test_args'].get('add_ace', FrozenDict())
+        self.interfaces = interfaces
+        self.warnings = warnings
+        self._sequences = FrozenDict((aclname, tuple(int(ace['sequence_number']) for ace in aces))
+                                     for aclname, aces in self.aclnames.items())
+
+    def test_case(self, name):
+        """
+        :param name: apply_intf entry name
+        :return: the entry, as ApData.acl_data['test_args']['apply_intf'][name]
+        """
+        return self.apply_intf[name]
+
+    def sequences(self, aclname):
+        """
+        :return: tuple of the sequence numbers of the ACL as int
+        """
+        return self._sequences[aclname]
+
+
+def compile_model(test_input_file, source_hash=None):
+    """
+    Parse, validate and freeze the input json.
+
+    :param test_input_file: path of acl_ap_input.json
+    :param source_hash: hash of the file, computed when not given
+    :return: AclModel
+    """
+    if source_hash is None:
+        source_hash = file_hash(test_input_file)
+    with open(test_input_file) as input_file:
+        data = json.load(input_file)
+    arguments = data['TestArguments']
+    acl = arguments['feature_configuration']['acl']
+    warnings = validate(acl)
+    for warning in warnings:
+        log.debug(warning)
+    interfaces = resolve_templates(arguments.get('interface_configuration', {}))
+    return AclModel(source_hash, freeze(resolve_templates(acl)), freeze(interfaces), tuple(warnings))
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as input_file:
+        for block in iter(lambda: input_file.read(1 << 16), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def default_cache_dir():
+    """
+    :return: $ACL_AP_MODEL_CACHE, else acl_ap_model under $XDG_CACHE_HOME or ~/.cache
+    """
+    if os.environ.get('ACL_AP_MODEL_CACHE'):
+        return os.environ['ACL_AP_MODEL_CACHE']
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'acl_ap_model')
+
+
+def _check_private(path, directory=False):
+    """
+    Refuse a cache path another user could have planted or can modify.
+
+    :raises OSError: when the path is not owned by the current user, is a
+                     symlink or is writable by group or others
+    """
+    info = os.lstat(path)
+    if stat.S_ISLNK(info.st_mode) or (stat.S_ISDIR(info.st_mode) != directory):
+        raise OSError("%s is not a plain %s" % (path, 'directory' if directory else 'file'))
+    if hasattr(os, 'getuid') and info.st_uid != os.getuid():
+        raise OSError("%s is not owned by the current user" % path)
+    if info.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+        raise OSError("%s is writable by other users" % path)
+
+
+def _private_dir(path):
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    _check_private(path, directory=True)
+    return path
+
+
+def _to_json(model):
+    return {'version': MODEL_VERSION, 'source_hash': model.source_hash, 'acl': model.acl,
+            'interfaces': model.interfaces, 'warnings': list(model.warnings)}
+
+
+def _from_json(data):
+    if data.get('version') != MODEL_VERSION:
+        raise ValueError("model version %r" % data.get('version'))
+    return AclModel(data['source_hash'], freeze(data['acl']), freeze(data['interfaces']), tuple(data['warnings']))
+
+
+def load_model(test_input_file, cache_dir=None):
+    """
+    Load the compiled model from the cache, compiling it on a miss.
+
+    The cache file name carries the input hash and MODEL_VERSION, so an
+    edited input file or a changed model layout never reads a stale model.
+    The cache directory is created 0700, and a directory or file not owned
+    by the current user, or writable by others, is not used. A cache that
+    cannot be read or written only costs a recompile.
+
+    :param test_input_file: path of acl_ap_input.json
+    :param cache_dir: cache directory, $ACL_AP_MODEL_CACHE or ~/.cache/acl_ap_model by default
+    :return: AclModel
+    """
+    cache_dir = cache_dir or default_cache_dir()
+    source_hash = file_hash(test_input_file)
+    cache_file = os.path.join(cache_dir, 'acl_model_v%d_%s.json' % (MODEL_VERSION, source_hash[:16]))
+    try:
+        _check_private(cache_dir, directory=True)
+        _check_private(cache_file)
+        with open(cache_file) as cached:
+            model = _from_json(json.load(cached))
+        if model.source_hash == source_hash:
+            log.info("ACL model loaded from %s" % cache_file)
+            return model
+    except Exception as err:
+        log.debug("ACL model cache miss (%s)" % err)
+
+    model = compile_model(test_input_file, source_hash)
+    try:
+        fd, tmp_file = tempfile.mkstemp(dir=_private_dir(cache_dir), suffix='.tmp')
+        with os.fdopen(fd, 'w') as cache:
+            json.dump(_to_json(model), cache)
+        os.replace(tmp_file, cache_file)
+        log.info("ACL model compiled to %s" % cache_file)
+    except OSError as err:
+        log.warning("Could not write ACL model cache: %s" % err)
+    return model
@@ -0,0 +1,255 @@
+# **************************************************
+# Copyright (c) 2017 Cisco Systems, Inc.
+# All rights reserved.
+# **************************************************
+
+"""
+Verify an ACL on several interface types in one pass.
+
+Tests like TestIPv4PortIngressAclLesserThan check Phy, then PhySub, then
+Bundle..., each step doing its own attach, clear, traffic window and hit
+count read. MultiInterfaceVerifier resolves every target with the
+contextualized helpers (no ApData writes), attaches the ACL to all of them
+in one commit, clears the counters of every line card concurrently, runs
+the streams of the targets in as few traffic windows as possible and checks
+every window from one HitCountSnapshot. The ACL is detached
+from all targets in one commit, also when the verification fails.
+
+    verifier = MultiInterfaceVerifier(ApData, AclBaseAp)
+    verifier.add('Phy', 'PortObjectGroupIngressAclPhy', ['peer1_In_TCP_Phy', 'peer1_In_UDP_Phy'], seqs)
+    verifier.add('PhySub', 'PortObjectGroupIngressAclPhySub', ['peer1_In_TCP_PhySub', 'peer1_In_UDP_PhySub'], seqs)
+    contexts = verifier.run()
+
+attach(), verify() and detach() are the phases of run(); a trigger matrix
+(acl_ap_trigger) attaches once and verifies after every trigger.
+
+Hardware counters are per ACL and line card, not per interface. Targets
+binding the same ACL and direction on one line card therefore get traffic
+windows of their own, so every hit count still tells which interface
+matched. Targets added with forwarded=True also need every stream's Rx
+within the tolerance of its Tx, the check of the get_acl_hit_count
+traffic argument.
+
+The bindings are pushed next to a ConfigDelta of the class: its pending
+releases are flushed first and it forgets the slots the verifier binds.
+"""
+
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from logger.cafylog import CafyLog
+from acl_ap_hitcount import HitCountSnapshot, HitTarget, expect_many
+from acl_ap_lazy import is_built
+from acl_ap_traffic import BatchTrafficVerifier
+
+log = CafyLog(name="AclMulti")
+
+InterfaceTarget = namedtuple('InterfaceTarget', ['name', 'case', 'streams', 'seqs', 'helper', 'interface',
+                                                 'forwarded'])
+
+
+class MultiInterfaceVerifier:
+    """
+    One attach, one traffic window and one hit count read for several interfaces.
+    """
+
+    def __init__(self, data, base, batch=None, tolerance=5, max_workers=None, bind_kwargs=None):
+        """
+        :param data: ApData
+        :param base: AclBaseAp, its helpers contextualized (acl_ap_context)
+        :param batch: BatchTrafficVerifier, a new one on data.Tgen by default
+        :param tolerance: allowed hit count difference in percent
+        :param max_workers: thread pool size, one thread per target by default
+        :param bind_kwargs: extra set_acl_to_interface arguments, e.g. {'compress_level': 3}
+        """
+        self.data = data
+        self.base = base
+        self.batch = batch or BatchTrafficVerifier(data.Tgen)
+        self.tolerance = tolerance
+        self.max_workers = max_workers
+        self.bind_kwargs = dict(bind_kwargs or {})
+        self.targets = OrderedDict()
+        self.contexts = OrderedDict()
+
+    def add(self, name, case, streams, seqs, helper='_get_tcs_data', interface=None, forwarded=False):
+        """
+        :param name: target name, e.g. 'Phy', 'PhySub', 'Bundle', 'BundleSub', 'BVI'
+        :param case: apply_intf entry name
+        :param streams: stream names, streams[i] hitting seqs[i]
+        :param seqs: sequence numbers
+        :param helper: AclBaseAp helper resolving the entry, '_get_bun_data' for bundles
+        :param interface: interface name overriding the one of the helper; by default
+                          '<interface>.<subint>' when the entry has a subint
+        :param forwarded: the streams are permitted, their Rx must match their Tx
+        """
+        if len(streams) != len(seqs):
+            raise ValueError("%s: %d streams for %d sequence numbers" % (name, len(streams), len(seqs)))
+        self.targets[name] = InterfaceTarget(name, case, list(streams), [int(seq) for seq in seqs], helper, interface,
+                                             forwarded)
+        return self
+
+    def _resolve(self, target):
+        """
+        :return: TestContext of the target with intf and locations
+        """
+        test_case = self.data.acl_model.apply_intf[target.case]
+        ctx = getattr(self.base, target.helper)(self.data, test_case=test_case, publish=False)
+        intf = target.interface
+        if intf is None and 'subint' in test_case and '.' not in str(ctx.intf):
+            intf = self.data.UUT1.get_local(ctx.link).name + '.' + test_case['subint']
+        if intf is not None:
+            ctx = ctx.evolve(intf=intf)
+        # a bundle is counted on the line cards of its members
+        members = [member.interface for member in ctx.member] if 'member' in ctx else [ctx.intf]
+        locations = []
+        for member in members:
+            located = self.base._get_loc_int(self.data, member, context=ctx, publish=False)
+            if located.hw_loc not in locations:
+                locations.append(located.hw_loc)
+        return ctx.evolve(hw_loc=locations[0], locations=locations)
+
+    def _pool(self, func, items):
+        items = list(items)
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=self.max_workers or len(items)) as pool:
+            return list(pool.map(func, items))
+
+    def _bind(self, mode):
+        if is_built(self.data, 'config_delta'):
+            delta = self.data.config_delta
+            delta.flush()
+            for ctx in self.contexts.values():
+                delta.forget_binding(ctx.addr_family, ctx.dir, ctx.intf)
+        with self.data.topo.config(self.data.UUT1, thread=True):
+            for ctx in self.contexts.values():
+                self.data.acl_uut.set_acl_to_interface(access_list_name=ctx.aclname, address_family=ctx.addr_family,
+                                                       direction=ctx.dir, interface=ctx.intf, mode=mode,
+                                                       **self.bind_kwargs)
+
+    def _hit_targets(self, names=None):
+        targets = []
+        for name, ctx in self.contexts.items():
+            if names is not None and name not in names:
+                continue
+            for location in ctx.locations:
+                target = HitTarget(ctx.addr_family, ctx.aclname, ctx.dir, location)
+                if target not in targets:
+                    targets.append(target)
+        return targets
+
+    def windows(self):
+        """
+        :return: lists of target names sharing a traffic window; targets binding
+                 the same ACL and direction on a line card never share one
+        """
+        windows = []
+        for name, ctx in self.contexts.items():
+            counters = set((ctx.aclname, ctx.dir, location) for location in ctx.locations)
+            for window, used in windows:
+                if not used & counters:
+                    window.append(name)
+                    used |= counters
+                    break
+            else:
+                windows.append(([name], counters))
+        return [window for window, _ in windows]
+
+    def expectations(self, stats, names=None):
+        """
+        :param stats: dict stream name -> stats dict of the traffic window
+        :param names: targets of the window, all of them by default
+        :return: list of HitExpectation; targets of one ACE and direction whose
+                 line cards overlap are summed up over the union of their line cards
+        """
+        groups = OrderedDict()
+        for name, target in self.targets.items():
+            if names is not None and name not in names:
+                continue
+            ctx = self.contexts[name]
+            for stream, seq in zip(target.streams, target.seqs):
+                locations, count = set(ctx.locations), int(stats[stream]['Tx Frames'])
+                merged = []
+                for group in groups.setdefault((ctx.aclname, seq, ctx.dir), []):
+                    if group[0] & locations:
+                        locations |= group[0]
+                        count += group[1]
+                    else:
+                        merged.append(group)
+                groups[(ctx.aclname, seq, ctx.dir)] = merged + [(locations, count)]
+        result = []
+        for (aclname, seq, direction), merged in groups.items():
+            for locations, count in merged:
+                result.extend(expect_many(aclname, [seq], [count], direction, sorted(locations), self.tolerance))
+        return result
+
+    def attach(self):
+        """
+        Resolve the targets and attach the ACL to all of them in one commit.
+
+        :return: OrderedDict target name -> TestContext
+        """
+        names = list(self.targets)
+        self.contexts = OrderedDict(zip(names, self._pool(self._resolve, self.targets.values())))
+        for name, ctx in self.contexts.items():
+            log.info("%s: %s on %s %s, line cards %s" % (name, ctx.aclname, ctx.intf, ctx.dir, ctx.locations))
+        self._bind("config")
+        return self.contexts
+
+    def _verify_forwarded(self, stats, names):
+        """
+        :raises AssertionError: when a stream of a forwarded target lost more than the tolerance
+        """
+        lost = []
+        for name in names:
+            if not self.targets[name].forwarded:
+                continue
+            for stream in self.targets[name].streams:
+                tx, rx = int(stats[stream]['Tx Frames']), int(stats[stream]['Rx Frames'])
+                if abs(tx - rx) * 100 > tx * self.tolerance:
+                    lost.append("%s %s: Tx %d, Rx %d" % (name, stream, tx, rx))
+        if lost:
+            raise AssertionError("Permitted traffic dropped: %s" % '; '.join(lost))
+
+    def verify(self):
+        """
+        Clear, run the traffic of the attached targets, in as few windows as the
+        shared counters allow, and verify.
+
+        :return: OrderedDict target name -> TestContext with its stream_stats
+        """
+        windows = self.windows()
+        for names in windows:
+            hit_targets = self._hit_targets(names)
+            self._pool(lambda target: self.data.acl_uut.clear_acl_stats(
+                access_list_name=target.acl, address_family=target.address_family, direction=target.direction,
+                interface=None, location=target.location), hit_targets)
+
+            stats = self.batch.run([self.targets[name].streams for name in names])
+            for name in names:
+                self.contexts[name] = self.contexts[name].evolve(
+                    stream_stats=OrderedDict((stream, stats[stream]) for stream in self.targets[name].streams))
+
+            snapshot = HitCountSnapshot.collect(self.data.acl_uut, hit_targets, self.max_workers)
+            snapshot.verify(self.expectations(stats, names))
+            self._verify_forwarded(stats, names)
+        log.info("Verified %s in %d traffic windows" % (', '.join(self.targets), len(windows)))
+        return self.contexts
+
+    def detach(self):
+        """
+        Detach the ACL from all targets in one commit.
+        """
+        self._bind("unconfig")
+
+    def run(self):
+        """
+        Attach, clear, run the traffic, verify and detach.
+
+        :return: OrderedDict target name -> TestContext with its stream_stats
+        """
+        self.attach()
+        try:
+            return self.verify()
+        finally:
+            self.detach()
@@ -0,0 +1,417 @@
+# **************************************************
+# Copyright (c) 2017 Cisco Systems, Inc.
+# All rights reserved.
+# **************************************************
+
+"""
+Cost aware ordering of the ACL test classes.
+
+Every test class gets a static profile read from its source: the hw-module
+profiles it configures (and whether teardown_class restores them), whether it
+reloads the router, loads scale ACLs or runs disruptive triggers (RPFO, card
+reload, process restart), and the ACLs and interfaces it touches through the
+apply_intf entries. The plugin then runs the classes as
+
+    plain classes, neighbours sharing the most ACLs and interfaces
+    scale ACL classes
+    disruptive classes
+    hw-module profile classes grouped by profile, profiles left
+    configured by the class last
+
+so reloads and re-convergence waits are paid once per group instead of being
+spread over the file. The methods of a class keep their order and class
+dependencies are honoured:
+
+    class TestB(AclBaseAp):
+        depends_on = ('TestA',)
+
+or @pytest.mark.dependency(depends=['TestA::test_a']). A class can correct
+its inferred profile with an ``order_profile`` dict, e.g.
+``order_profile = {'disruptive': True}``.
+
+    pytest -p acl_ap_order acl_ap_main.py                     # cost order
+    pytest -p acl_ap_order --acl-order=profile acl_ap_main.py # plain classes keep the file order
+    ACL_AP_ORDER=off pytest -p acl_ap_order acl_ap_main.py    # file order
+"""
+
+import ast
+import inspect
+import os
+from collections import OrderedDict
+
+from logger.cafylog import CafyLog
+
+log = CafyLog(name="AclOrder")
+
+ORDER_MODES = ('cost', 'profile', 'off')
+
+PROFILE_PREFIXES = ('set_hw_module_profile', 'set_hardware_profile', 'set_ingress_model_peering')
+RELOAD_CALLS = ('_set_VmReload',)
+SCALE_CALLS = ('configure_aclace_scale', 'remove_acl_scale')
+PLANNER_CALLS = ('ensure', 'release')
+DISRUPTIVE_CALLS = ('ReloadActiveRP', 'ReloadAllCards', 'ReloadCard', 'RedundancySwitchOver', 'Process',
+                    'ProcessRestart')
+
+# module name -> ClassProfile list in run order, read by acl_ap_hwprofile through planned_hw_profiles()
+PLAN = {}
+
+TIER_PLAIN, TIER_SCALE, TIER_DISRUPTIVE, TIER_PROFILE, TIER_PERSISTENT = range(5)
+
+
+class ClassProfile:
+    """
+    What a test class needs from the router, as far as ordering is concerned.
+    """
+
+    def __init__(self, name, index, hw_profiles=(), restored=True, reload=False, scale=False,
+                 disruptive=False, cases=(), acls=(), interfaces=(), depends_on=()):
+        self.name = name
+        self.index = index
+        self.hw_profiles = frozenset(hw_profiles)
+        self.restored = restored
+        self.reload = reload
+        self.scale = scale
+        self.disruptive = disruptive
+        self.cases = frozenset(cases)
+        self.acls = frozenset(acls)
+        self.interfaces = frozenset(interfaces)
+        self.depends_on = tuple(depends_on)
+
+    @property
+    def tier(self):
+        if self.hw_profiles:
+            return TIER_PROFILE if self.restored else TIER_PERSISTENT
+        if self.disruptive or self.reload:
+            return TIER_DISRUPTIVE
+        if self.scale:
+            return TIER_SCALE
+        return TIER_PLAIN
+
+    @property
+    def footprint(self):
+        return self.acls | self.interfaces
+
+    def churn(self, other):
+        """
+        :return: 0.0 when both classes touch the same ACLs and interfaces, 1.0 when nothing is shared
+        """
+        union = self.footprint | other.footprint
+        if not union:
+            return 1.0
+        return 1.0 - len(self.footprint & other.footprint) / float(len(union))
+
+    def __repr__(self):
+        return "ClassProfile(%s, tier=%d, hw_profiles=%s)" % (self.name, self.tier, sorted(self.hw_profiles))
+
+
+def _call_name(node):
+    func = node.func
+    if isinstance(func, ast.Attribute):
+        return func.attr
+    if isinstance(func, ast.Name):
+        return func.id
+    return None
+
+
+def _disables(node):
+    for keyword in node.keywords:
+        if keyword.arg in ('enable', 'mode') and isinstance(keyword.value, ast.Constant) \
+                and keyword.value.value in (False, 'unconfig', 'delete'):
+            return True
+    return False
+
+
+def _subscript_key(node):
+    key = node.slice
+    if type(key).__name__ == 'Index':
+        # python < 3.9
+        key = key.value
+    if isinstance(key, ast.Constant) and isinstance(key.value, str):
+        return key.value
+    return None
+
+
+def _receiver_name(node):
+    func = node.func
+    if isinstance(func, ast.Attribute) and isinstance(func.value, ast.Attribute):
+        return func.value.attr
+    return None
+
+
+def _subscript_owner(node):
+    value = node.value
+    if isinstance(value, ast.Attribute):
+        return value.attr
+    if isinstance(value, ast.Subscript):
+        return _subscript_key(value)
+    return None
+
+
+def test_class_nodes(module_file):
+    """
+    Parse a test module once.
+
+    :param module_file: test module
+    :return: OrderedDict class name -> ast.ClassDef of its Test classes, in file order
+    """
+    with open(module_file) as source_file:
+        tree = ast.parse(source_file.read())
+    return OrderedDict((node.name, node) for node in tree.body
+                       if isinstance(node, ast.ClassDef) and node.name.startswith('Test'))
+
+
+def scan_node(tree):
+    """
+    Static facts of a test class.
+
+    :param tree: ast of the class, e.g. from test_class_nodes()
+    :return: dict with hw_profiles, restored, reload, scale, disruptive, cases and acls
+    """
+    configured, released = set(), set()
+    facts = {'reload': False, 'scale': False, 'disruptive': False, 'cases': set(), 'acls': set()}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call):
+            name = _call_name(node)
+            if not name:
+                continue
+            if name.startswith(PROFILE_PREFIXES):
+                (released if _disables(node) else configured).add(name)
+            elif name in PLANNER_CALLS and _receiver_name(node) == 'hw_profiles' and node.args \
+                    and isinstance(node.args[0], ast.Constant):
+                # ApData.hw_profiles.ensure('qos_ingress_peering') / .release(...), see acl_ap_hwprofile
+                if name == 'ensure':
+                    configured.add(node.args[0].value)
+                    facts['reload'] = True
+                else:
+                    released.add(node.args[0].value)
+            elif name in RELOAD_CALLS:
+                facts['reload'] = True
+            elif name in SCALE_CALLS or (name == 'load' and _receiver_name(node) == 'scale_loader'):
+                facts['scale'] = True
+            elif name in DISRUPTIVE_CALLS:
+                facts['disruptive'] = True
+            for keyword in node.keywords:
+                if keyword.arg in ('access_list_name', 'aclname') and isinstance(keyword.value, ast.Constant) \
+                        and isinstance(keyword.value.value, str):
+                    facts['acls'].add(keyword.value.value)
+        elif isinstance(node, ast.Subscript):
+            key = _subscript_key(node)
+            owner = _subscript_owner(node)
+            if key is None:
+                continue
+            if owner == 'apply_intf':
+                facts['cases'].add(key)
+            elif owner in ('aclnames', 'add_ace', 'aclname_scale'):
+                facts['acls'].add(key)
+    facts['hw_profiles'] = configured
+    facts['restored'] = configured <= released
+    return facts
+
+
+def _dependency_marks(cls, items):
+    depends = []
+    marks = list(getattr(cls, 'pytestmark', []))
+    for item in items:
+        marks.extend(item.iter_markers('dependency'))
+    for mark in marks:
+        if mark.name == 'dependency':
+            depends.extend(name.split('::')[0] for name in mark.kwargs.get('depends', ()))
+    return depends
+
+
+def _module_nodes(module):
+    """
+    :return: test_class_nodes() of the module, empty when its source cannot be read
+    """
+    try:
+        return test_class_nodes(inspect.getsourcefile(module))
+    except (OSError, TypeError, SyntaxError) as err:
+        log.debug("No source profiles for %s: %s" % (getattr(module, '__name__', module), err))
+        return OrderedDict()
+
+
+def profile_class(cls, index, items=(), model=None, node=None):
+    """
+    :param cls: test class
+    :param index: position of the class in the file
+    :param items: collected items of the class, for their dependency marks
+    :param model: AclModel resolving the apply_intf entries to ACLs and interfaces
+    :param node: ast.ClassDef of the class from test_class_nodes(); None has no source profile
+    :return: ClassProfile
+    """
+    if node is not None:
+        facts = scan_node(node)
+    else:
+        log.debug("No source profile for %s" % cls.__name__)
+        facts = {'hw_profiles': set(), 'restored': True, 'reload': False, 'scale': False,
+                 'disruptive': False, 'cases': set(), 'acls': set()}
+    interfaces = set()
+    if model is not None:
+        for case in facts['cases']:
+            entry = model.apply_intf.get(case)
+            if entry:
+                facts['acls'].update(name for name in str(entry.get('aclname', '')).split() if name != 'common')
+                interfaces.update(str(entry.get('intf_list', '')).split())
+    facts['interfaces'] = interfaces
+    depends = [name for name in tuple(getattr(cls, 'depends_on', ())) + tuple(_dependency_marks(cls, items))
+               if name != cls.__name__]
+    facts['depends_on'] = list(OrderedDict.fromkeys(depends))
+    facts.update(getattr(cls, 'order_profile', {}))
+    return ClassProfile(cls.__name__, index, **facts)
+
+
+def _nearest_neighbour(profiles):
+    """
+    Greedy chain through the profiles, each step going to the class sharing
+    the most ACLs and interfaces with the previous one, file order breaking ties.
+    """
+    if not profiles:
+        return []
+    remaining = list(profiles)
+    chain = [remaining.pop(0)]
+    while remaining:
+        last = chain[-1]
+        best = min(remaining, key=lambda profile: (last.churn(profile), profile.index))
+        remaining.remove(best)
+        chain.append(best)
+    return chain
+
+
+def preferred_order(profiles, mode='cost'):
+    """
+    :param profiles: ClassProfile list in file order
+    :param mode: 'cost' also chains the plain classes on shared config, 'profile' only moves the costly classes
+    :return: ClassProfile list in the preferred run order, dependencies not applied yet
+    """
+    tiers = OrderedDict((tier, []) for tier in range(TIER_PERSISTENT + 1))
+    for profile in profiles:
+        tiers[profile.tier].append(profile)
+    if mode == 'cost':
+        tiers[TIER_PLAIN] = _nearest_neighbour(tiers[TIER_PLAIN])
+    for tier in (TIER_PROFILE, TIER_PERSISTENT):
+        groups = OrderedDict()
+        for profile in tiers[tier]:
+            groups.setdefault(profile.hw_profiles, []).append(profile)
+        tiers[tier] = [profile for group in groups.values() for profile in group]
+    return [profile for tier in tiers.values() for profile in tier]
+
+
+def apply_dependencies(order):
+    """
+    Move every class after the classes it depends on, the preferred order breaking ties.
+
+    :param order: ClassProfile list in the preferred order
+    :return: ClassProfile list; dependencies on classes not collected are ignored,
+             a dependency cycle keeps the preferred order for the classes in it
+    """
+    names = set(profile.name for profile in order)
+    pending = OrderedDict((profile.name, set(dep for dep in profile.depends_on if dep in names))
+                          for profile in order)
+    by_name = dict((profile.name, profile) for profile in order)
+    ordered = []
+    while pending:
+        ready = [name for name, deps in pending.items() if not deps]
+        if not ready:
+            log.warning("Class dependency cycle between %s, keeping their order" % ', '.join(pending))
+            ready = list(pending)
+        name = ready[0]
+        ordered.append(by_name[name])
+        del pending[name]
+        for deps in pending.values():
+            deps.discard(name)
+    return ordered
+
+
+def plan_cost(order):
+    """
+    Rough cost of a run order.
+
+    :return: dict with profile_switches (hw-module profile changes between
+             neighbouring profile classes), disruptions (runs of disruptive
+             classes, each one re-converging the testbed), scale_loads (runs of
+             scale classes) and churn (ACL/interface changes between neighbours)
+    """
+    cost = {'profile_switches': 0, 'disruptions': 0, 'scale_loads': 0, 'churn': 0.0}
+    previous = None
+    last_profiles = frozenset()
+    for profile in order:
+        if profile.hw_profiles:
+            if profile.hw_profiles != last_profiles:
+                cost['profile_switches'] += 1
+            last_profiles = profile.hw_profiles
+        if profile.tier == TIER_DISRUPTIVE and (previous is None or previous.tier != TIER_DISRUPTIVE):
+            cost['disruptions'] += 1
+        if profile.tier == TIER_SCALE and (previous is None or previous.tier != TIER_SCALE):
+            cost['scale_loads'] += 1
+        if previous is not None:
+            cost['churn'] += previous.churn(profile)
+        previous = profile
+    cost['churn'] = round(cost['churn'], 1)
+    return cost
+
+
+def _model_of(module):
+    data = getattr(module, 'ApData', None)
+    try:
+        return data.acl_model if data is not None else None
+    except Exception as err:
+        log.debug("No ACL model for ordering: %s" % err)
+        return None
+
+
+def order_items(items, mode='cost'):
+    """
+    Reorder collected items class by class, module by module.
+
+    :param items: pytest items, modified in place
+    :param mode: one of ORDER_MODES; 'off' only records the plan
+    :return: dict module name -> (cost before, cost after)
+    """
+    modules = OrderedDict()
+    for item in items:
+        module = getattr(item, 'module', None)
+        groups = modules.setdefault(module, OrderedDict())
+        groups.setdefault(getattr(item, 'cls', None), []).append(item)
+
+    reordered = []
+    costs = {}
+    for module, groups in modules.items():
+        loose = groups.pop(None, [])
+        model = _model_of(module)
+        nodes = _module_nodes(module)
+        profiles = [profile_class(cls, index, cls_items, model, nodes.get(cls.__name__))
+                    for index, (cls, cls_items) in enumerate(groups.items())]
+        order = profiles if mode == 'off' else apply_dependencies(preferred_order(profiles, mode))
+        PLAN[getattr(module, '__name__', str(module))] = order
+        by_name = dict((cls.__name__, cls_items) for cls, cls_items in groups.items())
+        reordered.extend(loose)
+        for profile in order:
+            reordered.extend(by_name[profile.name])
+        name = getattr(module, '__name__', str(module))
+        costs[name] = (plan_cost(profiles), plan_cost(order))
+        log.info("Class order of %s: %s -> %s" % (name, costs[name][0], costs[name][1]))
+        for profile in order:
+            if profile.tier != TIER_PLAIN:
+                log.debug("%-70s tier %d %s" % (profile.name, profile.tier, ' '.join(sorted(profile.hw_profiles))))
+    items[:] = reordered
+    return costs
+
+
+def planned_hw_profiles(module_name):
+    """
+    :param module_name: test module name
+    :return: hw-module profiles of the selected classes of the module, None
+             when the module was not collected with this plugin
+    """
+    if module_name not in PLAN:
+        return None
+    return [name for profile in PLAN[module_name] for name in sorted(profile.hw_profiles)]
+
+
+def pytest_addoption(parser):
+    parser.addoption('--acl-order', choices=ORDER_MODES, default=os.environ.get('ACL_AP_ORDER', 'cost'),
+                     help="order of the ACL test classes: cost (default), profile or off (file order)")
+
+
+def pytest_collection_modifyitems(session, config, items):
+    order_items(items, config.getoption('--acl-order'))
@@ -0,0 +1,291 @@
+# **************************************************
+# Copyright (c) 2017 Cisco Systems, Inc.
+# All rights reserved.
+# **************************************************
+
+"""
+Traffic outage of the HA triggers.
+
+TestTriggersAcl and TestHATriggersAcl compare hit counts before and after
+RPFO, RP or line card reloads, which says nothing about how long the traffic
+stopped. OutageMonitor keeps the affected streams running while the trigger
+fires, samples their Tx/Rx frame counters every interval and, once the
+streams have converged again (or settle seconds after the trigger), stops
+the traffic, waits for the Rx counters to stop moving and computes per
+stream:
+
+- lost frames, Tx - Rx;
+- the outage in milliseconds, lost frames over the steady state Tx rate
+  sampled for steady seconds before the trigger;
+- the convergence curve, the delivered share of every sampling interval.
+
+Every frame a stream does not deliver counts as outage, so the streams must
+be permitted by the ACL under test; a stream delivering less than the
+recovered share before the trigger is rejected with a ValueError.
+
+    with OutageMonitor(ApData.Tgen, ['peer1_In_TCP_Phy'], trigger='rpfo'):
+        verifiers.run()
+
+Every measurement goes to OUTAGES, which logs the worst outage per trigger
+type against its SLA and writes outage_<stamp>.json next to the timing
+reports. ACL_AP_OUTAGE_SLA sets the SLAs in milliseconds, e.g.
+"rpfo=50,reload_active_rp=1000"; an outage over its SLA fails the test.
+ACL_AP_OUTAGE_INTERVAL sets the sampling interval in seconds.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from logger.cafylog import CafyLog
+from acl_ap_traffic import query_traffic_stats
+
+log = CafyLog(name="AclOutage")
+
+Sample = namedtuple('Sample', ['offset', 'tx', 'rx'])
+
+
+def parse_sla(text):
+    """
+    :param text: "trigger=ms,trigger=ms"
+    :return: dict trigger -> SLA in milliseconds
+    """
+    sla = {}
+    for item in filter(None, (part.strip() for part in (text or '').split(','))):
+        trigger, _, value = item.partition('=')
+        sla[trigger.strip()] = float(value)
+    return sla
+
+
+def convergence_curve(samples):
+    """
+    :param samples: Sample list of one stream
+    :return: list of (offset in seconds, delivered share of the interval ending there)
+    """
+    curve = []
+    for previous, sample in zip(samples, samples[1:]):
+        sent = sample.tx - previous.tx
+        if sent > 0:
+            curve.append((round(sample.offset, 3), round(min(1.0, max(0.0, (sample.rx - previous.rx) / sent)), 4)))
+    return curve
+
+
+class OutageResult:
+    """
+    Outage of one stream during one trigger.
+    """
+
+    def __init__(self, trigger, stream, tx, rx, rate, samples):
+        """
+        :param tx: Tx frames of the whole measurement
+        :param rx: Rx frames of the whole measurement, read once they stopped changing
+        :param rate: steady state Tx frames per second before the trigger
+        :param samples: Sample list of the stream
+        """
+        self.trigger = trigger
+        self.stream = stream
+        self.tx = tx
+        self.rx = rx
+        self.lost = max(0, tx - rx)
+        self.rate = rate
+        self.outage_ms = self.lost * 1000.0 / self.rate if self.rate else 0.0
+        self.curve = convergence_curve(samples)
+
+    def as_dict(self):
+        return OrderedDict([('trigger', self.trigger), ('stream', self.stream), ('tx', self.tx), ('rx', self.rx),
+                            ('lost', self.lost), ('rate', round(self.rate, 1)),
+                            ('outage_ms', round(self.outage_ms, 1)), ('curve', self.curve)])
+
+
+class OutageLog:
+    """
+    Outages of the run, per trigger type.
+    """
+
+    def __init__(self, sla=None):
+        self.results = []
+        self.sla = sla if sla is not None else parse_sla(os.environ.get('ACL_AP_OUTAGE_SLA'))
+
+    def add(self, result):
+        self.results.append(result)
+
+    def worst(self):
+        """
+        :return: OrderedDict trigger -> worst OutageResult
+        """
+        worst = OrderedDict()
+        for result in self.results:
+            if result.trigger not in worst or result.outage_ms > worst[result.trigger].outage_ms:
+                worst[result.trigger] = result
+        return worst
+
+    def violations(self, results=None):
+        """
+        :return: results over the SLA of their trigger
+        """
+        return [result for result in (self.results if results is None else results)
+                if result.trigger in self.sla and result.outage_ms > self.sla[result.trigger]]
+
+    def report(self):
+        for trigger, result in self.worst().items():
+            sla = self.sla.get(trigger)
+            log.info("Outage %-20s worst %.1fms (%s, %d frames lost)%s"
+                     % (trigger, result.outage_ms, result.stream, result.lost,
+                        '' if sla is None else ', SLA %.0fms' % sla))
+
+    def write(self, directory):
+        """
+        :return: path of outage_<stamp>.json
+        """
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, 'outage_%s.json' % time.strftime('%Y%m%d_%H%M%S'))
+        with open(path, 'w') as report_file:
+            json.dump({'sla': self.sla, 'results': [result.as_dict() for result in self.results]}, report_file,
+                      indent=2)
+        log.info("Outage report written to %s" % path)
+        return path
+
+
+OUTAGES = OutageLog()
+
+
+class OutageMonitor:
+    """
+    Continuous traffic around a trigger, see the module docstring.
+    """
+
+    def __init__(self, tgen, streams, trigger, interval=None, settle=60, steady=5, recovered=0.99,
+                 registry=OUTAGES):
+        """
+        :param tgen: traffic generator device
+        :param streams: permitted streams crossing the triggered node
+        :param trigger: trigger type the outage is booked against, e.g. 'rpfo'
+        :param interval: sampling interval in seconds, ACL_AP_OUTAGE_INTERVAL or 1
+        :param settle: seconds to wait after the trigger for the streams to converge, and
+                       after stopping them for the Rx counters to stop changing
+        :param steady: seconds of traffic sampled before the trigger for the Tx rate
+        :param recovered: delivered share of an interval counting as converged
+        :param registry: OutageLog the results are added to
+        """
+        self.tgen = tgen
+        self.streams = list(streams)
+        self.trigger = trigger
+        self.interval = interval or float(os.environ.get('ACL_AP_OUTAGE_INTERVAL', 1))
+        self.settle = settle
+        self.steady = steady
+        self.recovered = recovered
+        self.registry = registry
+        self.samples = OrderedDict((stream, []) for stream in self.streams)
+        self.results = OrderedDict()
+        self.rates = OrderedDict()
+        self.stop = threading.Event()
+        self.thread = None
+        self.started = None
+
+    def _sample(self):
+        stats = query_traffic_stats(self.tgen)
+        offset = time.monotonic() - self.started
+        for stream in self.streams:
+            if stream in stats:
+                self.samples[stream].append(Sample(offset, int(stats[stream]['Tx Frames']),
+                                                   int(stats[stream]['Rx Frames'])))
+        return stats
+
+    def _run(self):
+        while not self.stop.wait(self.interval):
+            try:
+                self._sample()
+            except Exception as err:
+                log.debug("outage sample failed: %s" % err)
+
+    def converged(self):
+        """
+        :return: True when the last interval of every stream delivered its traffic
+        """
+        for samples in self.samples.values():
+            curve = convergence_curve(samples[-2:])
+            if not curve or curve[-1][1] < self.recovered:
+                return False
+        return True
+
+    def _steady_state(self):
+        """
+        Sample the streams over steady seconds before the trigger.
+
+        :raises ValueError: when a stream is not delivered, i.e. not permitted
+        """
+        time.sleep(self.interval)
+        self._sample()
+        time.sleep(self.steady)
+        self._sample()
+        dropped = []
+        for stream, samples in self.samples.items():
+            if len(samples) < 2 or samples[-1].offset <= samples[-2].offset:
+                dropped.append("%s: no stats" % stream)
+                continue
+            first, last = samples[-2], samples[-1]
+            self.rates[stream] = (last.tx - first.tx) / (last.offset - first.offset)
+            curve = convergence_curve([first, last])
+            if not curve or curve[-1][1] < self.recovered:
+                dropped.append("%s: %s of the frames delivered" % (stream, curve[-1][1] if curve else 0))
+        if dropped:
+            raise ValueError("Outage of %s needs permitted streams running before the trigger, %s"
+                             % (self.trigger, ', '.join(dropped)))
+
+    def _quiesce(self):
+        """
+        :return: stats once the Rx counters of the streams stopped changing, or after settle seconds
+        """
+        deadline = time.monotonic() + self.settle
+        stats = query_traffic_stats(self.tgen)
+        while time.monotonic() < deadline:
+            time.sleep(self.interval)
+            previous, stats = stats, query_traffic_stats(self.tgen)
+            if all(stream in stats and stream in previous
+                   and stats[stream]['Rx Frames'] == previous[stream]['Rx Frames'] for stream in self.streams):
+                break
+        else:
+            log.warning("Rx of %s still changing %.0fs after stopping the traffic" % (self.trigger, self.settle))
+        return stats
+
+    def __enter__(self):
+        if self.tgen.platform != 'IXIA':
+            self.tgen._perform('ResultClearAllTrafficCommand')
+        self.tgen.start_traffic(traffic_list=self.streams)
+        self.started = time.monotonic()
+        try:
+            self._steady_state()
+        except Exception:
+            self.tgen.stop_traffic(traffic_list=self.streams)
+            raise
+        self.thread = threading.Thread(target=self._run, name='outage-%s' % self.trigger, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        deadline = time.monotonic() + self.settle
+        while exc_type is None and not self.converged() and time.monotonic() < deadline:
+            time.sleep(self.interval)
+        self.stop.set()
+        self.thread.join()
+        self.tgen.stop_traffic(traffic_list=self.streams)
+        stats = self._quiesce()
+        for stream in self.streams:
+            if stream not in stats:
+                log.warning("No traffic stats for %s after %s" % (stream, self.trigger))
+                continue
+            result = OutageResult(self.trigger, stream, int(stats[stream]['Tx Frames']),
+                                  int(stats[stream]['Rx Frames']), self.rates[stream], self.samples[stream])
+            self.results[stream] = result
+            self.registry.add(result)
+            log.info("%s: %s lost %d frames, %.1fms outage" % (self.trigger, stream, result.lost, result.outage_ms))
+        if exc_type is None:
+            violations = self.registry.violations(self.results.values())
+            if violations:
+                raise AssertionError("Outage over the %s SLA of %.0fms: %s"
+                                     % (self.trigger, self.registry.sla[self.trigger],
+                                        ', '.join('%s %.1fms' % (result.stream, result.outage_ms)
+                                                  for result in violations)))
+        return False
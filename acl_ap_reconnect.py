@@ -0,0 +1,241 @@
+# **************************************************
+# Copyright (c) 2017 Cisco Systems, Inc.
+# All rights reserved.
+# **************************************************
+
+"""
+Reconnect aware feature library objects of R1.
+
+After every reload or RPFO the tests rebuilt ApData.acl_uut with the new
+active RP and blocked on the new session, and some classes rebuilt Acl and
+IfMgr objects just in case. DeviceSession hands out proxies around the
+feature library objects of a device:
+
+- reconnect() returns at once; a background thread polls the router until
+  it reports its active RP, then rebuilds every library object in use,
+  concurrently. Calls made meanwhile wait for it;
+- check() reconnects only when the active RP is not the one the objects
+  were built for;
+- a read or execute call (get_, verify_, show, clear_ ...) failing on a lost
+  session triggers the reconnect and is replayed once on the new object. A
+  configuration call may have been partly committed, so it triggers the
+  reconnect and raises;
+- a failed reconnect is raised by every call until a reconnect succeeds.
+
+    acl_uut = LazyAttr(lambda cls: cls.sessions.proxy('acl', _acl_uut))
+    ...
+    verifiers.run()                          # RPFO
+    ApData.sessions.reconnect('RPFO')
+    ApData.acl_uut.clear_acl_stats(...)      # waits for the new session
+
+ACL_AP_RECONNECT_POLL and ACL_AP_RECONNECT_TIMEOUT set the readiness
+polling interval and the time a reconnect may take, in seconds.
+"""
+
+import inspect
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from logger.cafylog import CafyLog
+
+log = CafyLog(name="AclReconnect")
+
+SESSION_LOST = re.compile(r'connection (closed|lost|reset|refused|timed out)|session (closed|lost|disconnected|down)|'
+                          r'not connected|broken pipe|\bEOF\b', re.IGNORECASE)
+
+REPLAYABLE = ('get_', 'verify_', 'show', 'clear_', 'check_', 'is_')
+
+
+def session_lost(err):
+    """
+    :return: True when the exception says the device session went away
+    """
+    return isinstance(err, (EOFError, ConnectionError)) or bool(SESSION_LOST.search('%s %s' % (type(err).__name__,
+                                                                                               err)))
+
+
+def replayable(name):
+    """
+    :return: True when the library call only reads or executes, so replaying it commits nothing twice
+    """
+    return name.startswith(REPLAYABLE)
+
+
+class LibraryProxy:
+    """
+    Stand in for one feature library object, rebuilt by its DeviceSession.
+    """
+
+    def __init__(self, session, name, build):
+        object.__setattr__(self, '_session', session)
+        object.__setattr__(self, '_name', name)
+        object.__setattr__(self, '_build', build)
+        object.__setattr__(self, '_target', None)
+        object.__setattr__(self, '_lock', threading.Lock())
+
+    def _rebuild(self, active_rp):
+        target = self._build(active_rp)
+        with self._lock:
+            object.__setattr__(self, '_target', target)
+        return target
+
+    def _get(self):
+        self._session.wait()
+        with self._lock:
+            target = self._target
+        return target if target is not None else self._rebuild(self._session.active_rp)
+
+    def _replaying(self, name, method):
+
+        def call(*args, **kwargs):
+            generation = self._session.generation
+            try:
+                return method(*args, **kwargs)
+            except Exception as err:
+                if not session_lost(err):
+                    raise
+                if not replayable(name):
+                    log.error("%s.%s lost the session (%s), not replayed: the configuration may be partly committed"
+                              % (self._name, name, err))
+                    self._session.reconnect('%s.%s: %s' % (self._name, name, err), generation=generation)
+                    raise
+                log.warning("%s.%s lost the session (%s), replaying after the reconnect" % (self._name, name, err))
+                self._session.reconnect('%s.%s: %s' % (self._name, name, err), generation=generation)
+                self._session.replayed += 1
+                return getattr(self._get(), name)(*args, **kwargs)
+        call.__name__ = name
+        call.__doc__ = method.__doc__
+        return call
+
+    def __getattr__(self, name):
+        value = getattr(self._get(), name)
+        if callable(value) and not inspect.isclass(value):
+            return self._replaying(name, value)
+        return value
+
+    def __setattr__(self, name, value):
+        setattr(self._get(), name, value)
+
+    def __repr__(self):
+        return "LibraryProxy(%s, %r)" % (self._name, self._target)
+
+
+class DeviceSession:
+    """
+    Sessions of the feature library objects of one device, see the module docstring.
+    """
+
+    def __init__(self, device, get_active_rp, poll=None, timeout=None):
+        """
+        :param device: router
+        :param get_active_rp: callable returning the active RP, raising while the router is not ready
+        :param poll: seconds between readiness polls, ACL_AP_RECONNECT_POLL or 10
+        :param timeout: seconds a reconnect may take, ACL_AP_RECONNECT_TIMEOUT or 1800
+        """
+        self.device = device
+        self.get_active_rp = get_active_rp
+        self.poll = poll or float(os.environ.get('ACL_AP_RECONNECT_POLL', 10))
+        self.timeout = timeout or float(os.environ.get('ACL_AP_RECONNECT_TIMEOUT', 1800))
+        self.proxies = []
+        self.active_rp = None
+        self.generation = 0
+        self.ready = threading.Event()
+        self.ready.set()
+        self.lock = threading.Lock()
+        self.error = None
+        self.reconnects = []
+        self.replayed = 0
+
+    def proxy(self, name, build):
+        """
+        :param name: library name, for the logs
+        :param build: callable taking the active RP (None until the first reconnect) and returning the object
+        :return: LibraryProxy
+        """
+        proxy = LibraryProxy(self, name, build)
+        self.proxies.append(proxy)
+        return proxy
+
+    def _wait_ready(self):
+        if not self.ready.wait(self.timeout):
+            raise TimeoutError("%s not reconnected after %.0fs" % (self.device, self.timeout))
+
+    def wait(self):
+        """
+        Block until no reconnect is running.
+
+        :raises: the error of the last reconnect, until a reconnect succeeds
+        """
+        self._wait_ready()
+        if self.error is not None:
+            raise self.error
+
+    def reconnect(self, reason, generation=None):
+        """
+        Start a reconnect in the background, unless one is running already.
+
+        :param reason: why, for the logs
+        :param generation: generation the caller saw; no new reconnect when it has changed since
+        """
+        with self.lock:
+            if not self.ready.is_set() or (generation is not None and generation != self.generation):
+                return
+            self.ready.clear()
+        log.info("Reconnecting %s: %s" % (self.device, reason))
+        threading.Thread(target=self._reconnect, args=(reason,), name='reconnect', daemon=True).start()
+
+    def _poll_active_rp(self):
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                active_rp = self.get_active_rp()
+                if active_rp:
+                    return active_rp
+            except Exception as err:
+                log.debug("%s not ready: %s" % (self.device, err))
+            if time.monotonic() > deadline:
+                raise TimeoutError("%s did not report an active RP within %.0fs" % (self.device, self.timeout))
+            time.sleep(self.poll)
+
+    def _reconnect(self, reason):
+        start = time.monotonic()
+        try:
+            self.active_rp = self._poll_active_rp()
+            built = [proxy for proxy in self.proxies if proxy._target is not None]
+            if built:
+                with ThreadPoolExecutor(max_workers=len(built)) as pool:
+                    list(pool.map(lambda proxy: proxy._rebuild(self.active_rp), built))
+            self.generation += 1
+            self.error = None
+            self.reconnects.append((reason, time.monotonic() - start))
+            log.info("%s reconnected on %s in %.1fs, %d libraries rebuilt"
+                     % (self.device, self.active_rp, time.monotonic() - start, len(built)))
+        except Exception as err:
+            log.error("Reconnect of %s failed: %s" % (self.device, err))
+            self.error = err
+        finally:
+            self.ready.set()
+
+    def check(self):
+        """
+        Reconnect when the active RP differs from the one the objects were built for,
+        or when the last reconnect failed.
+
+        :return: True when a reconnect was started
+        """
+        self._wait_ready()
+        if self.error is not None:
+            self.reconnect("last reconnect failed: %s" % self.error)
+            return True
+        active_rp = self.get_active_rp()
+        if active_rp == self.active_rp:
+            return False
+        self.reconnect("active RP %s, was %s" % (active_rp, self.active_rp))
+        return True
+
+    def report(self):
+        log.info("Sessions of %s: %d reconnects (%.1fs in the background), %d calls replayed"
+                 % (self.device, len(self.reconnects), sum(seconds for _, seconds in self.reconnects), self.replayed))
@@ -0,0 +1,235 @@
+# **************************************************
+# Copyright (c) 2017 Cisco Systems, Inc.
+# All rights reserved.
+# **************************************************
+
+"""
+Streaming scale ACL builder.
+
+Zap.configure_aclace_scale renders a whole aclname_scale profile and pushes
+it in one topo.config() commit. chunk_profiles() splits a profile entry
+into entries of chunk_size ACEs, each starting chunk_size * step addresses
+further with its sequence numbers and permit range shifted along, and
+ScaleAclLoader has Zap render and commit them one after the other, so a
+10k ACE profile never exists as a whole in memory and the ACEs are exactly
+the ones Zap renders. Every chunk is timed, which gives the programming
+throughput for a chunk size:
+
+    ApData.scale_loader.load(ApData.acl_data['aclname_scale']['permit_egress_scale'],
+                             src='185.0.0.1', dest='195.0.0.1')
+    ApData.scale_loader.sweep(profile, '185.0.0.1', '195.0.0.1', chunk_sizes=(100, 500, 2000))
+
+Entries with more than one ACL ('number of acls') are left to Zap whole.
+Commits run one at a time: XR commits on one router are serialized, and
+concurrent topo.config() blocks on the same device would interleave their
+config sessions. ACL_AP_SCALE_CHUNK sets the default chunk size of
+ApData.scale_loader.
+
+scale_aclnames() are the ACLs Zap creates for a profile, aclname_1 up to
+aclname_<number of acls>; scale_aces() is the ACE layout of each of them
+the sim backend renders in place of Zap: ACE i (0 based) gets sequence number sequence_number + i,
+host source src + i * step and host destination dest + i * step (prefix
+widens them to subnets), the first protocol of protocol_name, and permit
+inside [action_permit_start_for_multiple_ace,
+action_permit_end_for_multiple_ace] (1 based), deny outside.
+"""
+
+import ipaddress
+import time
+
+from logger.cafylog import CafyLog
+
+log = CafyLog(name="AclScale")
+
+DEFAULT_CHUNK = 500
+
+
+def _protocol(profile):
+    """
+    :return: protocol of the profile, protocol_name being a list closed by 'end'
+    """
+    protocol = profile.get('protocol_name', 'ip')
+    if isinstance(protocol, (list, tuple)):
+        return next((name for name in protocol if name != 'end'), 'ip')
+    return protocol
+
+
+def _endpoint(value, address_family, prefix):
+    address = str(ipaddress.ip_address(value))
+    if address_family == 'ipv6':
+        return {'address': address, 'prefix_length': prefix or 128}
+    if prefix is None:
+        return {'address': address, 'wildcard': '0.0.0.0'}
+    return {'address': address, 'wildcard': str(ipaddress.IPv4Network('0.0.0.0/%d' % prefix).hostmask)}
+
+
+def scale_aclnames(profile):
+    """
+    :param profile: aclname_scale entry
+    :return: names of the ACLs Zap creates for the entry, e.g. ['Scale_eg_ipv4_1']
+    """
+    return ['%s_%d' % (profile['aclname'], index) for index in range(1, int(profile.get('number of acls', 1)) + 1)]
+
+
+def scale_aces(profile, src, dest, prefix=None):
+    """
+    Render the ACEs of one aclname_scale profile entry, one at a time.
+
+    :param profile: aclname_scale entry ('aclname', 'sequence_number', 'number of aces', 'step', ...)
+    :param src: first source address, the profile 'src' when None
+    :param dest: first destination address, the profile 'dest' when None
+    :param prefix: prefix length of the addresses, host entries when None
+    :return: generator of ACE dicts in the aclnames layout
+    """
+    address_family = profile['address_family']
+    count = int(profile['number of aces'])
+    first_seq = int(profile['sequence_number'])
+    step = int(profile.get('step', 1)) or 1
+    src_int = int(ipaddress.ip_address(src or profile['src']))
+    dest_int = int(ipaddress.ip_address(dest or profile['dest']))
+    permit_start = int(profile.get('action_permit_start_for_multiple_ace', 1))
+    permit_end = int(profile.get('action_permit_end_for_multiple_ace', count))
+    protocol = _protocol(profile)
+    for index in range(count):
+        offset = index * step
+        yield {'address_family': address_family,
+               'sequence_number': str(first_seq + index),
+               'action': 'permit' if permit_start <= index + 1 <= permit_end else 'deny',
+               'source': _endpoint(src_int + offset, address_family, prefix),
+               'destination': _endpoint(dest_int + offset, address_family, prefix),
+               'protocol_name': protocol}
+
+
+def chunk_profiles(profile, src, dest, size):
+    """
+    Split one aclname_scale profile entry into entries of at most size ACEs.
+
+    :param profile: aclname_scale entry
+    :param src: first source address, the profile 'src' when None
+    :param dest: first destination address, the profile 'dest' when None
+    :param size: ACEs per entry
+    :return: generator of (entry, src, dest) for Zap.configure_aclace_scale
+    """
+    count = int(profile['number of aces'])
+    if int(profile.get('number of acls', 1)) != 1 or count <= size:
+        yield profile, src, dest
+        return
+    first_seq = int(profile['sequence_number'])
+    step = int(profile.get('step', 1)) or 1
+    src_int = int(ipaddress.ip_address(src or profile['src']))
+    dest_int = int(ipaddress.ip_address(dest or profile['dest']))
+    permit_start = int(profile.get('action_permit_start_for_multiple_ace', 1))
+    permit_end = int(profile.get('action_permit_end_for_multiple_ace', count))
+    offset = 0
+    while offset < count:
+        aces = min(size, count - offset)
+        if count - offset - aces == 1:
+            # a one ACE entry would get the single ACE permit range
+            aces += 1
+        start, end = max(permit_start - offset, 1), min(permit_end - offset, aces)
+        if start > end:
+            start, end = aces + 1, aces
+        entry = dict(profile)
+        entry.update({'sequence_number': str(first_seq + offset), 'number of aces': str(aces),
+                      'action_permit_start_for_multiple_ace': str(start),
+                      'action_permit_end_for_multiple_ace': str(end)})
+        yield (entry, str(ipaddress.ip_address(src_int + offset * step)),
+               str(ipaddress.ip_address(dest_int + offset * step)))
+        offset += aces
+
+
+class ScaleAclLoader:
+    """
+    Push scale ACLs chunk by chunk and time every commit.
+    """
+
+    def __init__(self, zap, topo, device, get_acl, chunk_size=DEFAULT_CHUNK, journal=None):
+        """
+        :param zap: Zap, for configure_aclace_scale
+        :param topo: topology providing config(device, thread=True)
+        :param device: router the ACLs are configured on
+        :param get_acl: callable returning the current Acl object of the device
+        :param chunk_size: ACEs per commit
+        :param journal: ConfigJournal the loaded ACLs are recorded in, for deletion as a whole
+        """
+        self.zap = zap
+        self.topo = topo
+        self.device = device
+        self.get_acl = get_acl
+        self.chunk_size = chunk_size
+        self.journal = journal
+        self.chunks = []
+
+    def _push(self, index, entry, src, dest, prefix):
+        start = time.monotonic()
+        with self.topo.config(self.device, thread=True):
+            self.zap.configure_aclace_scale([entry], self.get_acl(), src, dest, prefix)
+        elapsed = time.monotonic() - start
+        aces = int(entry['number of aces'])
+        self.chunks.append((entry['aclname'], index, aces, elapsed))
+        return aces
+
+    def load_profile(self, profile, src=None, dest=None, prefix=None, chunk_size=None):
+        """
+        Configure one profile entry.
+
+        :return: (ACEs pushed, seconds)
+        """
+        chunk_size = chunk_size or self.chunk_size
+        aclname = profile['aclname']
+        if self.journal is not None:
+            for name in scale_aclnames(profile):
+                self.journal.created_acl(name)
+        start = time.monotonic()
+        total = 0
+        for index, (entry, chunk_src, chunk_dest) in enumerate(chunk_profiles(profile, src, dest, chunk_size)):
+            total += self._push(index, entry, chunk_src, chunk_dest, prefix)
+        elapsed = time.monotonic() - start
+        log.info("%s: %d ACEs in %.1fs (%d per commit, %.0f ACEs/s)"
+                 % (aclname, total, elapsed, chunk_size, total / elapsed if elapsed else 0.0))
+        return total, elapsed
+
+    def load(self, profiles, src=None, dest=None, prefix=None, chunk_size=None):
+        """
+        Drop in for Zap.configure_aclace_scale(profiles, acl_obj, src, dest, prefix)
+        inside its own topo.config() block.
+
+        :param profiles: aclname_scale profile, a list of entries
+        :return: (ACEs pushed, seconds)
+        """
+        total, elapsed = 0, 0.0
+        for profile in profiles:
+            pushed, seconds = self.load_profile(profile, src, dest, prefix, chunk_size)
+            total += pushed
+            elapsed += seconds
+        return total, elapsed
+
+    def sweep(self, profiles, src=None, dest=None, chunk_sizes=(100, 500, 1000, 2000)):
+        """
+        Load and delete the profile once per chunk size.
+
+        :return: dict chunk size -> ACEs per second
+        """
+        throughput = {}
+        for chunk_size in chunk_sizes:
+            total, elapsed = self.load(profiles, src, dest, chunk_size=chunk_size)
+            throughput[chunk_size] = round(total / elapsed, 1) if elapsed else 0.0
+            for aclname in (name for profile in profiles for name in scale_aclnames(profile)):
+                self.get_acl().delete_acl(access_list_name=aclname, unit_test_mode=False)
+                if self.journal is not None:
+                    self.journal.deleted_acl(aclname)
+        for chunk_size, rate in sorted(throughput.items()):
+            log.info("chunk %5d: %.1f ACEs/s" % (chunk_size, rate))
+        return throughput
+
+    def report(self):
+        """
+        :return: dict aclname -> (chunks, ACEs, seconds)
+        """
+        per_acl = {}
+        for aclname, _, aces, elapsed in self.chunks:
+            chunks, total, seconds = per_acl.get(aclname, (0, 0, 0.0))
+            per_acl[aclname] = (chunks + 1, total + aces, seconds + elapsed)
+        for aclname, (chunks, total, seconds) in sorted(per_acl.items()):
+            log.info("Scale %s: %d ACEs in %d commits, %.1fs of commits" % (aclname, total, chunks, seconds))
+        return per_acl
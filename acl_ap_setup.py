@@ -0,0 +1,194 @@
+# **************************************************
+# Copyright (c) 2017 Cisco Systems, Inc.
+# All rights reserved.
+# **************************************************
+
+"""
+Dependency aware setup scheduler for setup_module.
+
+Setup work is registered as steps bound to a device. Steps of one device run
+in dependency order inside a single topo.config() context, so every device
+is committed once; the per-device lanes run concurrently on a thread pool.
+Cross device dependencies are allowed: a step depending on a step of
+another device waits until that device has committed, so it never runs
+against config which is still uncommitted. Steps of the same device see each
+other's config inside the shared context and only wait for their turn.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from logger.cafylog import CafyLog
+
+log = CafyLog(name="AclSetup")
+
+
+class SetupStep:
+    """
+    One unit of setup work.
+    """
+
+    def __init__(self, key, func, device, after):
+        self.key = key
+        self.func = func
+        self.device = device
+        self.after = after
+        self.elapsed = None
+        self.error = None
+
+
+class SetupScheduler:
+    """
+    Build a DAG of setup steps and run it, one config context per device.
+
+    Usage::
+
+        scheduler = SetupScheduler(ApData.zap.get_topology())
+        for device in ApData.devices:
+            scheduler.add('interfaces', partial(_configure_interfaces, device), device)
+            scheduler.add('static_routes', partial(_configure_static_routes, device), device,
+                          after=['interfaces'])
+        scheduler.run()
+    """
+
+    def __init__(self, topo, max_workers=None):
+        """
+        :param topo: topology object providing config(*devices, thread=True)
+        :param max_workers: thread pool size, defaults to one thread per device
+        """
+        self.topo = topo
+        self.max_workers = max_workers
+        self.steps = OrderedDict()
+
+    @staticmethod
+    def device_id(device):
+        return getattr(device, 'identifier', device)
+
+    def add(self, name, func, device, after=()):
+        """
+        Register a step.
+
+        :param name: step name, unique per device
+        :param func: callable without arguments doing the configuration
+        :param device: device the step configures
+        :param after: step names of the same device, or (device_id, name)
+                      tuples for steps of another device
+        :return: key of the step, (device_id, name)
+        """
+        key = (self.device_id(device), name)
+        if key in self.steps:
+            raise ValueError("Setup step %s registered twice" % (key,))
+        deps = [dep if isinstance(dep, tuple) else (key[0], dep) for dep in after]
+        self.steps[key] = SetupStep(key, func, device, deps)
+        return key
+
+    def order(self):
+        """
+        Topological order of the steps, registration order breaking ties.
+
+        :return: list of step keys
+        """
+        for step in self.steps.values():
+            for dep in step.after:
+                if dep not in self.steps:
+                    raise ValueError("Setup step %s depends on unknown step %s" % (step.key, dep))
+        indegree = {key: len(step.after) for key, step in self.steps.items()}
+        ordered = []
+        ready = [key for key in self.steps if indegree[key] == 0]
+        while ready:
+            key = ready.pop(0)
+            ordered.append(key)
+            for other in self.steps.values():
+                if key in other.after:
+                    indegree[other.key] -= 1
+                    if indegree[other.key] == 0:
+                        ready.append(other.key)
+        if len(ordered) != len(self.steps):
+            cycle = [key for key in self.steps if key not in ordered]
+            raise ValueError("Setup steps have a dependency cycle: %s" % cycle)
+        return ordered
+
+    def lanes(self):
+        """
+        :return: OrderedDict device_id -> list of step keys in run order, a
+                 lane after the lanes whose commit it waits for
+        """
+        lanes = OrderedDict()
+        for key in self.order():
+            lanes.setdefault(key[0], []).append(key)
+        # a cross device step waits for the commit of the whole other lane
+        waits_for = dict((lane, set(dep[0] for key in keys for dep in self.steps[key].after if dep[0] != lane))
+                         for lane, keys in lanes.items())
+        visiting, checked = set(), []
+
+        def visit(lane):
+            if lane in visiting:
+                raise ValueError("Setup lanes wait for each other's commit: %s" % sorted(visiting))
+            if lane not in checked:
+                visiting.add(lane)
+                for other in waits_for[lane]:
+                    visit(other)
+                visiting.discard(lane)
+                checked.append(lane)
+        for lane in lanes:
+            visit(lane)
+        return OrderedDict((lane, lanes[lane]) for lane in checked)
+
+    def run(self):
+        """
+        Run every lane concurrently and raise the first step error, if any.
+
+        A step whose dependency failed, or whose dependency's device failed
+        to commit, is skipped.
+
+        :return: dict step key -> elapsed seconds
+        """
+        lanes = self.lanes()
+        committed = dict((lane, threading.Event()) for lane in lanes)
+        commit_errors = {}
+
+        def run_lane(lane, keys):
+            device = self.steps[keys[0]].device
+            try:
+                with self.topo.config(device, thread=True):
+                    run_steps(lane, keys)
+            except Exception as err:
+                commit_errors[lane] = err
+                raise
+            finally:
+                committed[lane].set()
+
+        def run_steps(lane, keys):
+            for key in keys:
+                step = self.steps[key]
+                try:
+                    for dep in step.after:
+                        if dep[0] != lane:
+                            committed[dep[0]].wait()
+                    failed = [dep for dep in step.after
+                              if self.steps[dep].error is not None or dep[0] in commit_errors]
+                    if failed:
+                        step.error = RuntimeError("skipped, %s failed" % (failed,))
+                        continue
+                    start = time.monotonic()
+                    step.func()
+                    step.elapsed = time.monotonic() - start
+                    log.info("Setup step %s done in %.1f seconds" % (key, step.elapsed))
+                except Exception as err:
+                    step.error = err
+                    log.error("Setup step %s failed: %s" % (key, err))
+            errors = [self.steps[key].error for key in keys if self.steps[key].error is not None]
+            if errors:
+                # let the config context see the failure instead of committing half of the lane
+                raise errors[0]
+
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=self.max_workers or len(lanes) or 1) as pool:
+            futures = [pool.submit(run_lane, lane, keys) for lane, keys in lanes.items()]
+        log.info("Setup pipeline finished in %.1f seconds" % (time.monotonic() - start))
+        for future in futures:
+            # step errors and commit errors raised by the config context
+            future.result()
+        return {key: step.elapsed for key, step in self.steps.items()}
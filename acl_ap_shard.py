@@ -0,0 +1,255 @@
+# **************************************************
+# Copyright (c) 2017 Cisco Systems, Inc.
+# All rights reserved.
+# **************************************************
+
+"""
+Run the ACL suite sharded over several testbeds.
+
+Each testbed is a topology/input json pair. The test classes of
+acl_ap_main.py are balanced over the beds on their durations in the timing
+reports (longest class first onto the least loaded bed); classes linked by
+depends_on or sharing a hw-module profile stay on one bed, so the
+dependency holds and the profile reload is paid once. Every bed runs its own
+pytest, setup_module included, concurrently with the others; at the end the
+junit results and the timing reports of the beds are merged.
+
+    python acl_ap_shard.py --bed bed1_topo.json bed1_input.json \\
+                           --bed bed2_topo.json bed2_input.json -- -m "not reload"
+    python acl_ap_shard.py --plan-only --bed ... --bed ...
+"""
+
+import argparse
+import ast
+import glob
+import json
+import os
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ElementTree
+from collections import OrderedDict
+
+from acl_ap_order import scan_node, test_class_nodes
+from acl_ap_timing import class_seconds, compare, load_report
+
+TOPOLOGY_OPTION = '-T'
+INPUT_OPTION = '-I'
+DEFAULT_SECONDS = 120.0
+
+
+class Bed:
+    """
+    One testbed and the classes it runs.
+    """
+
+    def __init__(self, name, topology, test_input):
+        self.name = name
+        self.topology = topology
+        self.test_input = test_input
+        self.groups = []
+        self.planned = 0.0
+        self.returncode = None
+        self.elapsed = None
+
+    @property
+    def classes(self):
+        return [cls_name for group in self.groups for cls_name in group]
+
+
+def test_classes(module_file):
+    """
+    :param module_file: test module
+    :return: OrderedDict class name -> (depends_on names, hw-module profiles), in file order
+    """
+    classes = OrderedDict()
+    for name, node in test_class_nodes(module_file).items():
+        depends = []
+        for statement in node.body:
+            if isinstance(statement, ast.Assign) and any(getattr(target, 'id', None) == 'depends_on'
+                                                         for target in statement.targets):
+                depends = [element.value for element in getattr(statement.value, 'elts', [])]
+        classes[name] = (depends, frozenset(scan_node(node)['hw_profiles']))
+    return classes
+
+
+def group_classes(classes):
+    """
+    Union the classes which have to share a bed.
+
+    :param classes: output of test_classes()
+    :return: list of class name lists, file order inside a group
+    """
+    parent = dict((name, name) for name in classes)
+
+    def root(name):
+        while parent[name] != name:
+            parent[name] = parent[parent[name]]
+            name = parent[name]
+        return name
+
+    by_profile = {}
+    for name, (depends, hw_profiles) in classes.items():
+        for dep in depends:
+            if dep in parent:
+                parent[root(name)] = root(dep)
+        if hw_profiles:
+            parent[root(name)] = root(by_profile.setdefault(hw_profiles, name))
+    groups = OrderedDict()
+    for name in classes:
+        groups.setdefault(root(name), []).append(name)
+    return list(groups.values())
+
+
+def load_durations(timing_dir):
+    """
+    :param timing_dir: directory of the timing reports
+    :return: dict class name -> seconds, from baseline.json or else the latest run report
+    """
+    baseline = os.path.join(timing_dir, 'baseline.json')
+    runs = sorted(glob.glob(os.path.join(timing_dir, 'run_*.json')))
+    path = baseline if os.path.exists(baseline) else (runs[-1] if runs else None)
+    if path is None:
+        return {}
+    return class_seconds(load_report(path))
+
+
+def balance(groups, beds, durations):
+    """
+    Longest processing time first: every group goes to the least loaded bed.
+    Classes without history cost the median known duration.
+
+    :return: beds, with their groups and planned seconds filled in
+    """
+    known = sorted(durations.values())
+    default = known[len(known) // 2] if known else DEFAULT_SECONDS
+    cost = lambda group: sum(durations.get(name, default) for name in group)
+    for group in sorted(groups, key=cost, reverse=True):
+        bed = min(beds, key=lambda candidate: candidate.planned)
+        bed.groups.append(group)
+        bed.planned += cost(group)
+    return beds
+
+
+def bed_command(bed, module_file, out_dir, extra_args):
+    node_ids = ['%s::%s' % (module_file, cls_name) for cls_name in bed.classes]
+    return [sys.executable, '-m', 'pytest', '-p', 'acl_ap_order',
+            TOPOLOGY_OPTION, bed.topology, INPUT_OPTION, bed.test_input,
+            '--junitxml', os.path.join(out_dir, '%s.xml' % bed.name)] + list(extra_args) + node_ids
+
+
+def run_beds(beds, module_file, out_dir, extra_args):
+    """
+    Start pytest on every bed at once and wait for all of them.
+    """
+    processes = []
+    for bed in beds:
+        if not bed.groups:
+            continue
+        env = dict(os.environ, ACL_AP_TIMING_DIR=os.path.join(out_dir, 'timing', bed.name))
+        log_file = open(os.path.join(out_dir, '%s.log' % bed.name), 'w')
+        print("%s: %d classes, %.0fs planned" % (bed.name, len(bed.classes), bed.planned))
+        processes.append((bed, log_file, time.monotonic(),
+                          subprocess.Popen(bed_command(bed, module_file, out_dir, extra_args), env=env,
+                                           stdout=log_file, stderr=subprocess.STDOUT,
+                                           cwd=os.path.dirname(os.path.abspath(module_file)))))
+    for bed, log_file, started, process in processes:
+        bed.returncode = process.wait()
+        bed.elapsed = time.monotonic() - started
+        log_file.close()
+        print("%s: exit %d after %.0fs" % (bed.name, bed.returncode, bed.elapsed))
+
+
+def merge_junit(beds, out_dir):
+    """
+    :return: path of the merged junit xml
+    """
+    merged = ElementTree.Element('testsuites')
+    for bed in beds:
+        path = os.path.join(out_dir, '%s.xml' % bed.name)
+        if not os.path.exists(path):
+            if bed.groups:
+                print("%s: no junit results in %s (exit %s), see %s.log" % (bed.name, path, bed.returncode,
+                                                                          bed.name), file=sys.stderr)
+            continue
+        root = ElementTree.parse(path).getroot()
+        for suite in ([root] if root.tag == 'testsuite' else list(root)):
+            suite.set('name', '%s[%s]' % (suite.get('name', 'pytest'), bed.name))
+            merged.append(suite)
+    path = os.path.join(out_dir, 'results.xml')
+    ElementTree.ElementTree(merged).write(path, encoding='utf-8', xml_declaration=True)
+    return path
+
+
+def merge_timing(beds, out_dir, baseline_file):
+    """
+    Merge the timing reports of the beds into one, flagging regressions against the baseline.
+    Every bed runs its own setup_module, booked as '<module>[<bed>]'.
+
+    :return: path of the merged report
+    """
+    merged = {'version': None, 'started': None, 'finished': None, 'classes': OrderedDict(), 'tests': [],
+              'beds': OrderedDict()}
+    for bed in beds:
+        runs = sorted(glob.glob(os.path.join(out_dir, 'timing', bed.name, 'run_*.json')))
+        if not runs:
+            continue
+        report = load_report(runs[-1])
+        merged['version'] = report['version']
+        merged['started'] = min(filter(None, [merged['started'], report.get('started')]), default=None)
+        merged['finished'] = max(filter(None, [merged['finished'], report.get('finished')]), default=None)
+        for cls_name, phases in report['classes'].items():
+            merged['classes']['%s[%s]' % (cls_name, bed.name) if cls_name == '<module>' else cls_name] = phases
+        merged['tests'].extend(dict(test, bed=bed.name) for test in report['tests'])
+        merged['beds'][bed.name] = {'classes': bed.classes, 'planned': round(bed.planned, 1),
+                                    'elapsed': round(bed.elapsed or 0.0, 1), 'returncode': bed.returncode}
+    for key in ('started', 'finished'):
+        if merged[key] is None:
+            del merged[key]
+    merged['regressions'] = compare(merged, load_report(baseline_file)) if os.path.exists(baseline_file) else []
+    path = os.path.join(out_dir, 'timing', 'run_merged.json')
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as report_file:
+        json.dump(merged, report_file, indent=2)
+    return path
+
+
+def main():
+    prefix = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description="Run the ACL suite sharded over several testbeds")
+    parser.add_argument('--bed', nargs=2, action='append', metavar=('TOPOLOGY', 'INPUT'), required=True,
+                        help="topology and test input json of one testbed, once per bed")
+    parser.add_argument('--module', default=os.path.join(prefix, 'acl_ap_main.py'))
+    parser.add_argument('--timing', default=os.path.join(prefix, 'timing'),
+                        help="timing reports the durations are read from")
+    parser.add_argument('--out', default=os.path.join(prefix, 'shards'))
+    parser.add_argument('--plan-only', action='store_true', help="print the shards and exit")
+    parser.add_argument('pytest_args', nargs='*', help="extra pytest arguments, after --")
+    args = parser.parse_args()
+    # the beds run pytest from the module directory, node ids and output paths must not depend on it
+    args.module = os.path.abspath(args.module)
+    args.out = os.path.abspath(args.out)
+
+    beds = [Bed('bed%d' % (index + 1), os.path.abspath(topology), os.path.abspath(test_input))
+            for index, (topology, test_input) in enumerate(args.bed)]
+    durations = load_durations(args.timing)
+    balance(group_classes(test_classes(args.module)), beds, durations)
+    for bed in beds:
+        print("%s (%s): %d classes, %.0fs planned" % (bed.name, bed.topology, len(bed.classes), bed.planned))
+        if args.plan_only:
+            for cls_name in bed.classes:
+                print("    %s" % cls_name)
+    if args.plan_only:
+        return 0
+
+    os.makedirs(args.out, exist_ok=True)
+    started = time.monotonic()
+    run_beds(beds, args.module, args.out, args.pytest_args)
+    print("Results: %s" % merge_junit(beds, args.out))
+    print("Timing: %s" % merge_timing(beds, args.out, os.path.join(args.timing, 'baseline.json')))
+    print("Wall clock %.0fs, longest plan %.0fs" % (time.monotonic() - started, max(bed.planned for bed in beds)))
+    return max(bed.returncode or 0 for bed in beds)
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
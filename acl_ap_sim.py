@@ -0,0 +1,821 @@
+# **************************************************
+# Copyright (c) 2017 Cisco Systems, Inc.
+# All rights reserved.
+# **************************************************
+
+"""
+Simulated routers and traffic generator for offline runs.
+
+With ACL_AP_BACKEND=sim acl_ap_main builds its Zap, Acl, IfMgr, Inventory,
+Topology, Event, CafyTriggers and other feature library objects from this
+module instead of the cafy libraries. Reloads and switchovers run without
+effect. The routers keep their ACLs, interface bindings and hardware counters in memory;
+SimTgen derives synthetic streams from the traffic item names and, as
+their frames are read or stopped, matches every stream against the ACLs
+bound on its address family and, for names ending in _Phy, _PhySub,
+_Bundle, _BundleSub or _BVI, on that kind of interface, in the direction
+the name tells (peerN_In_* ingress, uutN_* egress; first matching ACE
+wins, scale streams spread over the whole ACL) and updates the per (acl, seq, direction, location) counters that
+get_acl_access_lists_ipv4_hardware and get_acl_hit_count report; a hardware
+read at the active RP reports the counters of every line card. Scale ACLs
+are named like Zap names them, aclname_1 and up.
+
+The model is intentionally coarse. It exists to run and profile the harness
+itself (input handling, setup pipeline, verification code) without R1/R2
+and a TGEN, not to predict what a router would forward. Calls the model has
+no state for are listed in the 'ignored' set of their class and succeed
+without effect; any other attribute raises AttributeError, so a misspelt or
+new library call fails on the sim the way it would on the router.
+"""
+
+import contextlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+
+from logger.cafylog import CafyLog
+from acl_ap_model import resolve_templates
+from acl_ap_scale import scale_aces, scale_aclnames
+
+log = CafyLog(name="AclSim")
+
+PROTOCOLS = ('tcp', 'udp', 'ospf', 'icmp')
+INTERFACE_KINDS = ('Phy', 'PhySub', 'Bundle', 'BundleSub', 'BVI')
+
+ACTIVE_RP = '0/RP0/CPU0'
+SCALE_RATE = 100000
+
+
+def location_of(interface):
+    """
+    :param interface: interface name, e.g. HundredGigE0/0/0/1.20
+    :return: line card location of the interface, the active RP for virtual interfaces
+    """
+    match = re.search(r'(\d+)/(\d+)/\d+/\d+', str(interface))
+    if match:
+        return '%s/%s/CPU0' % match.groups()
+    return ACTIVE_RP
+
+
+def interface_kind(interface):
+    """
+    :return: 'Phy', 'PhySub', 'Bundle', 'BundleSub' or 'BVI'
+    """
+    name = str(interface)
+    if name.startswith('BVI'):
+        return 'BVI'
+    kind = 'Bundle' if name.startswith('Bundle-Ether') else 'Phy'
+    return kind + 'Sub' if '.' in name else kind
+
+
+class SimStream:
+    """
+    Synthetic traffic item.
+    """
+
+    def __init__(self, name, address_family=None, protocol=None, rate=None, scale=None):
+        lower = name.lower()
+        self.name = name
+        self.address_family = address_family or ('ipv6' if 'v6' in lower else 'ipv4')
+        self.protocol = protocol or next((proto for proto in PROTOCOLS if proto in lower), 'ip')
+        self.scale = 'scale' in lower if scale is None else scale
+        # a scale stream sweeps thousands of addresses, every ACE needs frames of a short window
+        self.rate = rate or (SCALE_RATE if self.scale else 1000)
+        kind = name.rsplit('_', 1)[-1]
+        # ingress interface kind, None when the name does not tell
+        self.kind = kind if kind in INTERFACE_KINDS else None
+        # peerN_In_* streams enter R1, uutN_* streams leave it
+        self.direction = 'ingress' if '_in_' in lower else 'egress' if lower.startswith('uut') else None
+        self.tx = 0
+        self.rx = 0
+
+    def matches(self, ace):
+        """
+        :param ace: ace dict of the acl input ('protocol_name', 'address_family', ...)
+        :return: True if the ACE matches the stream
+        """
+        if ace.get('address_family', self.address_family) != self.address_family:
+            return False
+        if self.scale and self.protocol == 'ip':
+            # a scale stream not naming its protocol carries the one of the scale ACL it was built for
+            return True
+        protocol = ace.get('protocol_name', 'ip')
+        if isinstance(protocol, list):
+            protocol = protocol[0]
+        protocol = str(protocol).split()[0].lower()
+        return protocol in ('ip', 'ipv4', 'ipv6') or protocol == self.protocol
+
+
+class SimAclTable:
+    """
+    ACLs, bindings and hardware counters of one simulated router.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.acls = OrderedDict()
+        self.bindings = OrderedDict()
+        self.counters = {}
+
+    def define(self, name, aces):
+        with self.lock:
+            aces = sorted(aces, key=lambda ace: int(ace.get('sequence_number', 0)))
+            self.acls[name] = [dict(ace) for ace in aces]
+
+    def bind(self, name, address_family, direction, interface, config=True):
+        with self.lock:
+            key = (str(interface), direction)
+            if config:
+                self.bindings[key] = (name, address_family)
+            else:
+                self.bindings.pop(key, None)
+
+    def clear(self, name=None, direction=None, location=None):
+        with self.lock:
+            for key in list(self.counters):
+                if ((name is None or key[0] == name) and (direction is None or key[2] == direction) and
+                        (location is None or key[3] == location)):
+                    del self.counters[key]
+
+    def count(self, name, seq, direction, location, frames):
+        key = (name, int(seq), direction, location)
+        self.counters[key] = self.counters.get(key, 0) + frames
+
+    def apply(self, stream, frames):
+        """
+        Run frames of a stream through every matching binding.
+
+        :return: frames left after deny ACEs
+        """
+        forwarded = frames
+        with self.lock:
+            for (interface, direction), (name, address_family) in self.bindings.items():
+                if address_family != stream.address_family or name not in self.acls:
+                    continue
+                if stream.scale != name.lower().startswith('scale'):
+                    # scale streams only cross the scale subinterfaces
+                    continue
+                if stream.kind is not None and stream.kind != interface_kind(interface):
+                    continue
+                if stream.direction is not None and stream.direction != direction:
+                    continue
+                location = location_of(interface)
+                hits = [ace for ace in self.acls[name] if stream.matches(ace)]
+                if not hits:
+                    continue
+                if stream.scale and len(hits) > 1:
+                    share, extra = divmod(frames, len(hits))
+                    for index, ace in enumerate(hits):
+                        self.count(name, ace['sequence_number'], direction, location, share + (index < extra))
+                    continue
+                ace = hits[0]
+                self.count(name, ace['sequence_number'], direction, location, frames)
+                if ace.get('action') == 'deny':
+                    forwarded = 0
+        return forwarded
+
+
+class SimInterface:
+
+    def __init__(self, name, members=()):
+        self.name = name
+        self.interface = name
+        self.members = list(members)
+
+    def __repr__(self):
+        return self.name
+
+
+class SimInventory:
+
+    def __init__(self, device=None, mode=None, **kwargs):
+        self.device = device
+
+    def get_xr_active_rp(self):
+        return ACTIVE_RP
+
+
+class SimDevice:
+    """
+    Router or traffic generator node of the simulated topology.
+    """
+
+    def __init__(self, identifier, links):
+        self.identifier = identifier
+        self.alias = identifier
+        self.acl_table = SimAclTable()
+        self.inventory = SimInventory(self)
+        self.down = set()
+        self.hw_profiles = OrderedDict()
+        # (interface, direction) -> policy map name
+        self.service_policies = OrderedDict()
+        # ACLs and bindings before every commit, for rollback_config
+        self.commits = []
+        self.default_handles = {'cli': SimCliHandle(self)}
+        self._ports = OrderedDict()
+        for index, link in enumerate(name for name, data in links.items() if identifier in data['devices']):
+            self._ports[link] = SimInterface('HundredGigE0/0/0/%d' % index)
+
+    def get_local(self, link):
+        return self._ports[getattr(link, 'alias', link)]
+
+    def get_remote(self, link):
+        return self.get_local(link)
+
+    def snapshot(self):
+        with self.acl_table.lock:
+            return (OrderedDict((name, [dict(ace) for ace in aces]) for name, aces in self.acl_table.acls.items()),
+                    OrderedDict(self.acl_table.bindings))
+
+    def restore(self, snapshot):
+        acls, bindings = snapshot
+        with self.acl_table.lock:
+            self.acl_table.acls = OrderedDict((name, [dict(ace) for ace in aces]) for name, aces in acls.items())
+            self.acl_table.bindings = OrderedDict(bindings)
+
+    def connect(self, *args, **kwargs):
+        return True
+
+    def disconnect(self, *args, **kwargs):
+        return True
+
+    def __repr__(self):
+        return self.identifier
+
+
+class SimLink:
+
+    def __init__(self, alias, devices):
+        self.alias = alias
+        self.devices = devices
+
+
+class SimTgen(SimDevice):
+    """
+    Traffic generator with synthetic streams.
+    """
+
+    platform = 'SIM'
+    server_ip = '127.0.0.1'
+
+    def __init__(self, identifier, links, routers=()):
+        super().__init__(identifier, links)
+        self.routers = list(routers)
+        self.streams = OrderedDict()
+        self.running = {}
+        self.interfaces = self._ports
+
+    def stream(self, name):
+        if name not in self.streams:
+            self.streams[name] = SimStream(name)
+        return self.streams[name]
+
+    def add_stream(self, name, address_family=None, protocol=None, rate=None, scale=None):
+        self.streams[name] = SimStream(name, address_family, protocol, rate, scale)
+        return self.streams[name]
+
+    def start_arp(self, *args, **kwargs):
+        return True
+
+    def verify_arp_status(self, *args, **kwargs):
+        return True
+
+    def load_config(self, *args, **kwargs):
+        return True
+
+    def _perform(self, command, *args, **kwargs):
+        if command == 'ResultClearAllTrafficCommand':
+            for stream in self.streams.values():
+                stream.tx = stream.rx = 0
+
+    def start_traffic(self, traffic_list=None, **kwargs):
+        now = time.monotonic()
+        for name in traffic_list or list(self.streams):
+            stream = self.stream(name)
+            stream.tx = stream.rx = 0
+            self.running[name] = now
+
+    def _advance(self, names):
+        """
+        Account the frames the running streams sent since they were last accounted.
+        """
+        now = time.monotonic()
+        for name in names:
+            since = self.running.get(name)
+            if since is None:
+                continue
+            stream = self.stream(name)
+            frames = int(stream.rate * (now - since))
+            if not frames:
+                continue
+            # carry the time of the fraction of a frame not sent yet
+            self.running[name] = since + frames / float(stream.rate)
+            forwarded = frames
+            for router in self.routers:
+                forwarded = min(forwarded, router.acl_table.apply(stream, frames))
+            stream.tx += frames
+            stream.rx += forwarded
+
+    def stop_traffic(self, traffic_list=None, **kwargs):
+        names = list(traffic_list or self.running)
+        self._advance(names)
+        for name in names:
+            self.running.pop(name, None)
+
+    def verify_traffic(self, tolerance=5, expected=None, **kwargs):
+        """
+        :return: (item_stats, flow_stats) like the cafy Tgen, raised as
+                 Exception args[0] when a stream is out of tolerance
+        """
+        self._advance(list(self.running))
+        item_stats = {}
+        failed = False
+        for index, stream in enumerate(self.streams.values(), 1):
+            item_stats[index] = {'Traffic Item': stream.name, 'Tx Frames': str(stream.tx),
+                                 'Rx Frames': str(stream.rx)}
+            if stream.tx and abs(stream.tx - stream.rx) * 100 > stream.tx * tolerance:
+                failed = True
+        if failed and expected is None:
+            raise Exception((item_stats, {}))
+        return item_stats, {}
+
+    def get_traffic_items(self, *args, **kwargs):
+        return list(self.streams)
+
+    get_all_traffic_streams = get_traffic_items
+
+    def _get_dict_traffic_streams(self):
+        return OrderedDict(self.streams)
+
+    def tgn_disconnect(self, *args, **kwargs):
+        self.running.clear()
+        return True
+
+    def _end_session(self, *args, **kwargs):
+        self.running.clear()
+        return True
+
+
+class SimTopology:
+
+    def __init__(self, topo_file=None, zap=None):
+        self.zap = zap
+
+    @contextlib.contextmanager
+    def config(self, *devices, **kwargs):
+        before = [(device, device.snapshot()) for device in devices if isinstance(device, SimDevice)]
+        yield
+        for device, snapshot in before:
+            device.commits.append(snapshot)
+
+    def get_router(self, alias):
+        return SimRouterInfo(alias)
+
+
+class SimRouterInfo:
+
+    platform = 'SIM'
+
+    def __init__(self, alias):
+        self.alias = alias
+        self.line_cards = ['0/0/CPU0']
+
+
+class SimZap:
+    """
+    Zap replacement reading the same input json as Zap.
+    """
+
+    def __init__(self, test_input_file, topo_file=None):
+        with open(test_input_file) as input_file:
+            self.data = json.load(input_file)
+        links = self.data['Topology']['Links']
+        self.links = OrderedDict((name, SimLink(name, data['devices'])) for name, data in links.items())
+        self.devices = OrderedDict()
+        routers = []
+        for alias in self.data['Topology']['Nodes']:
+            if re.match('tge?n', alias, re.I):
+                continue
+            self.devices[alias] = SimDevice(alias, links)
+            routers.append(self.devices[alias])
+        for alias in self.data['Topology']['Nodes']:
+            if alias not in self.devices:
+                self.devices[alias] = SimTgen(alias, links, routers)
+
+    def _arguments(self, section):
+        return self.data['TestArguments'][section]
+
+    def get_device(self, alias):
+        return self.devices[alias]
+
+    def get_link(self, alias):
+        return self.links[alias]
+
+    def get_topology(self):
+        return SimTopology(zap=self)
+
+    def get_base_configuration(self, key):
+        return self._arguments('base_configuration').get(key)
+
+    def get_feature_configuration(self, path):
+        node = self._arguments('feature_configuration')
+        for part in path.split('/'):
+            node = node[part]
+        return resolve_templates(node)
+
+    def get_interfaces(self, device):
+        interfaces = OrderedDict()
+        suffix = '.%s' % device.identifier
+        for key, data in resolve_templates(self._arguments('interface_configuration')).items():
+            if not key.endswith(suffix):
+                continue
+            link = key[:-len(suffix)]
+            if link in self.links and device.identifier in self.links[link].devices:
+                interfaces[key] = device.get_local(link)
+            else:
+                # bundle members are named <link>.<device> like the interfaces
+                members = [device.get_local(member[:-len(suffix)]) for member in data.get('members', ())]
+                interfaces[key] = SimInterface(data.get('name', link), members)
+        for link, port in device._ports.items():
+            interfaces.setdefault('%s%s' % (link, suffix), port)
+        return interfaces
+
+    def get_node_name(self, device_objs=None, interface=None):
+        return location_of(interface)
+
+    def configure_service_policy(self, interfaces, ifmgr, policy_data, config_mode=None, **kwargs):
+        """
+        :param policy_data: dict interface key -> dict direction -> policy map name
+        """
+        device = ifmgr.device
+        for key, directions in policy_data.items():
+            if key not in interfaces:
+                continue
+            for direction, policy in directions.items():
+                if config_mode == 'delete':
+                    device.service_policies.pop((interfaces[key].name, direction), None)
+                else:
+                    device.service_policies[(interfaces[key].name, direction)] = policy
+
+    def set_aclace(self, acl_data, acl_obj):
+        for name, aces in acl_data['aclnames'].items():
+            acl_obj.table.define(name, aces)
+
+    def edit_add_aclace(self, aces, acl_obj, aclname):
+        current = OrderedDict((int(ace['sequence_number']), ace) for ace in acl_obj.table.acls.get(aclname, []))
+        for ace in aces:
+            current[int(ace['sequence_number'])] = ace
+        acl_obj.table.define(aclname, current.values())
+
+    def configure_aclace_scale(self, scale_data, acl_obj, src=None, dest=None, prefix=None):
+        for profile in scale_data:
+            aces = list(scale_aces(profile, src or profile.get('src', '0.0.0.0'),
+                                   dest or profile.get('dest', '0.0.0.0'), prefix))
+            # ACEs add to an existing ACL, like on the router
+            for aclname in scale_aclnames(profile):
+                self.edit_add_aclace(aces, acl_obj, aclname)
+
+    def remove_acl(self, acl_data, acl_obj):
+        for name in acl_data['aclnames']:
+            acl_obj.table.acls.pop(name, None)
+
+    def remove_acl_scale(self, acl_data, acl_obj):
+        for profile in acl_data['aclname_scale'].values():
+            for item in profile:
+                for aclname in scale_aclnames(item):
+                    acl_obj.table.acls.pop(aclname, None)
+
+    def mark_config(self, *devices, **kwargs):
+        # rollback_config counts topo.config() commits, a mark carries no state
+        return True
+
+    def rollback_config(self, *devices, last=1, **kwargs):
+        """
+        Undo the last commits of every device.
+        """
+        for device in devices:
+            if len(device.commits) < int(last):
+                raise Exception("%s: cannot roll back %s commits, %d made" % (device, last, len(device.commits)))
+            snapshots = device.commits[-int(last):]
+            del device.commits[-int(last):]
+            device.restore(snapshots[0])
+
+    ignored = frozenset(('configure_interfaces', 'configure_classmaps', 'configure_policymaps',
+                         'load_tgn_config_file'))
+
+    def __getattr__(self, name):
+        return _ignored(self, name)
+
+
+def _ignored(obj, name):
+    """
+    :return: a call succeeding without effect when name is in the ignored set of obj
+    :raises AttributeError: for any other name
+    """
+    if name.startswith('__') or name not in type(obj).ignored:
+        raise AttributeError("sim: %s.%s is not simulated" % (type(obj).__name__, name))
+
+    def call(*args, **kwargs):
+        log.debug("sim: %s.%s ignored" % (type(obj).__name__, name))
+        return True
+    call.__name__ = name
+    return call
+
+
+class SimHwEntry:
+
+    def __init__(self, sequence_number, matches):
+        self.sequence_number = str(sequence_number)
+        self.matches = str(matches) if matches else ''
+
+
+class SimHardwareMatches:
+
+    def __init__(self, access_list_name=None, sequence_number=None, matches=None, **kwargs):
+        self.access_list_name = access_list_name
+        self.sequence_number = sequence_number
+        self.matches = matches
+
+
+def _in_range(value, expected):
+    low = getattr(expected, 'low', getattr(expected, 'min', None))
+    high = getattr(expected, 'high', getattr(expected, 'max', None))
+    if low is None and isinstance(expected, (list, tuple)) and len(expected) == 2:
+        low, high = expected
+    if low is None:
+        return value == int(expected)
+    return int(low) <= value <= int(high)
+
+
+class SimAcl:
+    """
+    Acl feature library of a simulated router.
+    """
+
+    HardwareMatches = SimHardwareMatches
+
+    ignored = frozenset(('set_network_object_group_acl', 'set_port_object_group_acl', 'set_urpf_on_interface',
+                         'set_acl_log_update', 'clear_acl_log_update', 'set_acl', 'set_ace', 'set_acl_ace',
+                         'copy_acl', 'verify_common_acl_hit_count', 'verify_acl_hardware_hit_count',
+                         'verify_access_lists_summary'))
+
+    def __init__(self, device, mode=None, name=None, **kwargs):
+        self.device = device
+        self.table = device.acl_table
+
+    def set_acl_to_interface(self, access_list_name, address_family, direction, interface, mode='config', **kwargs):
+        for name in str(access_list_name).split():
+            if name != 'common':
+                self.table.bind(name, address_family, direction, interface, config=(mode != 'unconfig'))
+
+    def clear_acl_stats(self, access_list_name=None, address_family=None, direction=None, interface=None,
+                        location=None, **kwargs):
+        self.table.clear(access_list_name, direction, location)
+
+    def get_acl_ace_oper(self, access_list_name=None, **kwargs):
+        return list(self.table.acls.get(access_list_name, []))
+
+    def get_acl_access_lists_ipv4_hardware(self, address_family=None, access_list_name=None, direction=None,
+                                           interface=None, location=None, **kwargs):
+        matches = {}
+        for (name, seq, ace_direction, ace_location), count in self.table.counters.items():
+            # the active RP reports the entries of every line card, like a fixed system
+            if name == access_list_name and ace_direction == direction and location in (ace_location, ACTIVE_RP):
+                matches[seq] = matches.get(seq, 0) + count
+        return [SimHwEntry(ace['sequence_number'], matches.get(int(ace['sequence_number']), 0))
+                for ace in self.table.acls.get(access_list_name, [])]
+
+    def get_acl_hit_count(self, data=None, expected_data_obj=(), traffic=None, location=None, **kwargs):
+        locations = location if isinstance(location, (list, tuple)) else [location]
+        for expected in expected_data_obj:
+            total = sum(count for (name, seq, _, loc), count in self.table.counters.items()
+                        if name == expected.access_list_name and seq == int(expected.sequence_number) and
+                        (location is None or loc in locations))
+            if not _in_range(total, expected.matches):
+                raise Exception("ACL %s seq %s: %d matches" % (expected.access_list_name,
+                                                               expected.sequence_number, total))
+        return True
+
+    def delete_acl(self, access_list_name=None, **kwargs):
+        self.table.acls.pop(access_list_name, None)
+
+    def delete_ace(self, access_list_name=None, sequence_number=None, **kwargs):
+        aces = self.table.acls.get(access_list_name, [])
+        self.table.acls[access_list_name] = [ace for ace in aces
+                                             if str(ace['sequence_number']) != str(sequence_number)]
+
+    def set_hw_module_profile_stats_acl_permit(self, enable=True, **kwargs):
+        _set_profile(self.device, 'hw-module profile stats acl-permit', enable)
+
+    def set_hw_module_profile_ttl_match(self, address_family='ipv4', enable=True, **kwargs):
+        _set_profile(self.device, 'hw-module profile tcam format access-list %s ttl-match' % address_family, enable)
+
+    def set_hardware_profile_common_acl(self, enable=True, **kwargs):
+        _set_profile(self.device, 'hw-module profile acl common', enable)
+
+    def _running_config(self, command):
+        if 'hw-module' in command:
+            return '\n'.join(self.device.hw_profiles)
+        lines = []
+        address_family = 'ipv6' if 'ipv6' in command else 'ipv4'
+        if 'access-list' not in command:
+            return ''
+        for name, aces in self.table.acls.items():
+            if ('v6' in name.lower()) != (address_family == 'ipv6'):
+                continue
+            lines.append('%s access-list %s' % (address_family, name))
+            for ace in aces:
+                lines.append(' %s %s %s' % (ace['sequence_number'], ace.get('action', 'permit'),
+                                            ace.get('protocol_name', address_family)))
+            lines.append('!')
+        return '\n'.join(lines)
+
+    def _push_configuration(self, command, mode='config', **kwargs):
+        """
+        Answers the show commands the harness parses; raw configuration is not simulated.
+        """
+        if mode != 'execute':
+            raise NotImplementedError("sim: raw %s configuration is not simulated" % mode)
+        match = re.match(r'show policy-map interface (\S+) (input|output)', command)
+        if match:
+            policy = self.device.service_policies.get(match.groups())
+            return '%s %s: %s' % (match.group(1), match.group(2), policy) if policy else ''
+        if command.startswith('show running-config'):
+            return self._running_config(command)
+        raise NotImplementedError("sim: %s is not simulated" % command)
+
+    def __getattr__(self, name):
+        return _ignored(self, name)
+
+
+def _set_profile(device, line, enable):
+    if enable:
+        device.hw_profiles[line] = True
+    else:
+        device.hw_profiles.pop(line, None)
+
+
+class SimIfMgr:
+    """
+    IfMgr of a simulated router, interfaces are up unless shut.
+    """
+
+    def __init__(self, device=None, mode=None, **kwargs):
+        self.device = device
+        # shared by every IfMgr of the device, like the real interface state
+        self.down = device.down if isinstance(device, SimDevice) else set()
+
+    @staticmethod
+    def _names(interfaces):
+        return [interfaces] if isinstance(interfaces, str) else list(interfaces)
+
+    def shut(self, interfaces, *args, **kwargs):
+        self.down.update(self._names(interfaces))
+
+    def noshut(self, interfaces, *args, **kwargs):
+        self.down.difference_update(self._names(interfaces))
+
+    def verify_shut(self, interfaces, *args, **kwargs):
+        if not set(self._names(interfaces)) <= self.down:
+            raise Exception("%s not shut" % interfaces)
+        return True
+
+    def verify_noshut(self, interfaces, *args, **kwargs):
+        if set(self._names(interfaces)) & self.down:
+            raise Exception("%s not up" % interfaces)
+        return True
+
+    ignored = frozenset(('set_rewrite_ingress_tag_pop', 'add_bundle_interface', 'remove_bundle_interface'))
+
+    def __getattr__(self, name):
+        return _ignored(self, name)
+
+
+class SimFeature:
+    """
+    Feature library without simulated state, only the calls in 'ignored' succeed.
+    """
+
+    ignored = frozenset()
+
+    def __init__(self, device=None, *args, **kwargs):
+        self.device = device
+        self.kwargs = kwargs
+
+    def __getattr__(self, name):
+        return _ignored(self, name)
+
+
+class SimCliHandle(SimFeature):
+    ignored = frozenset(('copy_current_config',))
+
+
+class SimAaa(SimFeature):
+    pass
+
+
+class SimIcmp(SimFeature):
+    pass
+
+
+class SimGre(SimFeature):
+    # only handed to zap.configure_interfaces
+    pass
+
+
+class SimClassMap(SimFeature):
+    # only handed to zap.configure_classmaps
+    pass
+
+
+class SimL2Vpn(SimFeature):
+    ignored = frozenset(('set_bridge_group', 'set_xconnect_v2'))
+
+
+class SimIpStatic(SimFeature):
+    ignored = frozenset(('config_static_route',))
+
+
+class SimNetflow(SimFeature):
+    ignored = frozenset(('set_exporter_map', 'set_sampler_map', 'set_monitor_map', 'set_interface_netflow'))
+
+
+class SimPolicerMapData:
+
+    def __init__(self, policy_name=None, classmap_name=None, matched_pkts=None, **kwargs):
+        self.policy_name = policy_name
+        self.classmap_name = classmap_name
+        self.matched_pkts = matched_pkts
+
+
+class SimPolicyMap(SimFeature):
+    PolicerMapData = SimPolicerMapData
+
+    ignored = frozenset(('clear_qos_counters', 'verify_show_policy_map_stats'))
+
+
+class SimQosHw(SimFeature):
+    """
+    QosHwXrCli of a simulated router, for its hw-module profile.
+    """
+
+    def set_ingress_model_peering(self, enable=True, **kwargs):
+        _set_profile(self.device, 'hw-module profile qos ingress-model peering', enable)
+
+
+class SimTrigger:
+    """
+    Reload or switchover of a simulated router. The router keeps its state
+    and forwards throughout, so the trigger only marks the time.
+    """
+
+    def __init__(self, name, device, **kwargs):
+        self.name = name
+        self.device = device
+        self.kwargs = kwargs
+
+    def run(self):
+        log.info("Sim %s of %s" % (self.name, self.device))
+        return True
+
+
+class SimEvent:
+    """
+    hw.event.Event of a simulated router.
+    """
+
+    def __init__(self, device=None, mode=None, **kwargs):
+        self.device = device
+
+    def ReloadActiveRP(self, **kwargs):
+        return SimTrigger('ReloadActiveRP', self.device, **kwargs)
+
+    def RedundancySwitchOver(self, **kwargs):
+        return SimTrigger('RedundancySwitchOver', self.device, **kwargs)
+
+    def ReloadCard(self, **kwargs):
+        return SimTrigger('ReloadCard', self.device, **kwargs)
+
+    def ReloadAllCards(self, **kwargs):
+        return SimTrigger('ReloadAllCards', self.device, **kwargs)
+
+
+class SimTriggers:
+    """
+    CafyTriggers, running its triggers in the order they were added.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.triggers = []
+
+    def add(self, trigger):
+        self.triggers.append(trigger)
+
+    addTrigger = add
+
+    def run(self):
+        for trigger in self.triggers:
+            trigger.run()
+        return True
@@ -0,0 +1,117 @@
+# **************************************************
+# Copyright (c) 2017 Cisco Systems, Inc.
+# All rights reserved.
+# **************************************************
+
+"""
+Bulk static route loader.
+
+Reads every ipstatic* feature configuration section (ipstatic, ipstatic_16,
+...) for a device, dedupes the routes and configures them with a single
+config_static_route call per address family, so a device gets all of its
+static routes in one payload and one commit.
+"""
+
+import json
+from collections import OrderedDict
+
+from logger.cafylog import CafyLog
+from feature_lib.ip_static import IpStatic
+
+log = CafyLog(name="AclStatic")
+
+
+def merge_static_routes(sections):
+    """
+    Merge ipstatic sections of one device into deduped paths per address family.
+
+    A route is identified by (prefix, prefix_length, next_hop); the same prefix
+    with another next hop is kept as an additional path.
+
+    :param sections: iterable of dicts shaped like the ipstatic/<device> section,
+                     {afi: {'static_prefixes': [...], 'prefix_length': .., 'next_hops': [...]}}
+    :return: OrderedDict afi -> list of path dicts for IpStatic.config_static_route
+    """
+    routes = OrderedDict()
+    seen = set()
+    for section in sections:
+        for afi in section:
+            data = section[afi]
+            prefix_length = data['prefix_length']
+            if len(data['static_prefixes']) != len(data['next_hops']):
+                raise ValueError("%s static routes: %d prefixes but %d next hops"
+                                 % (afi, len(data['static_prefixes']), len(data['next_hops'])))
+            for prefix, next_hop in zip(data['static_prefixes'], data['next_hops']):
+                key = (afi, prefix, str(prefix_length), next_hop)
+                if key in seen:
+                    continue
+                seen.add(key)
+                routes.setdefault(afi, []).append({'prefix': prefix,
+                                                   'prefix_length': prefix_length,
+                                                   'next_hop': next_hop})
+    return routes
+
+
+class StaticRouteLoader:
+    """
+    Configure all ipstatic* routes of a device at once.
+    """
+
+    prefix = 'ipstatic'
+
+    def __init__(self, zap, test_input_file, mode, library=IpStatic):
+        """
+        :param zap: Zap object, used to read the feature sections
+        :param test_input_file: input json, used to list the ipstatic* section names
+        :param mode: cli/yang mode of the IpStatic library
+        :param library: IpStatic class, the simulated one on the sim backend
+        """
+        self.zap = zap
+        self.test_input_file = test_input_file
+        self.mode = mode
+        self.library = library
+        self._features = None
+
+    def features(self):
+        """
+        :return: OrderedDict name -> device names, for every feature configuration
+                 section starting with ipstatic
+        """
+        if self._features is None:
+            with open(self.test_input_file) as input_file:
+                data = json.load(input_file)
+            feature_data = data['TestArguments']['feature_configuration']
+            self._features = OrderedDict((name, list(feature_data[name])) for name in feature_data
+                                         if name.startswith(self.prefix))
+        return self._features
+
+    def routes(self, device):
+        """
+        :param device: router
+        :return: deduped paths per address family for the router
+        """
+        sections = []
+        for feature, devices in self.features().items():
+            if device.identifier not in devices:
+                continue
+            section = self.zap.get_feature_configuration("%s/%s" % (feature, device.identifier))
+            if section:
+                sections.append(section)
+        return merge_static_routes(sections)
+
+    def configure(self, device):
+        """
+        Configure every static route of the device. Call it inside a
+        topo.config() context to get a single commit.
+
+        :param device: router
+        :return: number of routes pushed
+        """
+        routes = self.routes(device)
+        ipstatic_obj = self.library(device=device, name='ipstatic', mode=self.mode)
+        count = 0
+        for afi, paths in routes.items():
+            ipstatic_obj.config_static_route(address_family=afi, paths=paths)
+            count += len(paths)
+        log.info("%s: %d static routes in one payload" % (device.identifier, count))
+        return count
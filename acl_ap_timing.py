@@ -0,0 +1,277 @@
+# **************************************************
+# Copyright (c) 2017 Cisco Systems, Inc.
+# All rights reserved.
+# **************************************************
+
+"""
+Per phase timing of the ACL test classes.
+
+instrument() wraps setup_class, the test methods and teardown_class of every
+test class, plus the library calls the tests spend their time in
+(set_acl_to_interface, _get_loc_int, clear_acl_stats, traffic_verifier,
+get_acl_hit_count). Every call is booked against the class and test running
+at that moment. At the end of the run write_report() dumps a json report,
+ranks the classes by cost and flags (class, phase) totals which got slower
+than in the stored baseline.
+
+    python acl_ap_timing.py --bless timing/run_<stamp>.json     # make a run the baseline
+    python acl_ap_timing.py --compare timing/run_<stamp>.json   # check a run against it
+"""
+
+import argparse
+import functools
+import inspect
+import json
+import os
+import shutil
+import threading
+import time
+from collections import OrderedDict
+
+from logger.cafylog import CafyLog
+
+log = CafyLog(name="AclTiming")
+
+LIBRARY_PHASES = ('set_acl_to_interface', 'clear_acl_stats', 'get_acl_hit_count')
+HELPER_PHASES = ('_get_loc_int', 'traffic_verifier')
+CLASS_PHASES = ('setup_class', 'teardown_class')
+# pytest passes the module/class to these only when the function takes a positional argument
+XUNIT_PHASES = ('setup_module', 'teardown_module') + CLASS_PHASES
+
+REPORT_VERSION = 1
+
+
+class PhaseTimer:
+    """
+    Elapsed time per (class, test, phase) of the run.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.context = threading.local()
+        self.totals = OrderedDict()
+        self.started = time.time()
+
+    def current(self):
+        return getattr(self.context, 'owner', None) or ('<module>', '')
+
+    @property
+    def enabled(self):
+        return os.environ.get('ACL_AP_TIMING', '1') != '0'
+
+    def add(self, owner, phase, elapsed):
+        cls_name, test = owner
+        with self.lock:
+            record = self.totals.setdefault((cls_name, test, phase), [0, 0.0])
+            record[0] += 1
+            record[1] += elapsed
+
+    def timed(self, func, phase, owner=None):
+        """
+        :param func: function to wrap
+        :param phase: phase name booked for the calls
+        :param owner: (class, test) the calls belong to; None books them against
+                      whatever is running, and a given owner becomes the context
+                      of the calls made inside func
+        :return: wrapper
+        """
+        timer = self
+
+        def call(args, kwargs):
+            if not timer.enabled:
+                return func(*args, **kwargs)
+            previous = getattr(timer.context, 'owner', None)
+            booked = owner or timer.current()
+            if owner is not None:
+                timer.context.owner = owner
+            start = time.monotonic()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                timer.add(booked, phase, time.monotonic() - start)
+                timer.context.owner = previous
+
+        if phase in XUNIT_PHASES and getattr(getattr(func, '__code__', None), 'co_argcount', 0):
+            # keep co_argcount, pytest decides from it whether to pass the module/class
+            def wrapper(arg, *args, **kwargs):
+                return call((arg,) + args, kwargs)
+        else:
+            def wrapper(*args, **kwargs):
+                return call(args, kwargs)
+        wrapper = functools.wraps(func)(wrapper)
+        wrapper.__timed__ = True
+        return wrapper
+
+    def classes(self):
+        """
+        :return: OrderedDict class -> {phase: [calls, seconds]}, costliest class first
+        """
+        per_class = {}
+        for (cls_name, _, phase), (calls, elapsed) in self.totals.items():
+            phases = per_class.setdefault(cls_name, {})
+            record = phases.setdefault(phase, [0, 0.0])
+            record[0] += calls
+            record[1] += elapsed
+        # library phases run inside the test phases, rank on the class level phases only
+        cost = lambda item: sum(elapsed for phase, (_, elapsed) in item[1].items()
+                                if phase in CLASS_PHASES or phase.startswith('test'))
+        return OrderedDict(sorted(per_class.items(), key=cost, reverse=True))
+
+    def report(self):
+        classes = self.classes()
+        return {'version': REPORT_VERSION,
+                'started': self.started,
+                'finished': time.time(),
+                'classes': OrderedDict((cls_name, OrderedDict((phase, {'calls': calls, 'seconds': round(elapsed, 3)})
+                                                             for phase, (calls, elapsed) in sorted(phases.items())))
+                                       for cls_name, phases in classes.items()),
+                'tests': [{'class': cls_name, 'test': test, 'phase': phase, 'calls': calls,
+                           'seconds': round(elapsed, 3)}
+                          for (cls_name, test, phase), (calls, elapsed) in self.totals.items()]}
+
+
+TIMER = PhaseTimer()
+
+
+def _wrap_attribute(owner, name, phase, timer, test_owner=None):
+    """
+    Wrap owner.name in place, keeping staticmethod/classmethod semantics.
+    """
+    try:
+        raw = inspect.getattr_static(owner, name)
+    except AttributeError:
+        return False
+    func = raw.__func__ if isinstance(raw, (staticmethod, classmethod)) else raw
+    if not callable(func) or getattr(func, '__timed__', False):
+        return False
+    wrapped = timer.timed(func, phase, test_owner)
+    if isinstance(raw, staticmethod):
+        wrapped = staticmethod(wrapped)
+    elif isinstance(raw, classmethod):
+        wrapped = classmethod(wrapped)
+    setattr(owner, name, wrapped)
+    return True
+
+
+def instrument(namespace, base, libraries=(), timer=TIMER):
+    """
+    Instrument every test class of a module.
+
+    :param namespace: module globals()
+    :param base: base class of the test classes (AclBaseAp); its helpers are timed too
+    :param libraries: library classes whose LIBRARY_PHASES methods are timed (Acl)
+    :param timer: PhaseTimer
+    :return: number of wrapped callables
+    """
+    count = 0
+    for name in HELPER_PHASES:
+        count += _wrap_attribute(base, name, name, timer)
+    for library in libraries:
+        for name in LIBRARY_PHASES:
+            count += _wrap_attribute(library, name, name, timer)
+    for name in ('setup_module', 'teardown_module'):
+        if callable(namespace.get(name)) and not getattr(namespace[name], '__timed__', False):
+            namespace[name] = timer.timed(namespace[name], name, ('<module>', name))
+            count += 1
+    for cls_name, cls in list(namespace.items()):
+        if not (inspect.isclass(cls) and issubclass(cls, base) and cls is not base and cls_name.startswith('Test')):
+            continue
+        for attr in list(vars(cls)):
+            if attr in CLASS_PHASES:
+                count += _wrap_attribute(cls, attr, attr, timer, (cls_name, attr))
+            elif attr.startswith('test'):
+                count += _wrap_attribute(cls, attr, 'test', timer, (cls_name, attr))
+    return count
+
+
+def load_report(path):
+    with open(path) as report_file:
+        return json.load(report_file)
+
+
+def class_seconds(report):
+    """
+    :param report: report dict
+    :return: dict class -> seconds of its setup_class, tests and teardown_class
+    """
+    return dict((cls_name, round(sum(record['seconds'] for phase, record in phases.items()
+                                     if phase in CLASS_PHASES or phase.startswith('test')), 3))
+                for cls_name, phases in report['classes'].items() if not cls_name.startswith('<module>'))
+
+
+def compare(report, baseline, threshold=0.2, min_seconds=5.0):
+    """
+    Flag (class, phase) totals slower than the baseline.
+
+    :param report: report dict of this run
+    :param baseline: report dict of the baseline run
+    :param threshold: allowed relative slow down
+    :param min_seconds: slow downs below this absolute value are noise
+    :return: list of regression dicts, worst first
+    """
+    regressions = []
+    for cls_name, phases in report['classes'].items():
+        base_phases = baseline.get('classes', {}).get(cls_name, {})
+        for phase, record in phases.items():
+            if phase not in base_phases:
+                continue
+            base = base_phases[phase]['seconds']
+            now = record['seconds']
+            if now - base > min_seconds and now > base * (1 + threshold):
+                regressions.append({'class': cls_name, 'phase': phase, 'baseline': base, 'seconds': now,
+                                    'delta': round(now - base, 3)})
+    return sorted(regressions, key=lambda item: item['delta'], reverse=True)
+
+
+def write_report(directory, timer=TIMER, baseline_name='baseline.json', top=20):
+    """
+    Write the report of the run, log the costliest classes and the regressions.
+
+    :param directory: report directory, also holding the baseline
+    :return: path of the report
+    """
+    report = timer.report()
+    baseline_file = os.path.join(directory, baseline_name)
+    if os.path.exists(baseline_file):
+        report['regressions'] = compare(report, load_report(baseline_file))
+    else:
+        report['regressions'] = []
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, 'run_%s.json' % time.strftime('%Y%m%d_%H%M%S', time.localtime(timer.started)))
+    with open(path, 'w') as report_file:
+        json.dump(report, report_file, indent=2)
+
+    for cls_name, phases in list(report['classes'].items())[:top]:
+        log.info("%-60s %s" % (cls_name, ', '.join('%s %.1fs' % (phase, record['seconds'])
+                                                  for phase, record in phases.items())))
+    for regression in report['regressions']:
+        log.warning("Timing regression %(class)s/%(phase)s: %(seconds).1fs, baseline %(baseline).1fs" % regression)
+    log.info("Timing report written to %s" % path)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ACL AP timing reports")
+    parser.add_argument('--bless', help="make this report the baseline")
+    parser.add_argument('--compare', help="compare this report with the baseline")
+    parser.add_argument('--baseline', default=None, help="baseline file, <report dir>/baseline.json by default")
+    parser.add_argument('--threshold', type=float, default=0.2)
+    parser.add_argument('--min-seconds', type=float, default=5.0)
+    args = parser.parse_args()
+
+    report_path = args.bless or args.compare
+    if not report_path:
+        parser.error("--bless or --compare is required")
+    baseline = args.baseline or os.path.join(os.path.dirname(os.path.abspath(report_path)), 'baseline.json')
+    if args.bless:
+        shutil.copyfile(args.bless, baseline)
+        print("%s is the new baseline" % args.bless)
+        return 0
+    regressions = compare(load_report(args.compare), load_report(baseline), args.threshold, args.min_seconds)
+    for regression in regressions:
+        print("%(class)s %(phase)s: %(baseline).1fs -> %(seconds).1fs (+%(delta).1fs)" % regression)
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
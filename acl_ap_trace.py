@@ -0,0 +1,249 @@
+# **************************************************
+# Copyright (c) 2017 Cisco Systems, Inc.
+# All rights reserved.
+# **************************************************
+
+"""
+Chrome/Perfetto trace of a run.
+
+With ACL_AP_TRACE=<file.json> every public call of the traced library
+classes (Acl, IfMgr, L2Vpn, Zap, the Tgen and the devices) becomes a span on
+the thread making it. Context managers returned by those calls, like
+topo.config(..., thread=True), get a 'commit' span from __enter__ to
+__exit__, start_traffic/stop_traffic pairs a 'traffic' span and
+Helper.sleep a 'sleep' span. Load the file in chrome://tracing or
+ui.perfetto.dev.
+"""
+
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+
+from logger.cafylog import CafyLog
+from utils.helper import Helper
+
+log = CafyLog(name="AclTrace")
+
+
+class Tracer:
+    """
+    Collects complete ('X') events in the Chrome trace event format.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.events = []
+        self.threads = {}
+        self.origin = time.perf_counter()
+        self.pid = os.getpid()
+        self.windows = {}
+
+    def now(self):
+        return (time.perf_counter() - self.origin) * 1e6
+
+    def _tid(self):
+        thread = threading.current_thread()
+        tid = threading.get_ident()
+        if tid not in self.threads:
+            self.threads[tid] = thread.name
+        return tid
+
+    def complete(self, name, cat, start, end, args=None, tid=None):
+        event = {'name': name, 'cat': cat, 'ph': 'X', 'ts': round(start, 1), 'dur': round(end - start, 1),
+                 'pid': self.pid, 'tid': self._tid() if tid is None else tid}
+        if args:
+            event['args'] = args
+        with self.lock:
+            self.events.append(event)
+
+    def instant(self, name, cat, args=None):
+        event = {'name': name, 'cat': cat, 'ph': 'i', 's': 't', 'ts': round(self.now(), 1),
+                 'pid': self.pid, 'tid': self._tid()}
+        if args:
+            event['args'] = args
+        with self.lock:
+            self.events.append(event)
+
+    def span(self, name, cat, args=None):
+        return _Span(self, name, cat, args)
+
+    def window_start(self, key):
+        self.windows[key] = (self.now(), self._tid())
+
+    def window_stop(self, key, name, cat):
+        start = self.windows.pop(key, None)
+        if start is not None:
+            self.complete(name, cat, start[0], self.now(), {'streams': list(key)}, tid=start[1])
+
+    def export(self, path):
+        """
+        :param path: output json file
+        :return: number of events written
+        """
+        metadata = [{'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': tid, 'args': {'name': name}}
+                    for tid, name in self.threads.items()]
+        with self.lock:
+            events = metadata + sorted(self.events, key=lambda event: event['ts'])
+        with open(path, 'w') as trace_file:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, trace_file)
+        log.info("Trace of %d events written to %s" % (len(events), path))
+        return len(events)
+
+
+class _Span:
+
+    def __init__(self, tracer, name, cat, args):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        self.start = self.tracer.now()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        args = dict(self.args or {})
+        if exc_type is not None:
+            args['error'] = exc_type.__name__
+        self.tracer.complete(self.name, self.cat, self.start, self.tracer.now(), args)
+        return False
+
+
+class _TracedContext:
+    """
+    Context manager proxy recording the time between __enter__ and __exit__,
+    i.e. the batched config and its commit for topo.config().
+    """
+
+    def __init__(self, tracer, context, name):
+        self._tracer = tracer
+        self._context = context
+        self._name = name
+
+    def __enter__(self):
+        self._start = self._tracer.now()
+        return self._context.__enter__()
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            return self._context.__exit__(exc_type, exc, tb)
+        finally:
+            self._tracer.complete(self._name, 'commit', self._start, self._tracer.now(),
+                                  {'error': exc_type.__name__} if exc_type else None)
+
+    def __getattr__(self, name):
+        return getattr(self._context, name)
+
+
+TRACER = Tracer()
+
+
+def _describe(args, kwargs):
+    """
+    Short, json safe summary of the call arguments.
+    """
+    summary = {}
+    for key, value in kwargs.items():
+        if isinstance(value, (str, int, float, bool)) or value is None:
+            summary[key] = value
+        elif isinstance(value, (list, tuple)) and len(value) <= 8:
+            summary[key] = [str(item) for item in value]
+    return summary
+
+
+def traced(func, name, cat, tracer=TRACER):
+    """
+    :return: wrapper of func recording a span per call
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = tracer.now()
+        error = None
+        try:
+            result = func(*args, **kwargs)
+        except Exception as err:
+            error = type(err).__name__
+            raise
+        finally:
+            call_args = _describe(args, kwargs)
+            if error:
+                call_args['error'] = error
+            tracer.complete(name, cat, start, tracer.now(), call_args)
+        if name.endswith('start_traffic'):
+            tracer.window_start(_traffic_key(args, kwargs))
+        elif name.endswith('stop_traffic'):
+            tracer.window_stop(_traffic_key(args, kwargs), 'traffic window', 'traffic')
+        if hasattr(result, '__enter__') and hasattr(result, '__exit__') and not isinstance(result, _TracedContext):
+            return _TracedContext(tracer, result, '%s commit' % name)
+        return result
+    wrapper.__traced__ = True
+    return wrapper
+
+
+def _traffic_key(args, kwargs):
+    """
+    :return: hashable key of the streams of a start_traffic/stop_traffic(self, traffic_list) call
+    """
+    streams = kwargs.get('traffic_list') or (args[1] if len(args) > 1 else None) or ['all']
+    if isinstance(streams, str):
+        streams = [streams]
+    return tuple(streams)
+
+
+def trace_class(cls, cat, methods=None, tracer=TRACER):
+    """
+    Trace the methods of a class in place.
+
+    :param cls: class to instrument (Acl, IfMgr, ...)
+    :param cat: trace category of its spans
+    :param methods: names to trace, every public method by default
+    :return: number of traced methods
+    """
+    count = 0
+    names = methods or [name for name in dir(cls) if not name.startswith('_')]
+    for name in names:
+        try:
+            raw = inspect.getattr_static(cls, name)
+        except AttributeError:
+            continue
+        if isinstance(raw, staticmethod):
+            func, rewrap = raw.__func__, staticmethod
+        elif isinstance(raw, classmethod):
+            func, rewrap = raw.__func__, classmethod
+        elif inspect.isfunction(raw):
+            func, rewrap = raw, None
+        else:
+            continue
+        if getattr(func, '__traced__', False):
+            continue
+        wrapped = traced(func, '%s.%s' % (cls.__name__, name), cat, tracer)
+        setattr(cls, name, rewrap(wrapped) if rewrap else wrapped)
+        count += 1
+    return count
+
+
+def trace_path():
+    return os.environ.get('ACL_AP_TRACE')
+
+
+def enable(libraries, objects=(), tracer=TRACER):
+    """
+    Instrument a run.
+
+    :param libraries: (class, category) pairs, e.g. (Acl, 'acl')
+    :param objects: (object, category) pairs whose classes are only known at
+                    run time: the topology (config commits), the Tgen, the routers
+    :return: number of traced methods
+    """
+    count = trace_class(Helper, 'sleep', methods=['sleep'], tracer=tracer)
+    for cls, cat in libraries:
+        count += trace_class(cls, cat, tracer=tracer)
+    for obj, cat in objects:
+        count += trace_class(type(obj), cat, tracer=tracer)
+    log.info("Tracing %d methods" % count)
+    return count
@@ -0,0 +1,159 @@
+# **************************************************
+# Copyright (c) 2017 Cisco Systems, Inc.
+# All rights reserved.
+# **************************************************
+
+"""
+Batched traffic verification.
+
+AclBaseAp.traffic_verifier starts and stops the generator for the one or two
+streams of a single test step. BatchTrafficVerifier takes the union of the
+streams several steps need, runs them in one start/stop window, pulls the
+stats of all of them with one verify_traffic query and keeps them in a
+TrafficResultCache keyed by stream name. Each step is then served from the
+cache with the same ApData.stream_stats layout traffic_verifier produces.
+"""
+
+from collections import OrderedDict
+
+from logger.cafylog import CafyLog
+from utils.helper import Helper
+
+log = CafyLog(name="AclTraffic")
+
+
+def parse_item_stats(traffic_stats):
+    """
+    :param traffic_stats: (item_stats, flow_stats) as returned by Tgen.verify_traffic
+    :return: OrderedDict stream name -> stats dict ('Tx Frames', 'Rx Frames', ...)
+    """
+    item_stats = traffic_stats[0]
+    stats = OrderedDict()
+    for i in range(1, len(item_stats) + 1):
+        stats[item_stats[i]['Traffic Item']] = item_stats[i]
+    return stats
+
+
+def query_traffic_stats(tgen, tolerance=5, expected=None):
+    """
+    One verify_traffic round trip. A failed verification still carries the
+    stats in the exception, exactly like setup_module handles it.
+
+    :return: OrderedDict stream name -> stats dict
+    """
+    try:
+        traffic_stats = tgen.verify_traffic(tolerance=tolerance, expected=expected)
+    except Exception as err:
+        traffic_stats = err.args[0]
+    return parse_item_stats(traffic_stats)
+
+
+class TrafficResultCache:
+    """
+    Stats of the last traffic window each stream ran in.
+    """
+
+    def __init__(self):
+        self.results = {}
+        self.window = 0
+
+    def store(self, stats, streams):
+        """
+        :param stats: stream name -> stats dict of the window
+        :param streams: streams which actually ran in the window
+        """
+        self.window += 1
+        for stream in streams:
+            if stream in stats:
+                self.results[stream] = (self.window, stats[stream])
+
+    def get(self, stream):
+        return self.results[stream][1]
+
+    def __contains__(self, stream):
+        return stream in self.results
+
+    def invalidate(self, streams=None):
+        """
+        Drop cached results, all of them or only the given streams. Must be
+        called whenever the config under test changes after the window ran.
+        """
+        if streams is None:
+            self.results = {}
+            return
+        for stream in streams:
+            self.results.pop(stream, None)
+
+
+class BatchTrafficVerifier:
+    """
+    Run the streams of several verification steps in a single traffic window.
+
+    Usage::
+
+        batch = BatchTrafficVerifier(ApData.Tgen)
+        batch.run(['uut1_Ospf_Phy', 'peer1_In_Ospf_Phy'])
+        ...
+        batch.serve(ApData, ['uut1_Ospf_Phy'])     # fills ApData.stream_stats
+        ...
+        batch.serve(ApData, ['peer1_In_Ospf_Phy'])
+    """
+
+    def __init__(self, tgen, duration=20, tolerance=5, cache=None):
+        """
+        :param tgen: traffic generator device
+        :param duration: traffic window in seconds
+        :param tolerance: tolerance passed to verify_traffic
+        :param cache: TrafficResultCache shared between verifiers, a new one by default
+        """
+        self.tgen = tgen
+        self.duration = duration
+        self.tolerance = tolerance
+        self.cache = cache if cache is not None else TrafficResultCache()
+
+    def run(self, stream_names):
+        """
+        Run the union of the given streams once and cache their stats.
+
+        :param stream_names: stream names, or lists of stream names (one per step)
+        :return: OrderedDict stream name -> stats dict for the streams of the window
+        """
+        streams = []
+        for item in stream_names:
+            for stream in ([item] if isinstance(item, str) else item):
+                if stream not in streams:
+                    streams.append(stream)
+
+        if not self.tgen.verify_arp_status():
+            log.info("ARP status verification has failed")
+        if self.tgen.platform != 'IXIA':
+            self.tgen._perform('ResultClearAllTrafficCommand')
+        self.tgen.start_traffic(traffic_list=streams)
+        Helper.sleep(self.duration, msg='Running %d streams in one traffic window' % len(streams))
+        self.tgen.stop_traffic(traffic_list=streams)
+
+        stats = query_traffic_stats(self.tgen, tolerance=self.tolerance)
+        missing = [stream for stream in streams if stream not in stats]
+        if missing:
+            log.warning("No traffic stats returned for %s" % missing)
+        self.cache.store(stats, streams)
+        return OrderedDict((stream, stats[stream]) for stream in streams if stream in stats)
+
+    def serve(self, data, stream_name):
+        """
+        Drop in for AclBaseAp.traffic_verifier(data, stream_name=...) served from
+        the cache; streams not in the cache are run in a window of their own.
+
+        :param data: ApData
+        :param stream_name: list of stream names of the step
+        :return: None, data.stream_stats / txcount / rxcount are updated
+        """
+        pending = [stream for stream in stream_name if stream not in self.cache]
+        if pending:
+            self.run(pending)
+        data.stream_stats = {}
+        for stream in stream_name:
+            data.stream_stats[stream] = self.cache.get(stream)
+            data.txcount = data.stream_stats[stream]['Tx Frames']
+            data.rxcount = data.stream_stats[stream]['Rx Frames']
+            log.info(data.stream_stats[stream])
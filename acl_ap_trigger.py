@@ -0,0 +1,167 @@
+# **************************************************
+# Copyright (c) 2017 Cisco Systems, Inc.
+# All rights reserved.
+# **************************************************
+
+"""
+Trigger matrix: configure and baseline once, then trigger and re-verify.
+
+The process restart classes are parametrized over the processes of
+testcase_configuration.process_locations, and every parameter attached the
+ACLs again, added the ACEs again and ran its own pre-trigger traffic
+baseline. TriggerMatrix attaches the targets of a MultiInterfaceVerifier and
+takes the baseline once; each trigger is then fired and the same targets are
+verified in one traffic window:
+
+    verifier = MultiInterfaceVerifier(ApData, AclBaseAp, bind_kwargs={'compress_level': 3})
+    verifier.add('Egress', 'Tc6', ['uut1_Ospf_Phy'], [seq])
+    matrix = TriggerMatrix(verifier, ProcessRestart(ApData, verifier))
+    matrix.baseline()
+    matrix.trigger('pfilter_ma')                  # one parametrized test per process
+    matrix.run(['pfilter_ea', 'ipv4_acl_mgr'])    # or all of them in one go
+    matrix.close()
+
+ProcessRestart restarts a process on every location listed for it, the
+active RP for 'rp' and the line cards of the targets for 'lc', concurrently.
+"""
+
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from logger.cafylog import CafyLog
+from hw.process import Process
+
+log = CafyLog(name="AclTrigger")
+
+
+class ProcessRestart:
+    """
+    Restart a process on all of its locations at once.
+    """
+
+    def __init__(self, data, verifier):
+        """
+        :param data: ApData
+        :param verifier: MultiInterfaceVerifier whose attached line cards stand for 'lc'
+        """
+        self.data = data
+        self.verifier = verifier
+
+    def line_cards(self):
+        cards = []
+        for ctx in self.verifier.contexts.values():
+            cards.extend(location for location in ctx.locations if location not in cards)
+        return cards
+
+    def locations(self, process):
+        """
+        :return: locations of testcase_configuration.process_locations for the process
+        """
+        nodes = self.data.acl_model.test_args['testcase_configuration']['process_locations'][process]
+        locations = []
+        for node in nodes:
+            for location in ([self.data.inventory.get_xr_active_rp()] if node == 'rp' else
+                             self.line_cards() if node == 'lc' else [node]):
+                if location not in locations:
+                    locations.append(location)
+        return locations
+
+    def _restart(self, process, location):
+        log.banner('Restart the process %s on the location %s' % (process, location))
+        process_lib = Process(device=self.data.UUT1, mode=self.data.mode)
+        try:
+            process_obj = process_lib.Restart(process_lib, process, location=location)
+            process_obj.launch()
+            process_obj.checker()
+        except Exception as exception_error:
+            log.error(exception_error)
+            return exception_error
+        return None
+
+    def __call__(self, process):
+        """
+        :return: OrderedDict location -> restart error or None; restart errors are
+                 logged, the verification after the trigger decides the result
+        """
+        locations = self.locations(process)
+        with ThreadPoolExecutor(max_workers=len(locations) or 1) as pool:
+            errors = list(pool.map(lambda location: self._restart(process, location), locations))
+        return OrderedDict(zip(locations, errors))
+
+
+class TriggerMatrix:
+    """
+    One configuration and baseline, any number of trigger and verify rounds.
+    """
+
+    def __init__(self, verifier, fire):
+        """
+        :param verifier: MultiInterfaceVerifier with its targets added
+        :param fire: callable firing a trigger by name, e.g. ProcessRestart
+        """
+        self.verifier = verifier
+        self.fire = fire
+        self.attached = False
+        self.results = OrderedDict()
+
+    def baseline(self):
+        """
+        Attach the targets and verify them once before any trigger.
+        """
+        start = time.monotonic()
+        self.attached = True
+        try:
+            self.verifier.attach()
+            self.verifier.verify()
+        except Exception:
+            self.close()
+            raise
+        log.info("Trigger matrix baseline of %s in %.1fs" % (', '.join(self.verifier.targets),
+                                                             time.monotonic() - start))
+
+    def trigger(self, name):
+        """
+        Fire one trigger and verify the targets again.
+
+        :return: OrderedDict target name -> TestContext of the verification
+        """
+        if not self.attached:
+            self.baseline()
+        start = time.monotonic()
+        fired = self.fire(name)
+        try:
+            contexts = self.verifier.verify()
+        except Exception as err:
+            self.results[name] = (False, time.monotonic() - start, fired)
+            log.error("Trigger %s: verification failed, %s" % (name, err))
+            raise
+        self.results[name] = (True, time.monotonic() - start, fired)
+        log.info("Trigger %s verified in %.1fs" % (name, self.results[name][1]))
+        return contexts
+
+    def run(self, names):
+        """
+        Fire every trigger in turn, carrying on after a failed verification.
+
+        :return: OrderedDict trigger name -> passed
+        """
+        failed = []
+        for name in names:
+            try:
+                self.trigger(name)
+            except Exception:
+                failed.append(name)
+        if failed:
+            raise AssertionError("Verification failed after %s" % ', '.join(failed))
+        return OrderedDict((name, self.results[name][0]) for name in names)
+
+    def close(self):
+        """
+        Detach the targets and log the per trigger times.
+        """
+        if self.attached:
+            self.verifier.detach()
+            self.attached = False
+        for name, (passed, seconds, _) in self.results.items():
+            log.info("Trigger %-16s %s in %.1fs" % (name, 'passed' if passed else 'FAILED', seconds))
@@ -0,0 +1,205 @@
+# **************************************************
+# Copyright (c) 2017 Cisco Systems, Inc.
+# All rights reserved.
+# **************************************************
+
+"""
+Condition based waits for the ACL AP script.
+
+wait_until() polls a readiness predicate with exponential backoff until it
+holds or the deadline expires. Every wait is recorded against the fixed
+Helper.sleep it replaced so the run can report how much wall time was saved.
+"""
+
+import re
+import time
+
+from logger.cafylog import CafyLog
+from utils.cafyexception import CafyException
+
+log = CafyLog(name="AclWait")
+
+
+class WaitLedger:
+    """
+    Book keeping of every wait_until() call of the run.
+    """
+
+    def __init__(self):
+        self.records = []
+
+    def record(self, msg, legacy_sleep, elapsed, met):
+        self.records.append({'msg': msg,
+                             'legacy_sleep': legacy_sleep,
+                             'elapsed': round(elapsed, 3),
+                             'met': met})
+
+    @property
+    def saved(self):
+        """
+        :return: seconds saved versus the fixed sleeps (negative if slower)
+        """
+        return sum(rec['legacy_sleep'] - rec['elapsed'] for rec in self.records
+                   if rec['legacy_sleep'] is not None)
+
+    def report(self):
+        """
+        Log a one line summary per wait and the total saving.
+
+        :return: total seconds saved
+        """
+        for rec in self.records:
+            was = '' if rec['legacy_sleep'] is None else ' (was %ss sleep)' % rec['legacy_sleep']
+            log.info("wait '%s': %.1fs%s%s" % (rec['msg'], rec['elapsed'], was,
+                                              '' if rec['met'] else ' TIMED OUT'))
+        log.info("Condition based waits saved %.1f seconds over %d waits" % (self.saved, len(self.records)))
+        return self.saved
+
+    def clear(self):
+        self.records = []
+
+
+WAITS = WaitLedger()
+
+
+def wait_until(predicate, timeout, legacy_sleep=None, msg='', interval=1, backoff=2, max_interval=16,
+               settle=0, raise_on_timeout=False):
+    """
+    Poll predicate until it returns a truthy value or timeout expires.
+
+    An exception raised by the predicate counts as "not ready yet".
+
+    :param predicate: callable without arguments
+    :param timeout: deadline in seconds
+    :param legacy_sleep: the fixed sleep this wait replaces, for the saving report
+    :param msg: description used in the log and report
+    :param interval: first poll interval in seconds
+    :param backoff: multiplier applied to the interval after every failed poll
+    :param max_interval: upper bound of the poll interval
+    :param settle: seconds to let pass before the first poll, for conditions
+                   which are trivially true right after the trigger (traffic counters)
+    :param raise_on_timeout: raise VerificationError instead of returning False
+    :return: True if the condition was met before the deadline
+    """
+    start = time.monotonic()
+    deadline = start + timeout
+    delay = interval
+    met = False
+    if settle:
+        time.sleep(min(settle, timeout))
+    while True:
+        try:
+            met = bool(predicate())
+        except Exception as err:
+            log.debug("wait '%s': predicate raised %s" % (msg, err))
+            met = False
+        now = time.monotonic()
+        if met or now >= deadline:
+            break
+        time.sleep(min(delay, deadline - now))
+        delay = min(delay * backoff, max_interval)
+
+    elapsed = time.monotonic() - start
+    WAITS.record(msg, legacy_sleep, elapsed, met)
+    if met:
+        log.info("wait '%s' satisfied after %.1f seconds" % (msg, elapsed))
+    else:
+        log.warning("wait '%s' not satisfied within %s seconds" % (msg, timeout))
+        if raise_on_timeout:
+            raise CafyException.VerificationError("Timed out waiting for %s" % msg)
+    return met
+
+
+################################## readiness predicates ##################################
+
+def _no_raise(func, *args, **kwargs):
+    """
+    Wrap a verify_* style API, which raises on failure, into a predicate.
+    """
+    def predicate():
+        func(*args, **kwargs)
+        return True
+    return predicate
+
+
+def all_of(*predicates):
+    """
+    :return: predicate true once every given predicate holds
+    """
+    return lambda: all(predicate() for predicate in predicates)
+
+
+def arp_resolved(tgen):
+    """
+    :param tgen: traffic generator device
+    :return: predicate true once ARP/ND is resolved on every port
+    """
+    return lambda: tgen.verify_arp_status()
+
+
+def traffic_converged(tgen, tolerance=5):
+    """
+    :param tgen: traffic generator device with traffic running
+    :param tolerance: allowed tx/rx difference in percent
+    :return: predicate true once every stream forwards within tolerance
+    """
+    return _no_raise(tgen.verify_traffic, tolerance=tolerance)
+
+
+def interface_state(ifmgr, interfaces, up=True):
+    """
+    :param ifmgr: IfMgr of the device owning the interfaces
+    :param interfaces: interface name or list of names, as taken by verify_shut/verify_noshut
+    :param up: wait for up (noshut) or down (shut)
+    :return: predicate true once the interfaces reached the state
+    """
+    if up:
+        return _no_raise(ifmgr.verify_noshut, interfaces)
+    return _no_raise(ifmgr.verify_shut, interfaces)
+
+
+def acl_programmed(acl_obj, access_list_names):
+    """
+    Readiness of one or more ACLs, based on get_acl_ace_oper.
+
+    An ACL counts as programmed once its operational data returns ACEs.
+    Names already confirmed are not queried again on the next polls.
+
+    :param acl_obj: Acl object of the device
+    :param access_list_names: acl name or list of acl names
+    :return: predicate
+    """
+    if isinstance(access_list_names, str):
+        access_list_names = [access_list_names]
+    pending = list(access_list_names)
+
+    def predicate():
+        for name in list(pending):
+            if not acl_obj.get_acl_ace_oper(access_list_name=name):
+                return False
+            pending.remove(name)
+        return True
+    return predicate
+
+
+def policy_map_applied(cli_obj, policy_name, interface, direction):
+    """
+    Readiness of a service policy, read from the attachment state of the interface.
+
+    show policy-map interface prints "<interface> <direction>: <policy>" once
+    the policy is installed and "Service Policy not installed" before that.
+
+    :param cli_obj: feature library object of the device, for the show command
+    :param policy_name: service policy expected on the interface
+    :param interface: interface carrying the service policy
+    :param direction: 'input' or 'output'
+    :return: predicate
+    """
+    attached = re.compile(r'^\s*%s\s+%s:\s*%s\s*$' % (re.escape(interface), direction, re.escape(policy_name)),
+                          re.MULTILINE)
+
+    def predicate():
+        output = cli_obj._push_configuration("show policy-map interface %s %s" % (interface, direction),
+                                             mode="execute")
+        return bool(attached.search(str(output or '')))
+    return predicate
@@ -0,0 +1,52 @@
+# **************************************************
+# Copyright (c) 2017 Cisco Systems, Inc.
+# All rights reserved.
+# **************************************************
+
+from acl_ap_context import StepData, contextualize
+
+
+class Data:
+    stream_stats = {'peer1_In_TCP_Phy': {'Tx Frames': '10', 'Rx Frames': '10'}}
+    aclname = 'acl_1'
+
+
+class Base:
+
+    @staticmethod
+    def traffic_verifier(data, stream_name=None):
+        # legacy helpers fill ApData.stream_stats in place
+        for name in stream_name:
+            data.stream_stats[name] = {'Tx Frames': '100', 'Rx Frames': '99'}
+        data.stream_stats['peer1_In_TCP_Phy']['Rx Frames'] = '0'
+
+
+def test_in_place_writes_stay_in_the_context():
+    contextualize(Base)
+    ctx = Base.traffic_verifier(Data, stream_name=['peer1_In_UDP_Phy'], publish=False)
+
+    assert ctx.stream_stats['peer1_In_UDP_Phy']['Tx Frames'] == '100'
+    assert ctx.stream_stats['peer1_In_TCP_Phy']['Rx Frames'] == '0'
+    assert Data.stream_stats == {'peer1_In_TCP_Phy': {'Tx Frames': '10', 'Rx Frames': '10'}}
+
+
+def test_published_in_place_writes_reach_the_data():
+    class Published(Data):
+        stream_stats = {'peer1_In_TCP_Phy': {'Tx Frames': '10', 'Rx Frames': '10'}}
+
+    contextualize(Base)
+    Base.traffic_verifier(Published, stream_name=['peer1_In_UDP_Phy'])
+    assert Published.stream_stats['peer1_In_UDP_Phy']['Rx Frames'] == '99'
+    assert Published.stream_stats['peer1_In_TCP_Phy']['Rx Frames'] == '0'
+
+
+def test_plain_reads_are_not_copied():
+    step = StepData(Data)
+    assert step.aclname == 'acl_1'
+    assert step.written() == {}
+
+
+def test_unchanged_copies_are_not_written():
+    step = StepData(Data)
+    assert step.stream_stats['peer1_In_TCP_Phy']['Tx Frames'] == '10'
+    assert step.written() == {}
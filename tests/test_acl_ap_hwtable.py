@@ -0,0 +1,34 @@
+# **************************************************
+# Copyright (c) 2017 Cisco Systems, Inc.
+# All rights reserved.
+# **************************************************
+
+from collections import namedtuple
+
+import pytest
+
+from utils.cafyexception import CafyException
+from acl_ap_hwtable import HardwareTable
+
+Entry = namedtuple('Entry', ['sequence_number', 'matches'])
+
+
+def table(count, matches=10):
+    return HardwareTable.from_entries(Entry(seq * 10, matches) for seq in range(count))
+
+
+def test_verify_hits_every_ace_of_the_range():
+    assert table(200).verify_hits(start=3, stop=190, high=100).ok
+
+
+@pytest.mark.parametrize('count, start, stop', [(0, 3, 1990), (0, 0, None), (190, 3, 1990), (200, 190, 190)])
+def test_verify_hits_fails_on_missing_entries(count, start, stop):
+    with pytest.raises(CafyException.VerificationError):
+        table(count).verify_hits(start=start, stop=stop, high=100)
+
+
+def test_verify_hits_fails_on_unhit_ace():
+    hw_table = table(200)
+    hw_table.matches[50] = 0
+    with pytest.raises(CafyException.VerificationError):
+        hw_table.verify_hits(start=3, stop=190, high=100)
@@ -0,0 +1,63 @@
+# **************************************************
+# Copyright (c) 2017 Cisco Systems, Inc.
+# All rights reserved.
+# **************************************************
+
+import pytest
+
+import contextlib
+
+from acl_ap_scale import ScaleAclLoader, chunk_profiles, scale_aces, scale_aclnames
+
+PROFILE = {'address_family': 'ipv4', 'sequence_number': '15', 'number of acls': '01', 'aclname': 'Scale_eg_ipv4',
+           'number of aces': '200', 'step': 2, 'action_permit_start_for_single_ace': '2',
+           'action_permit_end_for_single_ace': '3', 'action_permit_start_for_multiple_ace': '40',
+           'action_permit_end_for_multiple_ace': '120', 'protocol_name': ['udp', 'end']}
+
+
+@pytest.mark.parametrize('size', [1000, 200, 100, 64, 33, 2])
+def test_chunks_render_the_whole_profile(size):
+    chunks = list(chunk_profiles(PROFILE, '185.0.0.1', '195.0.0.1', size))
+    rendered = [ace for entry, src, dest in chunks for ace in scale_aces(entry, src, dest)]
+
+    assert rendered == list(scale_aces(PROFILE, '185.0.0.1', '195.0.0.1'))
+    assert all(int(entry['number of aces']) > 1 for entry, _, _ in chunks)
+
+
+def test_ipv6_chunks_render_the_whole_profile():
+    profile = dict(PROFILE, address_family='ipv6', **{'number of aces': '120'})
+    chunks = chunk_profiles(profile, '185::1', '195::1', 50)
+    rendered = [ace for entry, src, dest in chunks for ace in scale_aces(entry, src, dest)]
+
+    assert rendered == list(scale_aces(profile, '185::1', '195::1'))
+
+
+def test_several_acls_are_left_to_zap_whole():
+    profile = dict(PROFILE, **{'number of acls': '04'})
+    assert list(chunk_profiles(profile, '185.0.0.1', '195.0.0.1', 10)) == [(profile, '185.0.0.1', '195.0.0.1')]
+
+
+class Recorder:
+
+    def __init__(self):
+        self.calls = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+    @contextlib.contextmanager
+    def config(self, *args, **kwargs):
+        yield
+
+
+def test_loader_journals_the_acls_zap_creates():
+    journal, acl = Recorder(), Recorder()
+    loader = ScaleAclLoader(Recorder(), Recorder(), 'R1', lambda: acl, chunk_size=100, journal=journal)
+    profile = dict(PROFILE, **{'number of acls': '02'})
+
+    loader.load([profile], '185.0.0.1', '195.0.0.1')
+    loader.sweep([profile], '185.0.0.1', '195.0.0.1', chunk_sizes=(100,))
+
+    assert scale_aclnames(profile) == ['Scale_eg_ipv4_1', 'Scale_eg_ipv4_2']
+    assert [args[0] for name, args, _ in journal.calls if name == 'created_acl'] == scale_aclnames(profile) * 2
+    assert [kwargs['access_list_name'] for name, _, kwargs in acl.calls] == scale_aclnames(profile)
@@ -0,0 +1,38 @@
+# **************************************************
+# Copyright (c) 2017 Cisco Systems, Inc.
+# All rights reserved.
+# **************************************************
+
+import json
+import os
+
+from acl_ap_shard import Bed, merge_timing
+
+
+def write_run(out_dir, bed, **report):
+    path = os.path.join(str(out_dir), 'timing', bed.name, 'run_1.json')
+    os.makedirs(os.path.dirname(path))
+    with open(path, 'w') as report_file:
+        json.dump(dict({'version': 1, 'classes': {}, 'tests': []}, **report), report_file)
+
+
+def test_merge_timing_without_wall_clock(tmpdir):
+    beds = [Bed('bed1', 'topo1.json', 'input1.json'), Bed('bed2', 'topo2.json', 'input2.json')]
+    write_run(tmpdir, beds[0], started=None, finished=None)
+
+    with open(merge_timing(beds, str(tmpdir), str(tmpdir.join('missing.json')))) as report_file:
+        merged = json.load(report_file)
+
+    assert 'started' not in merged and 'finished' not in merged
+    assert list(merged['beds']) == ['bed1']
+
+
+def test_merge_timing_spans_the_beds(tmpdir):
+    beds = [Bed('bed1', 'topo1.json', 'input1.json'), Bed('bed2', 'topo2.json', 'input2.json')]
+    write_run(tmpdir, beds[0], started=20.0, finished=50.0)
+    write_run(tmpdir, beds[1], started=10.0, finished=40.0)
+
+    with open(merge_timing(beds, str(tmpdir), str(tmpdir.join('missing.json')))) as report_file:
+        merged = json.load(report_file)
+
+    assert (merged['started'], merged['finished']) == (10.0, 50.0)
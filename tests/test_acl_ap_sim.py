@@ -0,0 +1,48 @@
+# **************************************************
+# Copyright (c) 2017 Cisco Systems, Inc.
+# All rights reserved.
+# **************************************************
+
+import os
+
+import pytest
+
+from conftest import ROOT
+
+
+def test_sim_runs_setup_module_and_a_class(pytester, monkeypatch, tmp_path):
+    pytest.importorskip('acl_base_ap_compress')
+    monkeypatch.setenv('ACL_AP_BACKEND', 'sim')
+    monkeypatch.setenv('ACL_AP_MODEL_CACHE', str(tmp_path / 'model'))
+    monkeypatch.setenv('ACL_AP_TIMING_DIR', str(tmp_path / 'timing'))
+    result = pytester.runpytest_subprocess('-p', 'no:cacheprovider', '--rootdir', ROOT,
+                                           os.path.join(ROOT, 'acl_ap_main.py') + '::TestIPv4PortIngressAclEqualto')
+    result.assert_outcomes(passed=1)
+
+
+def test_sim_rejects_calls_it_does_not_simulate():
+    from acl_ap_sim import SimAcl, SimZap
+
+    zap = SimZap(os.path.join(ROOT, 'acl_ap_input.json'))
+    acl = SimAcl(zap.get_device('R1'))
+    assert acl.set_network_object_group_acl() is True
+    with pytest.raises(AttributeError):
+        acl.set_acl_to_interfaces
+    with pytest.raises(AttributeError):
+        zap.configure_interface
+
+
+def test_sim_bundle_members_and_service_policy():
+    from acl_ap_sim import SimAcl, SimIfMgr, SimZap
+
+    zap = SimZap(os.path.join(ROOT, 'acl_ap_input.json'))
+    device = zap.get_device('R1')
+    interfaces = zap.get_interfaces(device)
+    members = interfaces['Bundle-Ether500.R1'].members
+    assert [member.interface for member in members] == [device.get_local(link).name
+                                                         for link in ('R1_R2_1', 'R1_R2_2', 'R1_R2_4', 'R1_R2_5')]
+
+    zap.configure_service_policy(interfaces, SimIfMgr(device), {'R1_R2_3.R1': {'output': 'acl'}})
+    intf = interfaces['R1_R2_3.R1'].name
+    output = SimAcl(device)._push_configuration("show policy-map interface %s output" % intf, mode="execute")
+    assert output == '%s output: acl' % intf
@@ -0,0 +1,56 @@
+# **************************************************
+# Copyright (c) 2017 Cisco Systems, Inc.
+# All rights reserved.
+# **************************************************
+
+import pytest
+
+from conftest import ROOT
+
+XUNIT_MODULE = '''
+import sys
+sys.path.insert(0, %r)
+
+from acl_ap_timing import PhaseTimer, instrument
+
+CALLS = []
+TIMER = PhaseTimer()
+
+
+def setup_module(module):
+    CALLS.append(('setup_module', module.__name__))
+
+
+def teardown_module(module):
+    assert CALLS == [('setup_module', module.__name__), ('setup_class', 'TestOne'), ('test', 'TestOne'),
+                     ('teardown_class', 'TestOne')]
+
+
+class Base:
+    pass
+
+
+class TestOne(Base):
+
+    def setup_class(self):
+        CALLS.append(('setup_class', self.__name__))
+
+    def test_one(self):
+        CALLS.append(('test', type(self).__name__))
+
+    def teardown_class(self):
+        CALLS.append(('teardown_class', self.__name__))
+
+
+instrument(globals(), Base, timer=TIMER)
+assert setup_module.__timed__ and TestOne.setup_class.__timed__
+'''
+
+
+@pytest.mark.parametrize('enabled', ['1', '0'])
+def test_instrument_keeps_xunit_arguments(pytester, monkeypatch, enabled):
+    monkeypatch.setenv('ACL_AP_TIMING', enabled)
+    pytester.makepyfile(test_xunit=XUNIT_MODULE % ROOT)
+    result = pytester.runpytest_subprocess('-p', 'no:cacheprovider')
+    result.assert_outcomes(passed=1)
+